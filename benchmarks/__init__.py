@@ -0,0 +1,4 @@
+"""
+Бенчмарки для rational.py и complex.py.
+Запуск из корня репозитория: python -m benchmarks.<имя_модуля>
+"""
@@ -0,0 +1,42 @@
+"""
+Бенчмарк вычислителей Complex: точного ("exact") и машинного ("float").
+
+Сравнивает время __mul__, __truediv__ и __pow__ в обоих режимах на одних и тех же значениях.
+
+Запуск: python -m benchmarks.bench_backend [--number N] [--power K]
+"""
+import argparse
+import timeit
+
+from rational import Rational
+from complex import Complex
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="число операций в одном замере")
+    parser.add_argument("--power", type=int, default=12, help="показатель степени для __pow__")
+    args = parser.parse_args()
+
+    print(f"{'operation':<12} {'exact us/op':>12} {'float us/op':>12} {'speedup':>8}")
+    operands = {
+        backend: (Complex(Rational(3, 7), Rational(-5, 11), backend=backend),
+                  Complex(Rational(2, 9), Rational(4, 13), backend=backend))
+        for backend in ("exact", "float")
+    }
+    operations = {
+        "__mul__": lambda a, b: a * b,
+        "__truediv__": lambda a, b: a / b,
+        "__pow__": lambda a, b: a ** args.power,
+    }
+    for name, operation in operations.items():
+        timings = {}
+        for backend, (a, b) in operands.items():
+            best = min(timeit.repeat(lambda: operation(a, b), number=args.number, repeat=3))
+            timings[backend] = best / args.number * 1e6
+        print(f"{name:<12} {timings['exact']:12.3f} {timings['float']:12.3f} "
+              f"{timings['exact'] / timings['float']:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
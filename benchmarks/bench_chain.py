@@ -0,0 +1,84 @@
+"""
+Бенчмарк цепочек умножений и делений комплексных чисел.
+
+Сравнивает точный путь построения Complex (Rational-компоненты сохраняются как есть)
+с прежним путём, при котором каждый результат проходил круг
+Rational -> float -> Fraction.limit_denominator() -> Rational.
+
+Запуск: python -m benchmarks.bench_chain [--length N] [--repeat R]
+"""
+import argparse
+import timeit
+
+from rational import Rational
+from complex import Complex
+
+
+def legacy_complex(real, imag):
+    """
+    Воспроизводит прежнее построение Complex через float и limit_denominator().
+    :param real (Rational): Действительная часть.
+    :param imag (Rational): Мнимая часть.
+    :return:
+        Complex: Комплексное число, собранное через Rational.from_float.
+    """
+    return Complex(Rational.from_float(float(real), max_denominator=10 ** 6),
+                   Rational.from_float(float(imag), max_denominator=10 ** 6))
+
+
+def chain_exact(values):
+    """
+    Цепочка вида ((v0 * v1) / v2) * v3 ... на текущем точном пути.
+    :param values (list[Complex]): Операнды цепочки.
+    :return:
+        Complex: Результат цепочки.
+    """
+    result = values[0]
+    for i, value in enumerate(values[1:]):
+        result = result * value if i % 2 == 0 else result / value
+    return result
+
+
+def chain_legacy(values):
+    """
+    Та же цепочка, но с прежним округлением каждого промежуточного результата.
+    :param values (list[Complex]): Операнды цепочки.
+    :return:
+        Complex: Результат цепочки.
+    """
+    result = values[0]
+    for i, value in enumerate(values[1:]):
+        result = result * value if i % 2 == 0 else result / value
+        result = legacy_complex(result.real, result.imag)
+    return result
+
+
+def make_operands(length):
+    """
+    Создаёт детерминированный набор операндов с небольшими числителями и знаменателями.
+    :param length (int): Количество операндов.
+    :return:
+        list[Complex]: Операнды цепочки.
+    """
+    return [Complex(Rational(i % 7 + 1, i % 5 + 2), Rational(i % 3 + 1, i % 4 + 3)) for i in range(length)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--length", type=int, default=8, help="длина цепочки")
+    parser.add_argument("--repeat", type=int, default=2000, help="число повторов цепочки")
+    args = parser.parse_args()
+
+    values = make_operands(args.length)
+    operations = (args.length - 1) * args.repeat
+    exact = min(timeit.repeat(lambda: chain_exact(values), number=args.repeat, repeat=3))
+    legacy = min(timeit.repeat(lambda: chain_legacy(values), number=args.repeat, repeat=3))
+
+    print(f"chain length {args.length}, {operations} operations per run")
+    print(f"legacy (float round trip): {legacy / operations * 1e6:8.2f} us/op")
+    print(f"exact:                     {exact / operations * 1e6:8.2f} us/op")
+    print(f"speedup:                   {legacy / exact:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
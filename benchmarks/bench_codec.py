@@ -0,0 +1,102 @@
+"""
+Бенчмарк пропускной способности codec против pickle и JSON.
+
+Для последовательностей Rational и Complex трёх классов размеров (small, 64bit, 1000digit)
+измеряет размер данных и скорость записи и чтения: потоковые Writer/Reader, pickle списка
+объектов и JSON списков [числитель, знаменатель, ...].
+
+Запуск: python -m benchmarks.bench_codec [--count N]
+"""
+import argparse
+import io
+import json
+import pickle
+import time
+
+from rational import Rational
+from complex import Complex
+from codec import Reader, Writer
+from benchmarks.suite import SIZES, make_rationals
+
+
+def make_values(size, count):
+    """
+    :return:
+        dict[str, list]: Последовательности дробей и комплексных чисел.
+    """
+    values = {"rational": [], "complex": []}
+    for seed in range(count):
+        a, b = make_rationals(size, seed)
+        values["rational"].append(a)
+        values["complex"].append(Complex(a, b))
+    return values
+
+
+def codec_dump(values):
+    buffer = io.BytesIO()
+    with Writer(buffer) as writer:
+        writer.write_many(values)
+    return buffer.getvalue()
+
+
+def codec_load(data):
+    return list(Reader(io.BytesIO(data)))
+
+
+def json_dump(values):
+    if isinstance(values[0], Complex):
+        rows = [[c.real.numerator, c.real.denominator, c.imag.numerator, c.imag.denominator] for c in values]
+    else:
+        rows = [[r.numerator, r.denominator] for r in values]
+    return json.dumps(rows).encode()
+
+
+def json_load(data):
+    rows = json.loads(data)
+    if rows and len(rows[0]) == 4:
+        return [Complex(Rational(a, b), Rational(c, d)) for a, b, c, d in rows]
+    return [Rational(n, d) for n, d in rows]
+
+
+FORMATS = {
+    "codec": (codec_dump, codec_load),
+    "pickle": (pickle.dumps, pickle.loads),
+    "json": (json_dump, json_load),
+}
+
+
+def best(function, argument, repeat=3):
+    """
+    :return:
+        tuple[float, object]: Лучшее время, с, и результат вызова.
+    """
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(argument)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="число значений в последовательности")
+    args = parser.parse_args()
+
+    print(f"{'data':<22} {'format':<7} {'bytes':>10} {'dump MB/s':>10} {'load MB/s':>10} "
+          f"{'dump kval/s':>12} {'load kval/s':>12}")
+    for size in SIZES:
+        count = args.count if size != "1000digit" else max(1, args.count // 20)
+        for kind, values in make_values(size, count).items():
+            for name, (dump, load) in FORMATS.items():
+                dump_time, data = best(dump, values)
+                load_time, restored = best(load, data)
+                if restored != values:
+                    raise AssertionError(f"{name} round trip changed {kind}[{size}]")
+                megabytes = len(data) / 1e6
+                print(f"{kind + '[' + size + ']':<22} {name:<7} {len(data):>10} {megabytes / dump_time:10.1f} "
+                      f"{megabytes / load_time:10.1f} {count / dump_time / 1e3:12.1f} {count / load_time / 1e3:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Бенчмарк complex_fft: быстрое преобразование Фурье против ДПФ по определению.
+
+Сравнивает dft (O(n^2) операторами Complex), fft на чистом Python и fft через NumPy,
+а также точную свёртку convolve с прямой свёрткой O(n*m) операторами Complex.
+
+Запуск: python -m benchmarks.bench_fft [--sizes 16 64 256] [--repeat N]
+"""
+import argparse
+import random
+import timeit
+
+from rational import Rational
+from complex import Complex
+from complex_fft import convolve, dft, fft, np
+
+
+def naive_convolve(a, b):
+    """
+    Прямая свёртка по определению.
+    :return:
+        list[Complex]: Свёртка.
+    """
+    result = [Complex(0, 0)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] = result[i + j] + x * y
+    return result
+
+
+def best(function, repeat):
+    """
+    :return:
+        float: Лучшее время одного вызова, мс.
+    """
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 256, 360], help="длины последовательностей")
+    parser.add_argument("--repeat", type=int, default=3, help="число замеров")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'n':>6} {'dft ms':>10} {'fft py ms':>10} {'fft np ms':>10} {'conv naive ms':>14} {'conv ms':>10}")
+    for n in args.sizes:
+        values = [Complex(Rational(rng.randrange(-99, 100), rng.randrange(1, 100)),
+                          Rational(rng.randrange(-99, 100), rng.randrange(1, 100))) for _ in range(n)]
+        timings = [
+            best(lambda: dft(values), args.repeat),
+            best(lambda: fft(values, engine="python"), args.repeat),
+            best(lambda: fft(values, engine="numpy"), args.repeat) if np is not None else float("nan"),
+            best(lambda: naive_convolve(values, values), args.repeat),
+            best(lambda: convolve(values, values), args.repeat),
+        ]
+        print(f"{n:>6} {timings[0]:10.2f} {timings[1]:10.2f} {timings[2]:10.2f} {timings[3]:14.2f} {timings[4]:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
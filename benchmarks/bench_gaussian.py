@@ -0,0 +1,62 @@
+"""
+Бенчмарк GaussianInt и FixedDenomComplex против Complex.
+
+Для значений с целыми частями сравнивает Complex и GaussianInt, для значений с общим
+знаменателем 2^k — Complex и FixedDenomComplex. Измеряется сложение, умножение и
+скалярное произведение (сумма попарных произведений) на одинаковых операндах.
+
+Запуск: python -m benchmarks.bench_gaussian [--count N]
+"""
+import argparse
+import random
+import timeit
+
+from rational import Rational
+from complex import Complex
+from gaussian import FixedDenomComplex, GaussianInt
+
+
+def dot(xs, ys):
+    total = xs[0] * ys[0]
+    for x, y in zip(xs[1:], ys[1:]):
+        total = total + x * y
+    return total
+
+
+def make_operands(count, bits=20, scale_bits=16):
+    """
+    :return:
+        dict[str, tuple[list, list]]: Имя набора -> (Complex, специализированный тип).
+    """
+    rng = random.Random(21)
+    parts = [(rng.randrange(-2 ** bits, 2 ** bits), rng.randrange(-2 ** bits, 2 ** bits)) for _ in range(count)]
+    scale = 1 << scale_bits
+    return {
+        "integer": ([Complex(a, b) for a, b in parts], [GaussianInt(a, b) for a, b in parts]),
+        "dyadic": ([Complex(Rational(a, scale), Rational(b, scale)) for a, b in parts],
+                   [FixedDenomComplex(a, b, scale) for a, b in parts]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="число операндов")
+    args = parser.parse_args()
+
+    cases = {
+        "add": lambda xs: [x + y for x, y in zip(xs, xs[1:])],
+        "mul": lambda xs: [x * y for x, y in zip(xs, xs[1:])],
+        "dot": lambda xs: dot(xs, xs[::-1]),
+    }
+    print(f"{'data':<10} {'op':<5} {'Complex us/op':>14} {'fast us/op':>12} {'speedup':>8}")
+    for name, (exact, fast) in make_operands(args.count).items():
+        if dot(exact, exact[::-1]) != dot(fast, fast[::-1]):
+            raise AssertionError(f"results differ for {name}")
+        for op, function in cases.items():
+            slow = min(timeit.repeat(lambda: function(exact), number=3, repeat=3)) / 3 / args.count
+            quick = min(timeit.repeat(lambda: function(fast), number=3, repeat=3)) / 3 / args.count
+            print(f"{name:<10} {op:<5} {slow * 1e6:14.2f} {quick * 1e6:12.2f} {slow / quick:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Бенчмарк интервальной арифметики против точной и обычной float.
+
+Схемой Горнера вычисляет многочлен с дробными коэффициентами в пакете точек тремя способами:
+точно (ComplexArray), строгими оболочками (ComplexIntervalArray) и в complex128 без гарантий.
+Печатает время и наибольшую ширину оболочки результата.
+
+Запуск: python -m benchmarks.bench_interval [--count N] [--degree D]
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from rational import Rational
+from complex import Complex
+from complex_array import ComplexArray
+from interval import ComplexIntervalArray
+
+
+def horner(coefficients, points):
+    result = points * 0 + coefficients[-1]
+    for c in reversed(coefficients[:-1]):
+        result = result * points + c
+    return result
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="число точек")
+    parser.add_argument("--degree", type=int, default=12, help="степень многочлена")
+    args = parser.parse_args()
+
+    rng = random.Random(23)
+    coefficients = [Complex(Rational(rng.randrange(-99, 99), rng.randrange(1, 99)),
+                            Rational(rng.randrange(-99, 99), rng.randrange(1, 99))) for _ in range(args.degree + 1)]
+    points = [Complex(Rational(rng.randrange(-999, 999), 1000), Rational(rng.randrange(-999, 999), 1000))
+              for _ in range(args.count)]
+
+    exact_time, exact = timed(lambda: horner(coefficients, ComplexArray(points)))
+    interval_time, enclosure = timed(lambda: horner(coefficients, ComplexIntervalArray(points)))
+    floats = [complex(float(c.real), float(c.imag)) for c in coefficients]
+    float_time, approximate = timed(lambda: horner(floats, ComplexArray(points).to_numpy()))
+
+    width = max(np.max(enclosure.real[1] - enclosure.real[0]), np.max(enclosure.imag[1] - enclosure.imag[0]))
+    error = np.max(np.abs(approximate - exact.to_numpy()))
+    print(f"{args.count} points, degree {args.degree}")
+    print(f"exact ComplexArray:    {exact_time * 1e3:9.2f} ms")
+    print(f"ComplexIntervalArray:  {interval_time * 1e3:9.2f} ms  max width {width:.3e}")
+    print(f"complex128:            {float_time * 1e3:9.2f} ms  max error {error:.3e} (uncertified)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Бенчмарк памяти и скорости для Rational и Complex.
+
+Печатает число байт на объект (по данным tracemalloc) и число операций в секунду.
+С флагом --baseline REV те же измерения повторяются для rational.py и complex.py
+из указанной ревизии git, что позволяет сравнить раскладку «до» и «после».
+
+Запуск: python -m benchmarks.bench_memory [--count N] [--baseline REV]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bytes_per_object(factory, count):
+    """
+    Оценивает объём памяти, занимаемый одним объектом.
+    :param factory (callable): Функция, создающая объект по индексу.
+    :param count (int): Количество создаваемых объектов.
+    :return:
+        float: Среднее число байт на объект (без учёта списка-контейнера).
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    container = sys.getsizeof(objects)
+    return (after - before - container) / count
+
+
+def ops_per_second(statement, number):
+    """
+    Измеряет пропускную способность операции.
+    :param statement (callable): Измеряемая операция.
+    :param number (int): Число повторов в одном замере.
+    :return:
+        float: Число операций в секунду (лучший из трёх замеров).
+    """
+    return number / min(timeit.repeat(statement, number=number, repeat=3))
+
+
+def measure(count):
+    """
+    Выполняет все замеры для модулей, найденных на sys.path.
+    :param count (int): Количество объектов для оценки памяти.
+    :return:
+        dict: Результаты замеров.
+    """
+    from rational import Rational
+    from complex import Complex
+
+    # числители больше 256, чтобы не попадать в кеш малых int
+    r1, r2 = Rational(1001, 2003), Rational(3001, 4007)
+    c1, c2 = Complex(r1, r2), Complex(r2, r1)
+    return {
+        "rational_bytes": bytes_per_object(lambda i: Rational(i + 1000, 1000003), count),
+        "complex_bytes": bytes_per_object(
+            lambda i: Complex(Rational(i + 1000, 1000003), Rational(i + 2000, 1000003)), count),
+        "rational_add": ops_per_second(lambda: r1 + r2, 20000),
+        "rational_mul": ops_per_second(lambda: r1 * r2, 20000),
+        "complex_add": ops_per_second(lambda: c1 + c2, 5000),
+        "complex_mul": ops_per_second(lambda: c1 * c2, 5000),
+    }
+
+
+def measure_revision(revision, count):
+    """
+    Выполняет замеры для rational.py и complex.py из указанной ревизии git.
+    :param revision (str): Ревизия git.
+    :param count (int): Количество объектов для оценки памяти.
+    :return:
+        dict: Результаты замеров.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("rational.py", "complex.py"):
+            source = subprocess.run(["git", "show", f"{revision}:{name}"], cwd=ROOT,
+                                    check=True, capture_output=True).stdout
+            with open(os.path.join(directory, name), "wb") as file:
+                file.write(source)
+        code = ("import json, sys; sys.path.insert(0, sys.argv[1]); "
+                "from benchmarks.bench_memory import measure; "
+                "print(json.dumps(measure(int(sys.argv[2]))))")
+        output = subprocess.run([sys.executable, "-c", code, directory, str(count)], cwd=ROOT,
+                                check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def report(label, results):
+    print(f"{label}:")
+    print(f"  Rational: {results['rational_bytes']:8.1f} bytes/object")
+    print(f"  Complex:  {results['complex_bytes']:8.1f} bytes/object (with parts)")
+    for key in ("rational_add", "rational_mul", "complex_add", "complex_mul"):
+        print(f"  {key:<12} {results[key]:12.0f} ops/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000, help="число объектов для оценки памяти")
+    parser.add_argument("--baseline", help="ревизия git для сравнения, например HEAD~1")
+    args = parser.parse_args()
+
+    current = measure(args.count)
+    if args.baseline:
+        report(f"before ({args.baseline})", measure_revision(args.baseline, args.count))
+    report("after (working tree)", current)
+
+
+if __name__ == "__main__":
+    main()
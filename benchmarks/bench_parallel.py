@@ -0,0 +1,69 @@
+"""
+Бенчмарк масштабирования модуля parallel на 1..N процессах.
+
+Для pmap (тяжёлая поэлементная работа: точное возведение в степень) и psum (сумма длинной
+последовательности дробей) печатает время, ускорение относительно одного процесса и
+эффективность масштабирования T1 / (k * Tk). Пул создаётся один раз на каждое k и в замер
+не входит.
+
+Запуск: python -m benchmarks.bench_parallel [--size N] [--max-workers K]
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rational import Rational
+from complex import Complex
+from parallel import pmap, psum
+
+
+def power(value):
+    return value ** 24
+
+
+def measure(function, repeat=3):
+    """
+    :return:
+        float: Лучшее время вызова, с.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=4000, help="число элементов")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="наибольшее число процессов")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    complexes = [Complex(Rational(rng.randrange(-999, 1000), rng.randrange(1, 1000)),
+                         Rational(rng.randrange(-999, 1000), rng.randrange(1, 1000))) for _ in range(args.size)]
+    rationals = [Rational(rng.randrange(-10 ** 12, 10 ** 12), rng.randrange(1, 1000)) for _ in range(args.size * 10)]
+
+    cases = {
+        "pmap(z ** 24)": lambda workers, pool: pmap(power, complexes, workers=workers, executor=pool),
+        "psum(rational)": lambda workers, pool: psum(rationals, workers=workers, executor=pool),
+    }
+    print(f"{'case':<16} {'workers':>7} {'time s':>9} {'speedup':>8} {'efficiency':>10}")
+    for name, case in cases.items():
+        baseline = None
+        for workers in range(1, args.max_workers + 1):
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # первый вызов прогревает процессы пула
+                case(workers, pool)
+                elapsed = measure(lambda: case(workers, pool))
+            if baseline is None:
+                baseline = elapsed
+            speedup = baseline / elapsed
+            print(f"{name:<16} {workers:>7} {elapsed:9.3f} {speedup:7.2f}x {speedup / workers:9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Бенчмарк разбора текстовых записей: Rational.parse, Complex.parse и iter_parse.
+
+Для каждого формата записи (дробь, десятичная, алгебраическая запись "a/b + c/di",
+вывод __str__ и __repr__) печатает число разобранных значений в секунду; iter_parse
+читает тот же текст из файла в памяти блоками.
+
+Rational.parse разбирает 250-370 тыс. записей в секунду на одном ядре. Complex.parse разбирает
+130-190 тыс., хотя у частых записей есть быстрый путь. Это ниже цели «несколько сотен тысяч
+в секунду»: одно сопоставление регулярного выражения и сборка двух дробей (по gcd на часть)
+уже занимают около 5 мкс на запись.
+
+Запуск: python -m benchmarks.bench_parse [--count N]
+"""
+import argparse
+import io
+import random
+import time
+
+from rational import Rational
+from complex import Complex
+from parsing import iter_parse
+
+
+def make_lines(count):
+    """
+    :return:
+        dict[str, tuple[str, list[str]]]: Формат -> (вид разбора, строки).
+    """
+    rng = random.Random(0)
+
+    def fraction():
+        return Rational(rng.randrange(-10 ** 6, 10 ** 6), rng.randrange(1, 10 ** 6))
+
+    values = [Complex(fraction(), fraction()) for _ in range(count)]
+    return {
+        "fraction": ("rational", [f"{c.real.numerator}/{c.real.denominator}" for c in values]),
+        "decimal": ("rational", [f"{rng.randrange(-10 ** 9, 10 ** 9) / 1000:.3f}" for _ in range(count)]),
+        "a/b + c/di": ("complex", [f"{c.real.numerator}/{c.real.denominator} + "
+                                   f"{abs(c.imag.numerator)}/{c.imag.denominator}i".replace(
+                                       "+ ", "- " if c.imag.numerator < 0 else "+ ") for c in values]),
+        "__str__": ("complex", [str(c) for c in values]),
+        "__repr__": ("complex", [repr(c) for c in values]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000, help="число записей каждого формата")
+    args = parser.parse_args()
+
+    parsers = {"rational": Rational.parse, "complex": Complex.parse}
+    print(f"{'format':<12} {'parse kval/s':>13} {'iter_parse kval/s':>18}")
+    for name, (kind, lines) in make_lines(args.count).items():
+        parse = parsers[kind]
+        start = time.perf_counter()
+        for line in lines:
+            parse(line)
+        direct = len(lines) / (time.perf_counter() - start)
+        text = "\n".join(lines)
+        start = time.perf_counter()
+        parsed = sum(1 for _ in iter_parse(io.StringIO(text), kind=kind))
+        streamed = parsed / (time.perf_counter() - start)
+        print(f"{name:<12} {direct / 1e3:13.1f} {streamed / 1e3:18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Нагрузочный тест сервиса вычислений (service.ComputeServer).
+
+Запускает сервер с пулом процессов и несколько клиентов, каждый из которых последовательно
+отправляет запросы sum над пакетами случайных Complex. Печатает p50/p99 задержки и пропускную
+способность; с --no-coalesce каждый запрос отправляется в пул отдельной задачей.
+
+Запуск: python -m benchmarks.bench_service [--clients C] [--requests R] [--batch B] [--workers W] [--tcp]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from rational import Rational
+from complex import Complex
+from service import ComputeClient, ComputeServer
+
+
+async def run_client(address, batches, latencies):
+    if isinstance(address, tuple):
+        client = await ComputeClient.connect(host=address[0], port=address[1])
+    else:
+        client = await ComputeClient.connect(path=address)
+    async with client:
+        for batch in batches:
+            start = time.perf_counter()
+            await client.sum(batch)
+            latencies.append(time.perf_counter() - start)
+
+
+async def run(args, path):
+    rng = random.Random(25)
+    workload = [[[Complex(Rational(rng.randrange(-999, 999), rng.randrange(1, 999)),
+                          Rational(rng.randrange(-999, 999), rng.randrange(1, 999))) for _ in range(args.batch)]
+                 for _ in range(args.requests)] for _ in range(args.clients)]
+    server = ComputeServer(path=None if args.tcp else path, workers=args.workers,
+                           coalesce_delay=0 if args.no_coalesce else 0.002)
+    async with server:
+        # прогрев пула процессов
+        await run_client(server.address, workload[0][:1], [])
+        latencies = []
+        start = time.perf_counter()
+        await asyncio.gather(*(run_client(server.address, batches, latencies) for batches in workload))
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    total = args.clients * args.requests
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{args.clients} clients x {args.requests} requests x {args.batch} values, "
+          f"{'tcp' if args.tcp else 'unix'} socket, {server.stats['batches']} pool jobs")
+    print(f"latency p50 {p50 * 1e3:8.2f} ms  p99 {p99 * 1e3:8.2f} ms")
+    print(f"throughput  {total / elapsed:8.0f} req/s  {total * args.batch / elapsed:10.0f} values/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16, help="число клиентов")
+    parser.add_argument("--requests", type=int, default=200, help="запросов на клиента")
+    parser.add_argument("--batch", type=int, default=16, help="значений в запросе")
+    parser.add_argument("--workers", type=int, default=None, help="процессов пула")
+    parser.add_argument("--tcp", action="store_true", help="TCP вместо Unix-сокета")
+    parser.add_argument("--no-coalesce", action="store_true", help="не объединять запросы")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args, os.path.join(directory, "compute.sock")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Набор бенчмарков горячих путей rational.py и complex.py.
+
+Измеряет создание объектов, Rational.from_float, все арифметические операторы, reduce,
+__pow__, inverse, abs/arg и __str__ на трёх классах размеров операндов:
+small (малые целые), 64bit и 1000digit. Результаты (нс на операцию) можно сохранить
+в JSON и сравнить с сохранённым эталоном; при замедлении больше порога
+скрипт завершается с кодом 1.
+
+Запуск:
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --baseline baseline.json --threshold 0.10
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+
+from rational import Rational
+from complex import Complex
+
+SIZES = ("small", "64bit", "1000digit")
+
+
+def make_rationals(size, seed=0):
+    """
+    Создаёт пару дробей заданного класса размеров.
+    :param size (str): Класс размеров из SIZES.
+    :param seed (int): Зерно генератора, чтобы операнды были одинаковыми от запуска к запуску.
+    :return:
+        tuple[Rational, Rational]: Два операнда.
+    """
+    rng = random.Random(f"{size}/{seed}")
+    if size == "small":
+        bound = 100
+    elif size == "64bit":
+        bound = 2 ** 63
+    else:
+        bound = 10 ** 1000
+    return tuple(Rational(rng.randrange(bound // 2, bound), rng.randrange(bound // 2, bound)) for _ in range(2))
+
+
+def make_cases():
+    """
+    Собирает все измеряемые случаи.
+    :return:
+        dict[str, callable]: Имя случая -> функция без аргументов, выполняющая одну операцию.
+    """
+    cases = {}
+    for size in SIZES:
+        r1, r2 = make_rationals(size)
+        n, d = r1.numerator, r1.denominator
+        r3, r4 = make_rationals(size, seed=1)
+        c1, c2 = Complex(r1, r3), Complex(r2, r4)
+        k = 12345
+        cases.update({
+            f"rational.init[{size}]": lambda n=n, d=d: Rational(n, d),
+            f"rational.add[{size}]": lambda a=r1, b=r2: a + b,
+            f"rational.add_int[{size}]": lambda a=r1: a + k,
+            f"rational.sub[{size}]": lambda a=r1, b=r2: a - b,
+            f"rational.mul[{size}]": lambda a=r1, b=r2: a * b,
+            f"rational.mul_int[{size}]": lambda a=r1: a * k,
+            f"rational.truediv[{size}]": lambda a=r1, b=r2: a / b,
+            f"rational.truediv_int[{size}]": lambda a=r1: a / k,
+            f"rational.eq[{size}]": lambda a=r1, b=r2: a == b,
+            f"rational.neg[{size}]": lambda a=r1: -a,
+            f"rational.abs[{size}]": lambda a=r1: abs(a),
+            f"rational.pow[{size}]": lambda a=r1: a ** 3,
+            f"rational.pow_negative[{size}]": lambda a=r1: a ** -3,
+            f"rational.reduce[{size}]": lambda a=r1: a.reduce(),
+            f"rational.hash[{size}]": lambda a=r1: hash(a),
+            f"rational.float[{size}]": lambda a=r1: float(a),
+            f"rational.str[{size}]": lambda a=r1: str(a),
+            f"complex.init[{size}]": lambda a=r1, b=r3: Complex(a, b),
+            f"complex.add[{size}]": lambda a=c1, b=c2: a + b,
+            f"complex.sub[{size}]": lambda a=c1, b=c2: a - b,
+            f"complex.mul[{size}]": lambda a=c1, b=c2: a * b,
+            f"complex.mul_scalar[{size}]": lambda a=c1, b=r2: a * b,
+            f"complex.truediv[{size}]": lambda a=c1, b=c2: a / b,
+            f"complex.eq[{size}]": lambda a=c1, b=c2: a == b,
+            f"complex.neg[{size}]": lambda a=c1: -a,
+            f"complex.pow[{size}]": lambda a=c1: a ** 3,
+            f"complex.inverse[{size}]": lambda a=c1: a.inverse(),
+            f"complex.abs[{size}]": lambda a=c1: a.abs(),
+            f"complex.arg[{size}]": lambda a=c1: a.arg(),
+            f"complex.str[{size}]": lambda a=c1: str(a),
+        })
+    cases["rational.from_float[simple]"] = lambda: Rational.from_float(0.375)
+    cases["rational.from_float[irrational]"] = lambda: Rational.from_float(0.1)
+    cases["complex.init_float[simple]"] = lambda: Complex(0.375, -1.5)
+    return cases
+
+
+def measure(function, min_time, repeat):
+    """
+    Измеряет время одной операции.
+    Число повторов подбирается так, чтобы один замер длился не меньше min_time секунд.
+    :param function (callable): Измеряемая операция.
+    :param min_time (float): Минимальная длительность одного замера, с.
+    :param repeat (int): Число замеров.
+    :return:
+        float: Лучшее время одной операции, нс.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = min([elapsed] + timer.repeat(repeat=repeat - 1, number=number))
+    return best / number * 1e9
+
+
+def revision():
+    """
+    :return:
+        str | None: Текущая ревизия git, если доступна.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(pattern, min_time, repeat):
+    """
+    Выполняет все случаи, имя которых содержит pattern.
+    :return:
+        dict: Результаты в формате JSON-отчёта.
+    """
+    results = {}
+    for name, function in make_cases().items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure(function, min_time, repeat)
+        print(f"{name:<40} {results[name]:14.1f} ns/op", flush=True)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "revision": revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "unit": "ns/op",
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Сравнивает результаты с эталоном.
+    :param current (dict): Текущий отчёт.
+    :param baseline (dict): Эталонный отчёт.
+    :param threshold (float): Допустимое относительное замедление (0.10 = 10%).
+    :return:
+        list[str]: Имена случаев, замедлившихся больше порога.
+    """
+    regressions = []
+    print()
+    print(f"{'case':<40} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, value in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"{name:<40} {'-':>12} {value:12.1f} {'new':>7}")
+            continue
+        ratio = value / reference
+        mark = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            mark = "  REGRESSION"
+        print(f"{name:<40} {reference:12.1f} {value:12.1f} {ratio:7.2f}{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="файл для сохранения результатов в JSON")
+    parser.add_argument("--baseline", help="эталонный JSON для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="допустимое относительное замедление (по умолчанию 0.10)")
+    parser.add_argument("--filter", default="", help="измерять только случаи, содержащие подстроку")
+    parser.add_argument("--min-time", type=float, default=0.05, help="минимальная длительность замера, с")
+    parser.add_argument("--repeat", type=int, default=3, help="число замеров на случай")
+    args = parser.parse_args()
+
+    report = run(args.filter, args.min_time, args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nno regressions above {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
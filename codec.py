@@ -0,0 +1,394 @@
+import re
+import struct
+from functools import lru_cache
+from math import gcd
+
+from rational import Rational
+from complex import Complex
+
+# начало каждого сообщения и потока: сигнатура и номер версии формата
+MAGIC = b"RCX"
+FORMAT_VERSION = 1
+
+# теги записей
+TAG_RATIONAL_VARINT = 0x01
+TAG_RATIONAL_INT64 = 0x02
+TAG_COMPLEX_VARINT = 0x03
+TAG_COMPLEX_INT64 = 0x04
+TAG_COMPLEX_FLOAT = 0x05
+
+# размер блока, которым Reader читает поток
+READ_CHUNK_SIZE = 1 << 16
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_HEADER = MAGIC + bytes([FORMAT_VERSION])
+_PACK_2 = struct.Struct("<qq")
+_PACK_4 = struct.Struct("<qqqq")
+_PACK_FLOAT = struct.Struct("<dd")
+
+# varint из не более чем _LEAF_GROUPS групп записывается и разбирается простым циклом
+_LEAF_GROUPS = 8
+_SHORT_VARINT_LIMIT = 1 << (7 * _LEAF_GROUPS)
+_VARINT = re.compile(rb"[\x80-\xff]*[\x00-\x7f]")
+_LOW_BITS = bytes(byte & 0x7F for byte in range(256))
+_HIGH_BIT = bytes(byte | 0x80 for byte in range(256))
+
+
+class _NeedMore(Exception):
+    """
+    Запись обрывается на конце буфера (Reader дочитывает поток и повторяет разбор).
+    """
+
+
+def _fits_int64(*values):
+    return all(_INT64_MIN <= value <= _INT64_MAX for value in values)
+
+
+def _write_varint(out, value):
+    """
+    Записывает неотрицательное целое в формате LEB128: по 7 бит на байт, старший бит — признак продолжения.
+    :param out (bytearray): Буфер.
+    :param value (int): Число.
+    """
+    if value >= _SHORT_VARINT_LIMIT:
+        count = (value.bit_length() + 6) // 7
+        data = _spread(value, count)
+        out += data[:-1].translate(_HIGH_BIT)
+        out += data[-1:]
+        return
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+@lru_cache(maxsize=32)
+def _masks(size):
+    """
+    Маски для раздвигания 7-битных групп по байтам.
+    Для блоков из block групп (block = size, size/2, ..., 2), расположенных с периодом block байт,
+    возвращает маску младших половин и маски старших половин до и после сдвига на block/2 бит.
+    :param size (int): Число групп (степень двойки).
+    :return:
+        list[tuple[int, int, int, int]]: (block, младшие, старшие до сдвига, старшие после сдвига).
+    """
+    masks = []
+    block = size
+    while block >= 2:
+        half_bits = 7 * block // 2
+        periods = size // block
+        low = ((1 << half_bits) - 1).to_bytes(block, "little") * periods
+        high_before = (((1 << half_bits) - 1) << half_bits).to_bytes(block, "little") * periods
+        high_after = (((1 << half_bits) - 1) << (4 * block)).to_bytes(block, "little") * periods
+        masks.append((block, int.from_bytes(low, "little"), int.from_bytes(high_before, "little"),
+                      int.from_bytes(high_after, "little")))
+        block //= 2
+    return masks
+
+
+def _spread(value, count):
+    """
+    Раскладывает число на 7-битные группы, по одной в байт, за log2(count) проходов масками
+    (каждый проход — несколько операций над длинным целым, а не цикл по группам).
+    :return:
+        bytes: count байт, младшие группы впереди.
+    """
+    size = 1 << (count - 1).bit_length()
+    for block, low, high, _ in _masks(size):
+        value = (value & low) | ((value & high) << (block // 2))
+    return value.to_bytes(size, "little")[:count]
+
+
+def _gather(data):
+    """
+    Обратная к _spread операция.
+    :param data (bytes): 7-битные группы, по одной в байт.
+    :return:
+        int: Число.
+    """
+    size = 1 << (len(data) - 1).bit_length()
+    value = int.from_bytes(data, "little")
+    for block, low, _, high in reversed(_masks(size)):
+        value = (value & low) | ((value & high) >> (block // 2))
+    return value
+
+
+def _write_signed(out, value):
+    """
+    Записывает целое со знаком: зигзаг-кодирование (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...) и LEB128.
+    """
+    _write_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+
+def _read_varint(data, pos):
+    """
+    :param data (bytes): Буфер.
+    :param pos (int): Позиция начала числа.
+    :return:
+        tuple[int, int]: Число и позиция после него.
+    """
+    result = 0
+    size = len(data)
+    for shift in range(0, 7 * _LEAF_GROUPS, 7):
+        if pos >= size:
+            raise _NeedMore
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+    # длинное число: конец ищется регулярным выражением, группы собираются масками
+    start = pos - _LEAF_GROUPS
+    match = _VARINT.match(data, start)
+    if match is None:
+        raise _NeedMore
+    return _gather(bytes(data[start:match.end()]).translate(_LOW_BITS)), match.end()
+
+
+def _read_signed(data, pos):
+    value, pos = _read_varint(data, pos)
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+
+
+def _encode(out, value):
+    """
+    Дописывает запись одного значения в буфер.
+    Если числитель и знаменатель помещаются в int64, используется запись фиксированной ширины
+    (быстрее разбирается через struct), иначе — зигзаг-кодированные LEB128.
+    :param out (bytearray): Буфер.
+    :param value (Rational | Complex | int): Значение.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = Rational(value, 1)
+    if isinstance(value, Rational):
+        n, d = value._numerator, value._denominator
+        if _fits_int64(n, d):
+            out.append(TAG_RATIONAL_INT64)
+            out += _PACK_2.pack(n, d)
+        else:
+            out.append(TAG_RATIONAL_VARINT)
+            _write_signed(out, n)
+            _write_varint(out, d)
+    elif isinstance(value, Complex):
+        real, imag = value._real, value._imag
+        if real.__class__ is float:
+            out.append(TAG_COMPLEX_FLOAT)
+            out += _PACK_FLOAT.pack(real, imag)
+            return
+        parts = (real._numerator, real._denominator, imag._numerator, imag._denominator)
+        if _fits_int64(*parts):
+            out.append(TAG_COMPLEX_INT64)
+            out += _PACK_4.pack(*parts)
+        else:
+            out.append(TAG_COMPLEX_VARINT)
+            _write_signed(out, parts[0])
+            _write_varint(out, parts[1])
+            _write_signed(out, parts[2])
+            _write_varint(out, parts[3])
+    else:
+        raise TypeError("value must be Rational, Complex or int")
+
+
+def _decode(data, pos):
+    """
+    Разбирает одну запись.
+    Дроби из потока только проверяются на несократимость и не сокращаются повторно.
+    :param data (bytes): Буфер.
+    :param pos (int): Позиция начала записи.
+    :return:
+        tuple[Rational | Complex, int]: Значение и позиция после записи.
+    """
+    size = len(data)
+    if pos >= size:
+        raise _NeedMore
+    tag = data[pos]
+    pos += 1
+    if tag == TAG_RATIONAL_INT64:
+        if pos + 16 > size:
+            raise _NeedMore
+        n, d = _PACK_2.unpack_from(data, pos)
+        return _checked(n, d), pos + 16
+    elif tag == TAG_COMPLEX_INT64:
+        if pos + 32 > size:
+            raise _NeedMore
+        a, b, c, d = _PACK_4.unpack_from(data, pos)
+        return Complex._from_parts(_checked(a, b), _checked(c, d)), pos + 32
+    elif tag == TAG_COMPLEX_FLOAT:
+        if pos + 16 > size:
+            raise _NeedMore
+        real, imag = _PACK_FLOAT.unpack_from(data, pos)
+        return Complex._from_parts(real, imag), pos + 16
+    elif tag == TAG_RATIONAL_VARINT:
+        n, pos = _read_signed(data, pos)
+        d, pos = _read_varint(data, pos)
+        return _checked(n, d), pos
+    elif tag == TAG_COMPLEX_VARINT:
+        a, pos = _read_signed(data, pos)
+        b, pos = _read_varint(data, pos)
+        c, pos = _read_signed(data, pos)
+        d, pos = _read_varint(data, pos)
+        return Complex._from_parts(_checked(a, b), _checked(c, d)), pos
+    raise ValueError(f"Unknown record tag: {tag:#04x}")
+
+
+def _checked(n, d):
+    """
+    :return:
+        Rational: Дробь из потока (неположительный знаменатель или сократимая дробь
+        означают повреждённые данные: поток может прийти от недоверенного источника).
+    """
+    if d <= 0:
+        raise ValueError("Corrupted data: denominator must be positive")
+    if gcd(n, d) != 1:
+        raise ValueError("Corrupted data: fraction is not reduced")
+    return Rational._from_reduced(n, d)
+
+
+def _check_header(data):
+    """
+    Проверяет сигнатуру и версию формата.
+    :return:
+        int: Позиция после заголовка.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a Rational/Complex stream")
+    if len(data) <= len(MAGIC):
+        raise ValueError("Truncated data")
+    version = data[len(MAGIC)]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version: {version}")
+    return len(_HEADER)
+
+
+def dumps(value) -> bytes:
+    """
+    Функция сериализации одного значения.
+    :param value (Rational | Complex | int): Значение.
+    :return:
+        bytes: Заголовок формата и одна запись.
+    """
+    out = bytearray(_HEADER)
+    _encode(out, value)
+    return bytes(out)
+
+
+def loads(data):
+    """
+    Функция десериализации одного значения, записанного dumps.
+    Исключения:
+        ValueError: Если данные повреждены, обрезаны или записаны другой версией формата.
+    :param data (bytes): Данные.
+    :return:
+        Rational | Complex: Значение.
+    """
+    pos = _check_header(data)
+    try:
+        value, pos = _decode(data, pos)
+    except _NeedMore:
+        raise ValueError("Truncated data") from None
+    if pos != len(data):
+        raise ValueError("Trailing data after value")
+    return value
+
+
+class Writer:
+    """
+    Потоковая запись последовательности значений в двоичный файл.
+    Заголовок записывается один раз, затем записи идут подряд; значения копятся во внутреннем
+    буфере и сбрасываются в файл блоками.
+    """
+    __slots__ = ('_file', '_buffer', '_buffer_size')
+
+    def __init__(self, fileobj, buffer_size: int = READ_CHUNK_SIZE):
+        """
+        :param fileobj: Файл, открытый на запись в двоичном режиме.
+        :param buffer_size (int): Размер буфера, после которого данные сбрасываются в файл.
+        """
+        self._file = fileobj
+        self._buffer = bytearray(_HEADER)
+        self._buffer_size = buffer_size
+
+    def write(self, value):
+        """
+        :param value (Rational | Complex | int): Значение.
+        """
+        _encode(self._buffer, value)
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def write_many(self, values):
+        """
+        :param values (iterable[Rational | Complex | int]): Значения.
+        """
+        for value in values:
+            self.write(value)
+
+    def flush(self):
+        """
+        Сбрасывает накопленные записи в файл.
+        """
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.flush()
+
+
+class Reader:
+    """
+    Потоковое чтение значений, записанных Writer.
+    Файл читается блоками по READ_CHUNK_SIZE байт; запись, разрезанная границей блока,
+    разбирается после дочитывания.
+    """
+    __slots__ = ('_file', '_data', '_pos', '_eof')
+
+    def __init__(self, fileobj):
+        """
+        :param fileobj: Файл, открытый на чтение в двоичном режиме.
+        """
+        self._file = fileobj
+        self._data = b""
+        self._pos = 0
+        self._eof = False
+        while len(self._data) < len(_HEADER) and self._fill():
+            pass
+        self._pos = _check_header(self._data)
+
+    def _fill(self):
+        """
+        Дочитывает очередной блок, отбрасывая уже разобранную часть буфера.
+        :return:
+            bool: False, если файл закончился.
+        """
+        chunk = self._file.read(READ_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._data = self._data[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """
+        Исключения:
+            ValueError: Если поток обрывается посреди записи.
+        :return:
+            Rational | Complex: Очередное значение.
+        """
+        while True:
+            try:
+                value, self._pos = _decode(self._data, self._pos)
+                return value
+            except _NeedMore:
+                if not self._fill():
+                    if self._pos < len(self._data):
+                        raise ValueError("Truncated data") from None
+                    raise StopIteration from None
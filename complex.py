@@ -1,5 +1,244 @@
-from rational import Rational
-from math import atan2, sqrt
+from rational import Rational, RationalAccumulator, _NUMBER, _TERM, _term_ratio
+from contextlib import contextmanager
+from fractions import Fraction
+from itertools import chain
+from functools import lru_cache
+from math import atan2, cos, gcd, isfinite, pi, sin, sqrt
+import os
+import re
+import sys
+import rational
+
+_HASH_HALF = 1 << (sys.hash_info.width - 1)
+
+# Умножение Гаусса выгодно, пока общие знаменатели не длиннее числителей
+# или не превышают этого числа бит
+_GAUSS_DENOMINATOR_BITS = 512
+
+# число оснований, для которых хранится лестница квадратов в Complex.__pow__
+POWER_CACHE_SIZE = 128
+# число степеней n, для которых хранится таблица корней из единицы
+ROOTS_CACHE_SIZE = 64
+
+BACKENDS = ("exact", "float")
+_default_backend = "exact"
+
+# дробь без знака: мнимая часть после "+"/"-" в записи "a + bi"
+_UNSIGNED_TERM = rf"(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?(?:\s*/\s*{_NUMBER})?"
+_COMPLEX_RE = re.compile(
+    rf"\s*(?:Complex\(\s*(?P<cr>{_TERM})\s*,\s*(?P<ci>{_TERM})\s*"
+    r"(?:,\s*backend\s*=\s*['\"](?P<backend>exact|float)['\"]\s*)?\)"
+    rf"|(?P<open>\()?\s*(?:(?P<real>{_TERM})(?:\s*(?P<sign>[+-])\s*(?P<imag>{_UNSIGNED_TERM})?\s*[ij])?"
+    rf"|(?P<only>[+-]?)\s*(?P<coefficient>{_UNSIGNED_TERM})?\s*[ij])\s*(?(open)\)))\s*")
+
+# быстрый путь Complex.parse для самых частых записей "a/b + c/di" и "(0.5 - 0.25i)":
+# части — целые или десятичные без порядка, с необязательным целым знаменателем
+_FAST_PART = r"(\d+)(?:\.(\d*))?(?:\s*/\s*(\d+))?"
+_FAST_COMPLEX_RE = re.compile(
+    rf"\s*(\()?\s*([+-]?){_FAST_PART}\s*([+-])\s*{_FAST_PART}\s*[ij]\s*(?(1)\))\s*")
+_FAST_REPR_RE = re.compile(rf"\s*Complex\(\s*([+-]?){_FAST_PART}\s*,\s*([+-]?){_FAST_PART}\s*\)\s*")
+
+
+def _fast_rational(negative, whole, fraction, denominator):
+    """
+    Собирает дробь из групп _FAST_PART с одним вызовом gcd, без разбора строки заново.
+    :return:
+        Rational: Точное значение.
+    """
+    if fraction:
+        n, d = int(whole + fraction), 10 ** len(fraction)
+    else:
+        n, d = int(whole), 1
+    if denominator is not None:
+        d *= int(denominator)
+        if d == 0:
+            raise ValueError("Denominator cannot be zero.")
+    if negative:
+        n = -n
+    g = gcd(n, d)
+    if g != 1:
+        n //= g
+        d //= g
+    return Rational._from_reduced(n, d)
+
+
+def _to_rational(value):
+    """
+    Приводит число к Rational без потери точности.
+    Rational возвращается как есть, int оборачивается без промежуточного float,
+    и только float проходит через Rational.from_float.
+    :param value (Rational | int | float): Исходное число.
+    :return:
+        Rational: Точное представление числа.
+    """
+    if isinstance(value, Rational):
+        return value
+    elif isinstance(value, int):
+        return Rational(value, 1)
+    elif isinstance(value, float):
+        return Rational.from_float(value)
+    else:
+        raise TypeError("value must be Rational, int or float")
+
+
+def _parse_rational(text):
+    """
+    :param text (str): Запись дроби, соответствующая _TERM.
+    :return:
+        Rational: Точное значение.
+    """
+    return Rational(*_term_ratio(text))
+
+
+def _parse_float(text):
+    """
+    :param text (str): Запись дроби, соответствующая _TERM.
+    :return:
+        float: Значение во float.
+    """
+    if "/" in text:
+        return float(_parse_rational(text))
+    return float(text)
+
+
+def _to_float(value):
+    """
+    Приводит число к float для вычислений в режиме float.
+    :param value (Rational | int | float): Исходное число.
+    :return:
+        float: Машинное представление числа.
+    """
+    if isinstance(value, (Rational, int, float)):
+        return float(value)
+    else:
+        raise TypeError("value must be Rational, int or float")
+
+
+def _promote(value):
+    """
+    Приводит число другого точного типа (например, gaussian.GaussianInt) к Complex.
+    Такие типы предоставляют метод to_complex; так они участвуют в операторах Complex
+    без отражённых операторов.
+    :param value: Операнд.
+    :return:
+        Complex: Точное комплексное число.
+    """
+    to_complex = getattr(value, "to_complex", None)
+    if to_complex is None:
+        raise TypeError("Unsupported operand type")
+    return to_complex()
+
+
+def _parts_equal(a, b):
+    """
+    Точно сравнивает части комплексных чисел (Rational или float).
+    float переводится в Rational без потерь, поэтому равные части всегда имеют равный хеш.
+    :return:
+        bool: True, если части равны.
+    """
+    if a.__class__ is float:
+        if b.__class__ is float:
+            return a == b
+        a, b = b, a
+    if b.__class__ is float:
+        if not isfinite(b):
+            return False
+        b = Rational.from_float(b)
+    return a == b
+
+
+def _combine_hash(real_hash, imag_hash):
+    """
+    Собирает хеш комплексного числа из хешей частей так же, как встроенный complex.
+    :return:
+        int: Хеш.
+    """
+    combined = real_hash + sys.hash_info.imag * imag_hash
+    # как и в CPython, сумма берётся по модулю машинного слова
+    combined = (combined + _HASH_HALF) % (2 * _HASH_HALF) - _HASH_HALF
+    return -2 if combined == -1 else combined
+
+
+def _common_denominator(c):
+    """
+    Приводит части точного комплексного числа к общему знаменателю.
+    :param c (Complex): Комплексное число в режиме "exact".
+    :return:
+        tuple[int, int, int]: Числители A, B и знаменатель D, такие что c = (A + Bi) / D.
+    """
+    real, imag = c._real, c._imag
+    real_denominator, imag_denominator = real._denominator, imag._denominator
+    if real_denominator == imag_denominator:
+        return real._numerator, imag._numerator, real_denominator
+    g = gcd(real_denominator, imag_denominator)
+    return (real._numerator * (imag_denominator // g), imag._numerator * (real_denominator // g),
+            real_denominator // g * imag_denominator)
+
+
+def _add_fraction(numerator, denominator, r):
+    """
+    Складывает несокращённую дробь numerator / denominator с Rational и сокращает результат один раз.
+    :return:
+        Rational: Сумма в каноническом виде.
+    """
+    g = gcd(denominator, r._denominator)
+    if g == 1:
+        return Rational(numerator * r._denominator + r._numerator * denominator, denominator * r._denominator)
+    s = r._denominator // g
+    return Rational(numerator * s + r._numerator * (denominator // g), denominator * s)
+
+
+@lru_cache(maxsize=POWER_CACHE_SIZE)
+def _power_ladder(base):
+    """
+    Возвращает кешируемую ячейку с лестницей квадратов (base, base^2, base^4, ...).
+    Лестница — неизменяемый кортеж: при возведении в большую степень строится удлинённая
+    копия и целиком заменяет содержимое ячейки, поэтому потоки, возводящие одно основание
+    в разные степени, не видят недостроенной лестницы.
+    :param base (Complex): Основание в режиме "exact".
+    :return:
+        list[tuple[Complex, ...]]: Ячейка из одного элемента — лестницы квадратов.
+    """
+    return [(base,)]
+
+
+@lru_cache(maxsize=ROOTS_CACHE_SIZE)
+def _roots_of_unity(n):
+    """
+    Возвращает таблицу корней n-й степени из единицы.
+    Корни на осях (1, i, -1, -i) точные, поэтому, например, корень с k = n/2 равен ровно -1;
+    остальные вычисляются в float.
+    :param n (int): Степень корня.
+    :return:
+        tuple[Complex, ...]: Корни exp(2*pi*i*k/n) для k = 0..n-1.
+    """
+    if not isinstance(n, int):
+        raise TypeError("n must be an integer")
+    if n <= 0:
+        raise ValueError("n must be positive")
+    exact = {0: (1, 0), 1: (0, 1), 2: (-1, 0), 3: (0, -1)}
+    roots = []
+    for k in range(n):
+        if (4 * k) % n == 0:
+            real, imag = exact[4 * k // n]
+            roots.append(Complex._from_parts(Rational(real, 1), Rational(imag, 1)))
+        else:
+            angle = 2 * pi * k / n
+            roots.append(Complex._from_parts(cos(angle), sin(angle)))
+    return tuple(roots)
+
+
+def _gauss_product(a, b, c, d):
+    """
+    Произведение (a + bi)(c + di) целых чисел за три умножения (метод Гаусса/Карацубы).
+    :return:
+        tuple[int, int]: Действительная и мнимая части произведения.
+    """
+    k1 = c * (a + b)
+    k2 = a * (d - c)
+    k3 = b * (c + d)
+    return k1 - k3, k1 + k2
+
 
 class Complex:
     """
@@ -7,68 +246,147 @@ class Complex:
     Атрибуты:
         real (Rational): Действительная часть комплексного числа.
         imag (Rational): Мнимая часть комплексного числа.
+    Объекты неизменяемы: арифметические операции всегда возвращают новое комплексное число.
+
+    Каждое число использует один из двух вычислителей (backend):
+        "exact": части хранятся как Rational, арифметика точная;
+        "float": части хранятся как float, арифметика выполняется встроенным complex.
+    Результат операции с участием числа в режиме "float" тоже находится в режиме "float".
+    Вычислитель по умолчанию задаётся через Complex.set_default_backend или контекстный
+    менеджер Complex.use_backend.
     """
-    def __init__(self, real, imag=None):
+    __slots__ = ('_real', '_imag')
+
+    def __init__(self, real, imag=None, backend=None):
         """
         Инициализация комплексного числа.
         :param real: Действительная часть комплексного числа.
         :param imag: Мнимая часть комплексного числа. Если не указана, считается равной 0.
-        """
-        if imag is None:
-            if isinstance(real, (int, float)):
-                self.real = Rational.from_float(float(real)) if isinstance(real, float) else Rational(real, 1)
-                self.imag = Rational(0, 1)
-            elif isinstance(real, Rational):
-                self.real = real
-                self.imag = Rational(0, 1)
-            else:
-                raise TypeError("real must be Rational, int, or float")
+        :param backend: "exact" или "float". Если не указан, используется вычислитель по умолчанию.
+        """
+        if backend is None:
+            backend = _default_backend
+        if backend == "exact":
+            self._real = _to_rational(real)
+            self._imag = _to_rational(imag) if imag is not None else Rational(0, 1)
+        elif backend == "float":
+            self._real = _to_float(real)
+            self._imag = _to_float(imag) if imag is not None else 0.0
         else:
-            self.real = Rational(int(real), 1) if isinstance(real, int) else Rational.from_float(float(real))
-            self.imag = Rational(int(imag), 1) if isinstance(imag, int) else Rational.from_float(float(imag))
+            raise ValueError(f"backend must be one of {BACKENDS}")
+
+    @classmethod
+    def _from_parts(cls, real, imag):
+        """
+        Создаёт комплексное число из готовых частей без преобразования.
+        Обе части должны быть Rational (режим "exact") или обе float (режим "float").
+        :return:
+            Complex: Новое комплексное число.
+        """
+        c = object.__new__(cls)
+        c._real = real
+        c._imag = imag
+        return c
+
+    @classmethod
+    def _from_complex(cls, z: complex):
+        """
+        Создаёт комплексное число в режиме "float" из встроенного complex.
+        :return:
+            Complex: Новое комплексное число.
+        """
+        c = object.__new__(cls)
+        c._real = z.real
+        c._imag = z.imag
+        return c
+
+    def _as_complex(self) -> complex:
+        """
+        :return:
+            complex: Значение в виде встроенного complex.
+        """
+        return complex(float(self._real), float(self._imag))
+
+    @staticmethod
+    def set_default_backend(backend: str):
+        """
+        Задаёт вычислитель по умолчанию для новых комплексных чисел.
+        :param backend: "exact" или "float".
+        """
+        global _default_backend
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
+        _default_backend = backend
+
+    @staticmethod
+    def get_default_backend() -> str:
+        """
+        :return:
+            str: Текущий вычислитель по умолчанию.
+        """
+        return _default_backend
+
+    @staticmethod
+    @contextmanager
+    def use_backend(backend: str):
+        """
+        Контекстный менеджер, временно меняющий вычислитель по умолчанию.
+        :param backend: "exact" или "float".
+        """
+        previous = _default_backend
+        Complex.set_default_backend(backend)
+        try:
+            yield
+        finally:
+            Complex.set_default_backend(previous)
 
     @property
-    def real(self):
+    def backend(self) -> str:
         """
         :return:
-            Rational: Действительная часть комплексного числа.
+            str: Вычислитель этого числа ("exact" или "float").
         """
-        return self.__real
+        return "float" if self._real.__class__ is float else "exact"
 
-    @real.setter
-    def real(self, value):
+    def to_float(self):
         """
-        Устанавливает действительную часть комплексного числа.
-        :param value: Новое значение действительной части.
+        Функция перевода комплексного числа в режим "float".
+        :return:
+            Complex: Число в режиме "float".
         """
-        if isinstance(value, Rational):
-            self.__real = value
-        elif isinstance(value, (int, float)):
-            self.__real = Rational.from_float(float(value)) if isinstance(value, float) else Rational(value, 1)
-        else:
-            raise TypeError("real must be Rational, int or float")
+        if self._real.__class__ is float:
+            return self
+        return Complex._from_parts(float(self._real), float(self._imag))
 
+    def to_exact(self):
+        """
+        Функция перевода комплексного числа в режим "exact".
+        :return:
+            Complex: Число в режиме "exact".
+        """
+        if self._real.__class__ is not float:
+            return self
+        return Complex._from_parts(Rational.from_float(self._real), Rational.from_float(self._imag))
 
     @property
-    def imag(self):
+    def real(self):
         """
+        В режиме "float" часть преобразуется в Rational при чтении.
         :return:
-            Rational: Мнимая часть комплексного числа.
+            Rational: Действительная часть комплексного числа.
         """
-        return self.__imag
+        real = self._real
+        return Rational.from_float(real) if real.__class__ is float else real
 
-    @imag.setter
-    def imag(self, value):
+    @property
+    def imag(self):
         """
-        Устанавливает мнимую часть комплексного числа.
-        :param value: Новое значение мнимой части.
+        В режиме "float" часть преобразуется в Rational при чтении.
+        :return:
+            Rational: Мнимая часть комплексного числа.
         """
-        if isinstance(value, Rational):
-            self.__imag = value
-        elif isinstance(value, (int, float)):
-            self.__imag = Rational.from_float(float(value)) if isinstance(value, float) else Rational(value, 1)
-        else:
-            raise TypeError("imag must be Rational, int or float")
+        imag = self._imag
+        return Rational.from_float(imag) if imag.__class__ is float else imag
 
     def __add__(self, other):
         """
@@ -78,11 +396,15 @@ class Complex:
             Complex: Новое комплексное число, представляющее результат сложения.
         """
         if isinstance(other, Complex):
-            return Complex(self.real + other.real, self.imag + other.imag)
+            if self._real.__class__ is float or other._real.__class__ is float:
+                return Complex._from_complex(self._as_complex() + other._as_complex())
+            return Complex._from_parts(self._real + other._real, self._imag + other._imag)
         elif isinstance(other, (Rational, int, float)):
-            return Complex(self.real + other, self.imag)
+            if self._real.__class__ is float:
+                return Complex._from_parts(self._real + float(other), self._imag)
+            return Complex._from_parts(self._real + _to_rational(other), self._imag)
         else:
-            raise TypeError("Unsupported operand type")
+            return self + _promote(other)
 
     def __sub__(self, other):
         """
@@ -92,11 +414,15 @@ class Complex:
             Complex: Новое комплексное число, представляющее результат вычитания.
         """
         if isinstance(other, Complex):
-            return Complex(self.real - other.real, self.imag - other.imag)
+            if self._real.__class__ is float or other._real.__class__ is float:
+                return Complex._from_complex(self._as_complex() - other._as_complex())
+            return Complex._from_parts(self._real - other._real, self._imag - other._imag)
         elif isinstance(other, (Rational, int, float)):
-            return Complex(self.real - other, self.imag)
+            if self._real.__class__ is float:
+                return Complex._from_parts(self._real - float(other), self._imag)
+            return Complex._from_parts(self._real - _to_rational(other), self._imag)
         else:
-            raise TypeError("Unsupported operand type")
+            return self - _promote(other)
 
     def __mul__(self, other):
         """
@@ -106,19 +432,92 @@ class Complex:
             Complex: Новое комплексное число, представляющее результат умножения.
         """
         if isinstance(other, Complex):
+            if self._real.__class__ is float or other._real.__class__ is float:
+                return Complex._from_complex(self._as_complex() * other._as_complex())
 
-            real_part = self.real * other.real - self.imag * other.imag
-            imag_part = self.real * other.imag + self.imag * other.real
-            return Complex(real_part, imag_part)
+            a, b, d1 = _common_denominator(self)
+            c, d, d2 = _common_denominator(other)
+            denominator_bits = d1.bit_length() + d2.bit_length()
+            if (denominator_bits <= _GAUSS_DENOMINATOR_BITS
+                    or denominator_bits <= max(a.bit_length(), b.bit_length(), c.bit_length(), d.bit_length())):
+                # три умножения целых и одно сокращение на каждую часть
+                real_part, imag_part = _gauss_product(a, b, c, d)
+                denominator = d1 * d2
+                return Complex._from_parts(Rational(real_part, denominator), Rational(imag_part, denominator))
 
-        elif isinstance(other, (int, float)):
-            return Complex(self.real * other, self.imag * other)
+            # при длинных знаменателях перекрёстные НОД в Rational.__mul__ держат числа короче
+            real_part = self._real * other._real - self._imag * other._imag
+            imag_part = self._real * other._imag + self._imag * other._real
+            return Complex._from_parts(real_part, imag_part)
 
-        elif isinstance(other, Rational):
-            scalar = float(other.numerator) / float(other.denominator)
-            return Complex(self.real * scalar, self.imag * scalar)
+        elif isinstance(other, (Rational, int, float)):
+            if self._real.__class__ is float:
+                scalar = float(other)
+                return Complex._from_parts(self._real * scalar, self._imag * scalar)
+            scalar = _to_rational(other)
+            return Complex._from_parts(self._real * scalar, self._imag * scalar)
         else:
-            raise TypeError("Unsupported operand type")
+            return self * _promote(other)
+
+    @staticmethod
+    def sum(iterable, start=0):
+        """
+        Функция суммирования последовательности чисел с отложенным сокращением.
+        Действительные и мнимые части накапливаются в RationalAccumulator и сокращаются
+        один раз в конце. Если среди слагаемых есть числа в режиме "float", результат
+        тоже будет в режиме "float".
+        :param iterable (iterable[Complex | Rational | int | float]): Слагаемые.
+        :param start (Complex | Rational | int | float): Начальное значение суммы.
+        :return:
+            Complex: Сумма.
+        """
+        real = RationalAccumulator()
+        imag = RationalAccumulator()
+        float_total = None
+        for value in chain((start,), iterable):
+            if isinstance(value, Complex):
+                if value._real.__class__ is float:
+                    float_total = (float_total or 0j) + complex(value._real, value._imag)
+                else:
+                    real.add(value._real)
+                    imag.add(value._imag)
+            elif isinstance(value, (Rational, int, float)):
+                real.add(_to_rational(value))
+            else:
+                value = _promote(value)
+                real.add(value._real)
+                imag.add(value._imag)
+        result = Complex._from_parts(real.value(), imag.value())
+        if float_total is not None:
+            return Complex._from_complex(result._as_complex() + float_total)
+        return result
+
+    def fma(self, a, b):
+        """
+        Функция совмещённого умножения-сложения: вычисляет self * a + b.
+        В режиме "exact" произведение считается над целыми числами за три умножения,
+        а каждая часть результата сокращается один раз, в самом конце.
+        Удобна для схемы Горнера и итераций вида z = z * z + c.
+        :param a (Complex | Rational | int | float): Множитель.
+        :param b (Complex | Rational | int | float): Слагаемое.
+        :return:
+            Complex: Новое комплексное число self * a + b.
+        """
+        if not isinstance(a, Complex):
+            a = Complex._from_parts(_to_float(a), 0.0) if self._real.__class__ is float else Complex(a, backend="exact")
+        if not isinstance(b, Complex):
+            b = Complex._from_parts(_to_float(b), 0.0) if self._real.__class__ is float else Complex(b, backend="exact")
+        if self._real.__class__ is float or a._real.__class__ is float or b._real.__class__ is float:
+            return Complex._from_complex(self._as_complex() * a._as_complex() + b._as_complex())
+
+        x, y, d1 = _common_denominator(self)
+        u, v, d2 = _common_denominator(a)
+        real_part, imag_part = _gauss_product(x, y, u, v)
+        denominator = d1 * d2
+        return Complex._from_parts(_add_fraction(real_part, denominator, b._real),
+                                   _add_fraction(imag_part, denominator, b._imag))
+
+    muladd = fma
 
     def __truediv__(self, other):
         """
@@ -128,121 +527,77 @@ class Complex:
             Complex: Новое комплексное число, представляющее результат деления.
         """
         if isinstance(other, Complex):
-            denominator = other.real ** 2 + other.imag ** 2
+            if self._real.__class__ is float or other._real.__class__ is float:
+                divisor = other._as_complex()
+                if divisor == 0:
+                    raise ZeroDivisionError("Cannot divide by zero complex number")
+                return Complex._from_complex(self._as_complex() / divisor)
+            denominator = other._real ** 2 + other._imag ** 2
             if denominator == 0:
                 raise ZeroDivisionError("Cannot divide by zero complex number")
-            real_part = (self.real * other.real + self.imag * other.imag) / denominator
-            imag_part = (self.imag * other.real - self.real * other.imag) / denominator
-            return Complex(real_part, imag_part)
+            real_part = (self._real * other._real + self._imag * other._imag) / denominator
+            imag_part = (self._imag * other._real - self._real * other._imag) / denominator
+            return Complex._from_parts(real_part, imag_part)
         elif isinstance(other, (Rational, int, float)):
             if other == 0:
                 raise ZeroDivisionError("Cannot divide by zero scalar")
-            return Complex(self.real / other, self.imag / other)
+            if self._real.__class__ is float:
+                scalar = float(other)
+                return Complex._from_parts(self._real / scalar, self._imag / scalar)
+            scalar = _to_rational(other)
+            return Complex._from_parts(self._real / scalar, self._imag / scalar)
         else:
-            raise TypeError("Unsupported operand type")
+            return self / _promote(other)
 
 
     def __eq__(self, other):
         """
-        Проверка на равенство комплексного числа с другим числом (комплексным, Rational, int или float).
-        :param other (Complex | Rational | int | float): Число, с которым нужно сравнить текущее комплексное число.
+        Проверка на равенство комплексного числа с другим числом (комплексным, Rational, int, float,
+        встроенным complex или Fraction).
+        Сравнение точное и в режиме "float": части-float сравниваются как точные дроби,
+        поэтому равные числа всегда имеют равный хеш.
+        :param other (Complex | Rational | int | float | complex | Fraction): Число, с которым нужно сравнить текущее комплексное число.
         :return:
-            bool: True, если числа равны, False в противном случае.
+            bool: True, если числа равны, False в противном случае (NotImplemented для прочих типов).
         """
         if isinstance(other, Complex):
-            return self.real == other.real and self.imag == other.imag
+            return _parts_equal(self._real, other._real) and _parts_equal(self._imag, other._imag)
+        elif isinstance(other, complex):
+            return _parts_equal(self._real, other.real) and _parts_equal(self._imag, other.imag)
+        elif isinstance(other, Fraction):
+            return self == Rational._from_reduced(other.numerator, other.denominator)
         elif isinstance(other, (Rational, int, float)):
-            return self.real == other and self.imag == Rational(0, 1)
-        else:
-            raise TypeError("Unsupported operand type")
+            if other.__class__ is not float:
+                other = _to_rational(other)
+            if self._real.__class__ is float:
+                return _parts_equal(self._real, other) and self._imag == 0.0
+            return _parts_equal(self._real, other) and self._imag == Rational(0, 1)
+        elif hasattr(other, "to_complex"):
+            return self == _promote(other)
+        return NotImplemented
 
     def __ne__(self, other):
         """
-        Проверка на неравенство текущего комплексного числа с другим числом (комплексным, Rational, int или float).
-        :param other (Complex | Rational | int | float): Число, с которым нужно сравнить текущее комплексное число.
-        :return:
-            bool: True, если числа не равны, иначе False.
-        """
-        return not self == other
-
-    def __iadd__(self, other):
-        """
-        Функция сложения с присваиванием текущего комплексного числа с другим числом (комплексным, Rational, int или float).
-        :param other(Complex | Rational | int | float): Число, которое нужно добавить к текущему комплексному числу.
-        :return:
-            Complex: Текущее комплексное число после сложения.
-        """
-        if isinstance(other, Complex):
-            self.real += other.real
-            self.imag += other.imag
-        elif isinstance(other, (Rational, int, float)):
-            self.real += other
-        else:
-            raise TypeError("Unsupported operand type")
-        return self
-
-    def __isub__(self, other):
-        """
-        Функция вычитания с присваиванием текущего комплексного числа с другим числом (комплексным, Rational, int или float).
-        :param other(Complex | Rational | int | float): Число, которое нужно вычесть из текущего комплексного числа.
-        :return:
-            Complex: Текущее комплексное число после вычитания.
-        """
-        if isinstance(other, Complex):
-            self.real -= other.real
-            self.imag -= other.imag
-        elif isinstance(other, (Rational, int, float)):
-            self.real -= other
-        else:
-            raise TypeError("Unsupported operand type")
-        return self
-
-    def __imul__(self, other):
-        """
-        Функция умножения с присваиванием текущего комплексного числа на другое число (комплексное, Rational, int или float).
-        :param other(Complex | Rational | int | float): Число, на которое нужно умножить текущее комплексное число.
+        Проверка на неравенство текущего комплексного числа с другим числом (комплексным, Rational, int,
+        float, встроенным complex или Fraction).
+        :param other (Complex | Rational | int | float | complex | Fraction): Число, с которым нужно сравнить текущее комплексное число.
         :return:
-            Complex: Текущее комплексное число после умножения.
+            bool: True, если числа не равны, иначе False (NotImplemented для прочих типов).
         """
-        if isinstance(other, Complex):
-            new_real = self.real * other.real - self.imag * other.imag
-            new_imag = self.real * other.imag + self.imag * other.real
-            self.real = new_real
-            self.imag = new_imag
-        elif isinstance(other, (Rational, int, float)):
-            if isinstance(other, (int, float)):
-                other = Rational(int(other), 1) if isinstance(other, int) else Rational.from_float(float(other))
-            self.real *= other
-            self.imag *= other
-        else:
-            raise TypeError("Unsupported operand type")
-        return self
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
-    def __itruediv__(self, other):
+    def __hash__(self):
         """
-        Функция деления с присваиванием текущего комплексного числа на другое число (комплексное, Rational, int или float).
-        :param other(Complex | Rational | int | float): Число, на которое нужно разделить текущее комплексное число.
+        Функция получения хеша комплексного числа.
+        Хеш строится так же, как у встроенного complex, поэтому число с нулевой мнимой частью
+        имеет тот же хеш, что и равная ему дробь.
         :return:
-            Complex: Текущее комплексное число после деления.
+            int: Хеш комплексного числа.
         """
-        if isinstance(other, Complex):
-            if other.real == 0 and other.imag == 0:
-                raise ZeroDivisionError("Cannot divide by zero complex number")
-            denominator = other.real ** 2 + other.imag ** 2
-            if denominator == 0:
-                raise ValueError("Cannot divide by zero")
-            new_real = (self.real * other.real + self.imag * other.imag) / denominator
-            new_imag = (self.imag * other.real - self.real * other.imag) / denominator
-            self.real = new_real
-            self.imag = new_imag
-        elif isinstance(other, (Rational, int, float)):
-            if other == 0:
-                raise ValueError("Cannot divide by zero")
-            self.real /= other
-            self.imag /= other
-        else:
-            raise TypeError("Unsupported operand type")
-        return self
+        return _combine_hash(hash(self._real), hash(self._imag))
 
     def __pow__(self, other: int):
         """
@@ -253,32 +608,117 @@ class Complex:
         """
         if not isinstance(other, int):
             raise TypeError("Exponent must be an integer")
+        if self._real.__class__ is float:
+            z = self._as_complex()
+            if z == 0 and other < 0:
+                raise ValueError("Cannot invert zero complex number")
+            return Complex._from_complex(z ** other)
         if other < 0:
             return (self.inverse()) ** (-other)
         elif other == 0:
-            return Complex(1, 0)
+            return Complex(1, 0, backend="exact")
         elif other == 1:
             return self
         else:
-            result = Complex(1, 0)
-            base = self
-            while other > 0:
-                if other % 2 == 1:
-                    result *= base
-                base *= base
-                other //= 2
+            # лестница квадратов base^(2^i) кешируется для каждого основания; под ограничением
+            # точности (Rational.precision_cap) квадраты округлены и в кеш не попадают
+            cell = _power_ladder(self) if rational._precision_policy is None else [(self,)]
+            ladder = cell[0]
+            if len(ladder) < other.bit_length():
+                extended = list(ladder)
+                while len(extended) < other.bit_length():
+                    extended.append(extended[-1] * extended[-1])
+                ladder = tuple(extended)
+                # другой поток мог успеть сохранить лестницу длиннее; обе лестницы верны
+                if len(cell[0]) < len(ladder):
+                    cell[0] = ladder
+            result = None
+            for i in range(other.bit_length()):
+                if other >> i & 1:
+                    result = ladder[i] if result is None else result * ladder[i]
             return result
 
+    def powers(self, n: int):
+        """
+        Функция вычисления всех степеней числа от 0 до n за один проход.
+        :param n (int): Наибольший показатель степени.
+        :return:
+            list[Complex]: Список [self^0, self^1, ..., self^n].
+        """
+        if not isinstance(n, int):
+            raise TypeError("Exponent must be an integer")
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if self._real.__class__ is float:
+            z = self._as_complex()
+            current = 1 + 0j
+            result = [Complex._from_complex(current)]
+            for _ in range(n):
+                current *= z
+                result.append(Complex._from_complex(current))
+            return result
+        result = [Complex(1, 0, backend="exact")]
+        if n:
+            result.append(self)
+        for _ in range(n - 1):
+            result.append(result[-1] * self)
+        return result
+
+    @staticmethod
+    def root_of_unity(n: int, k: int = 1):
+        """
+        Функция получения корня из единицы exp(2*pi*i*k/n) из предвычисленной таблицы.
+        Корни 1, -1, i и -i возвращаются в режиме "exact", остальные (иррациональные)
+        корни — в режиме "float".
+        :param n (int): Степень корня (n > 0).
+        :param k (int): Номер корня; берётся по модулю n.
+        :return:
+            Complex: Корень из единицы.
+        """
+        return _roots_of_unity(n)[k % n]
+
+    @staticmethod
+    def roots_of_unity(n: int):
+        """
+        Функция получения всех корней n-й степени из единицы.
+        :param n (int): Степень корня (n > 0).
+        :return:
+            list[Complex]: Корни exp(2*pi*i*k/n) для k = 0..n-1.
+        """
+        return list(_roots_of_unity(n))
+
+    @staticmethod
+    def power_cache_info():
+        """
+        Возвращает статистику кеша лестниц степеней и таблицы корней из единицы.
+        :return:
+            dict: Статистика обоих кешей в формате functools.lru_cache.
+        """
+        return {"powers": _power_ladder.cache_info(), "roots_of_unity": _roots_of_unity.cache_info()}
+
+    @staticmethod
+    def clear_power_cache():
+        """
+        Очищает кеш лестниц степеней и таблицу корней из единицы.
+        """
+        _power_ladder.cache_clear()
+        _roots_of_unity.cache_clear()
+
     def inverse(self):
         """
         Функция инверсии комплексного числа.
         :return:
             Complex: Обратное комплексное число.
         """
-        denominator = self.real * self.real + self.imag * self.imag
+        if self._real.__class__ is float:
+            z = self._as_complex()
+            if z == 0:
+                raise ValueError("Cannot invert zero complex number")
+            return Complex._from_complex(1 / z)
+        denominator = self._real * self._real + self._imag * self._imag
         if denominator == 0:
             raise ValueError("Cannot invert zero complex number")
-        return Complex(self.real / denominator, -self.imag / denominator)
+        return Complex._from_parts(self._real / denominator, -self._imag / denominator)
 
     def __neg__(self):
         """
@@ -286,7 +726,7 @@ class Complex:
         :return:
             Complex: Противоположное значение текущего комплексного числа.
         """
-        return Complex(-self.real, -self.imag)
+        return Complex._from_parts(-self._real, -self._imag)
 
     def __str__(self):
         """
@@ -294,8 +734,8 @@ class Complex:
         :return:
             str: Строковое представление комплексного числа.
         """
-        real_float = float(self.real)
-        imag_float = float(self.imag)
+        real_float = float(self._real)
+        imag_float = float(self._imag)
         if imag_float >= 0:
             return f"({real_float} + {imag_float}i)"
         else:
@@ -307,7 +747,57 @@ class Complex:
         :return:
             str: Строковое представление комплексного числа.
         """
-        return f"Complex({self.real}, {self.imag})"
+        if self._real.__class__ is float:
+            return f"Complex({self._real}, {self._imag}, backend='float')"
+        return f"Complex({self._real}, {self._imag})"
+
+    @staticmethod
+    def parse(text: str):
+        """
+        Функция разбора текстовой записи комплексного числа.
+        Понимает алгебраическую запись с дробями и десятичными числами ("1/2 + 3/4i", "-2.5 - i",
+        "3/4i", "7", суффикс i или j, необязательные скобки), вывод __str__ ("(0.5 - 0.25i)")
+        и __repr__ ("Complex(0.5, -0.25)", "Complex(0.1, 2.0, backend='float')").
+        Части переводятся в дроби точно, без float; запись repr с backend='float'
+        даёт число в режиме "float" (repr float восстанавливается без потерь).
+        Записи "a/b + c/di", "(0.5 - 0.25i)" и "Complex(0.5, -0.25)" без порядка разбираются
+        отдельным быстрым путём, но и он даёт около 130-190 тыс. записей в секунду на одном ядре
+        (см. benchmarks/bench_parse.py): это меньше, чем несколько сотен тысяч в секунду у Rational.parse.
+        Исключения:
+            ValueError: Если запись не распознана, знаменатель равен нулю или модуль порядка
+                больше rational.PARSE_MAX_EXPONENT.
+        :param text (str): Запись комплексного числа.
+        :return:
+            Complex: Комплексное число.
+        """
+        match = _FAST_COMPLEX_RE.fullmatch(text)
+        if match is not None:
+            _, real_sign, *real, imag_sign, imag_whole, imag_fraction, imag_denominator = match.groups()
+            return Complex._from_parts(_fast_rational(real_sign == "-", *real),
+                                       _fast_rational(imag_sign == "-", imag_whole, imag_fraction, imag_denominator))
+        match = _FAST_REPR_RE.fullmatch(text)
+        if match is not None:
+            real_sign, real_whole, real_fraction, real_denominator, imag_sign, *imag = match.groups()
+            return Complex._from_parts(_fast_rational(real_sign == "-", real_whole, real_fraction, real_denominator),
+                                       _fast_rational(imag_sign == "-", *imag))
+        match = _COMPLEX_RE.fullmatch(text)
+        if match is None:
+            raise ValueError(f"Invalid complex literal: {text!r}")
+        real = match.group("cr")
+        if real is not None:
+            imag = match.group("ci")
+            if match.group("backend") == "float":
+                return Complex._from_parts(_parse_float(real), _parse_float(imag))
+            return Complex._from_parts(_parse_rational(real), _parse_rational(imag))
+        real = match.group("real")
+        if real is not None:
+            sign = match.group("sign")
+            if sign is None:
+                return Complex._from_parts(_parse_rational(real), Rational(0, 1))
+            imag = _parse_rational(match.group("imag") or "1")
+            return Complex._from_parts(_parse_rational(real), -imag if sign == "-" else imag)
+        imag = _parse_rational(match.group("coefficient") or "1")
+        return Complex._from_parts(Rational(0, 1), -imag if match.group("only") == "-" else imag)
 
     def abs(self) -> float:
         """
@@ -315,7 +805,7 @@ class Complex:
         :return:
             float: Модуль комплексного числа.
         """
-        return sqrt(float(self.real) ** 2 + float(self.imag) ** 2)
+        return sqrt(float(self._real) ** 2 + float(self._imag) ** 2)
 
     def arg(self) -> float:
         """
@@ -323,6 +813,12 @@ class Complex:
         :return:
             float: Аргумент комплексного числа.
         """
-        real_float = float(self.real)
-        imag_float = float(self.imag)
-        return atan2(imag_float, real_float)
\ No newline at end of file
+        real_float = float(self._real)
+        imag_float = float(self._imag)
+        return atan2(imag_float, real_float)
+
+
+# инструментирование из переменной окружения (см. instrumentation.enable_from_environment)
+if os.environ.get("RATIONAL_INSTRUMENT", "") not in ("", "0"):
+    import instrumentation
+    instrumentation.enable_from_environment()
@@ -0,0 +1,397 @@
+import numpy as np
+
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray
+
+
+def _to_complex(value):
+    """
+    Приводит скаляр к Complex в режиме "exact" (элементу точного массива) независимо
+    от вычислителя по умолчанию.
+    :param value (Complex | Rational | int | float | complex): Исходное число.
+    :return:
+        Complex: Комплексное число.
+    """
+    if isinstance(value, Complex):
+        return value
+    elif isinstance(value, complex):
+        return Complex(value.real, value.imag, backend="exact")
+    elif isinstance(value, (Rational, int, float)):
+        return Complex(value, backend="exact")
+    else:
+        raise TypeError("value must be Complex, Rational, int, float or complex")
+
+
+class ComplexArray:
+    """
+    Одномерный массив комплексных чисел с пакетными поэлементными операциями.
+    Поддерживает два режима:
+        точный (exact=True): действительная и мнимая части хранятся как два RationalArray
+            (столбцы числителей и знаменателей int64 с переходом на Python int при переполнении);
+        быстрый (exact=False): значения хранятся в массиве complex128.
+    Атрибуты:
+        exact (bool): Режим массива.
+    """
+    __slots__ = ('exact', '_data', '_real', '_imag')
+
+    def __init__(self, values=(), exact: bool = True):
+        """
+        Инициализация массива из последовательности чисел.
+        :param values (iterable[Complex | Rational | int | float | complex]): Элементы массива.
+        :param exact: True для точного режима, False для режима complex128.
+        """
+        self.exact = exact
+        if exact:
+            items = [_to_complex(value) for value in values]
+            self._data = None
+            self._real = RationalArray([c.real for c in items])
+            self._imag = RationalArray([c.imag for c in items])
+        else:
+            items = list(values)
+            data = np.empty(len(items), dtype=np.complex128)
+            for i, value in enumerate(items):
+                if isinstance(value, Complex):
+                    data[i] = complex(float(value.real), float(value.imag))
+                elif isinstance(value, Rational):
+                    data[i] = float(value)
+                else:
+                    data[i] = value
+            self._data = data
+            self._real = self._imag = None
+
+    @classmethod
+    def _from_parts(cls, real, imag):
+        """
+        Создаёт точный массив из массивов действительных и мнимых частей.
+        :param real (RationalArray): Действительные части.
+        :param imag (RationalArray): Мнимые части.
+        :return:
+            ComplexArray: Новый массив в точном режиме.
+        """
+        array = object.__new__(cls)
+        array.exact = True
+        array._data = None
+        array._real = real
+        array._imag = imag
+        return array
+
+    @classmethod
+    def _from_data(cls, data):
+        """
+        Создаёт массив в режиме complex128 из готового массива numpy.
+        :return:
+            ComplexArray: Новый массив в быстром режиме.
+        """
+        array = object.__new__(cls)
+        array.exact = False
+        array._data = data
+        array._real = array._imag = None
+        return array
+
+    @classmethod
+    def from_rationals(cls, reals, imags=None):
+        """
+        Создаёт точный массив из списков действительных и мнимых частей.
+        :param reals (RationalArray | iterable[Rational | int]): Действительные части.
+        :param imags (RationalArray | iterable[Rational | int] | None): Мнимые части. Если не указаны, считаются равными 0.
+        :return:
+            ComplexArray: Новый массив в точном режиме.
+        """
+        real = reals if isinstance(reals, RationalArray) else RationalArray(reals)
+        if imags is None:
+            imag = RationalArray([0] * len(real))
+        else:
+            imag = imags if isinstance(imags, RationalArray) else RationalArray(imags)
+        if len(real) != len(imag):
+            raise ValueError("reals and imags must have the same length")
+        return cls._from_parts(real, imag)
+
+    def to_list(self):
+        """
+        Функция преобразования массива в список Complex.
+        :return:
+            list[Complex]: Элементы массива.
+        """
+        return [self[i] for i in range(len(self))]
+
+    def real_list(self):
+        """
+        :return:
+            list[Rational]: Действительные части элементов.
+        """
+        return self._real.to_list() if self.exact else [c.real for c in self.to_list()]
+
+    def imag_list(self):
+        """
+        :return:
+            list[Rational]: Мнимые части элементов.
+        """
+        return self._imag.to_list() if self.exact else [c.imag for c in self.to_list()]
+
+    def to_numpy(self):
+        """
+        Функция получения значений в виде массива complex128.
+        :return:
+            np.ndarray: Массив complex128 (копия).
+        """
+        if not self.exact:
+            return self._data.copy()
+        return self._real.to_numpy() + 1j * self._imag.to_numpy()
+
+    def to_float(self):
+        """
+        Функция перевода массива в быстрый режим complex128.
+        :return:
+            ComplexArray: Массив в быстром режиме.
+        """
+        return self if not self.exact else ComplexArray._from_data(self.to_numpy())
+
+    def to_exact(self):
+        """
+        Функция перевода массива в точный режим.
+        Значения float переводятся в дроби без округления.
+        :return:
+            ComplexArray: Массив в точном режиме.
+        """
+        if self.exact:
+            return self
+        reals = []
+        imags = []
+        for z in self._data.tolist():
+            reals.append(Rational(*z.real.as_integer_ratio()))
+            imags.append(Rational(*z.imag.as_integer_ratio()))
+        return ComplexArray._from_parts(RationalArray(reals), RationalArray(imags))
+
+    def __len__(self):
+        return len(self._data) if not self.exact else len(self._real)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        """
+        Функция получения элемента или среза.
+        :param index (int | slice): Индекс или срез.
+        :return:
+            Complex | ComplexArray: Элемент в виде Complex или новый массив для среза.
+        """
+        if isinstance(index, slice):
+            if not self.exact:
+                return ComplexArray._from_data(self._data[index].copy())
+            return ComplexArray._from_parts(self._real[index], self._imag[index])
+        if not self.exact:
+            z = complex(self._data[index])
+            return Complex(z.real, z.imag, backend="float")
+        return Complex(self._real[index], self._imag[index], backend="exact")
+
+    def _coerce(self, other):
+        """
+        Приводит второй операнд к массиву того же режима и длины.
+        Скаляр растягивается на всю длину массива.
+        :param other (ComplexArray | Complex | Rational | int | float | complex): Второй операнд.
+        :return:
+            ComplexArray: Операнд в виде массива.
+        """
+        if isinstance(other, ComplexArray):
+            if len(other) != len(self):
+                raise ValueError("Arrays must have the same length")
+            if other.exact != self.exact:
+                raise ValueError("Arrays must have the same mode")
+            return other
+        c = _to_complex(other)
+        n = len(self)
+        if not self.exact:
+            return ComplexArray._from_data(np.full(n, complex(float(c.real), float(c.imag))))
+        return ComplexArray._from_parts(RationalArray([c.real] * n), RationalArray([c.imag] * n))
+
+    def __add__(self, other):
+        """
+        Поэлементное сложение с массивом или скаляром.
+        :param other (ComplexArray | Complex | Rational | int | float | complex): Второй операнд.
+        :return:
+            ComplexArray: Новый массив.
+        """
+        other = self._coerce(other)
+        if not self.exact:
+            return ComplexArray._from_data(self._data + other._data)
+        return ComplexArray._from_parts(self._real + other._real, self._imag + other._imag)
+
+    def __sub__(self, other):
+        """
+        Поэлементное вычитание массива или скаляра.
+        :param other (ComplexArray | Complex | Rational | int | float | complex): Второй операнд.
+        :return:
+            ComplexArray: Новый массив.
+        """
+        other = self._coerce(other)
+        if not self.exact:
+            return ComplexArray._from_data(self._data - other._data)
+        return ComplexArray._from_parts(self._real - other._real, self._imag - other._imag)
+
+    def __mul__(self, other):
+        """
+        Поэлементное умножение на массив или скаляр.
+        :param other (ComplexArray | Complex | Rational | int | float | complex): Второй операнд.
+        :return:
+            ComplexArray: Новый массив.
+        """
+        other = self._coerce(other)
+        if not self.exact:
+            return ComplexArray._from_data(self._data * other._data)
+        a, b = self._real, self._imag
+        c, d = other._real, other._imag
+        return ComplexArray._from_parts(a * c - b * d, a * d + b * c)
+
+    def __truediv__(self, other):
+        """
+        Поэлементное деление на массив или скаляр.
+        :param other (ComplexArray | Complex | Rational | int | float | complex): Делитель.
+        :return:
+            ComplexArray: Новый массив.
+        """
+        other = self._coerce(other)
+        if not self.exact:
+            if np.any(other._data == 0):
+                raise ZeroDivisionError("Cannot divide by zero complex number")
+            return ComplexArray._from_data(self._data / other._data)
+        return self * other.inverse()
+
+    def __neg__(self):
+        """
+        :return:
+            ComplexArray: Массив противоположных чисел.
+        """
+        if not self.exact:
+            return ComplexArray._from_data(-self._data)
+        return ComplexArray._from_parts(-self._real, -self._imag)
+
+    def inverse(self):
+        """
+        Поэлементное обращение: 1 / z = conj(z) / |z|^2.
+        Исключения:
+            ZeroDivisionError: Если массив содержит ноль.
+        :return:
+            ComplexArray: Новый массив.
+        """
+        if not self.exact:
+            if np.any(self._data == 0):
+                raise ZeroDivisionError("Cannot invert zero complex number")
+            return ComplexArray._from_data(1 / self._data)
+        a, b = self._real, self._imag
+        norm = a * a + b * b
+        try:
+            reciprocal = norm.inverse()
+        except ZeroDivisionError:
+            raise ZeroDivisionError("Cannot invert zero complex number") from None
+        return ComplexArray._from_parts(a * reciprocal, -b * reciprocal)
+
+    def __pow__(self, other: int):
+        """
+        Поэлементное возведение в целую степень двоичным методом.
+        :param other (int): Показатель степени.
+        :return:
+            ComplexArray: Новый массив.
+        """
+        if not isinstance(other, int):
+            raise TypeError("Exponent must be an integer")
+        if other < 0:
+            return self.inverse() ** (-other)
+        if not self.exact:
+            return ComplexArray._from_data(self._data ** other)
+        result = self._coerce(1)
+        base = self
+        while other > 0:
+            if other % 2 == 1:
+                result = result * base
+            other //= 2
+            if other:
+                base = base * base
+        return result
+
+    def abs(self):
+        """
+        Поэлементный модуль.
+        :return:
+            np.ndarray: Массив float64.
+        """
+        return np.abs(self.to_numpy()) if self.exact else np.abs(self._data)
+
+    def arg(self):
+        """
+        Поэлементный аргумент (в радианах).
+        :return:
+            np.ndarray: Массив float64.
+        """
+        return np.angle(self.to_numpy()) if self.exact else np.angle(self._data)
+
+    def _tree_reduce(self, operation, identity):
+        """
+        Сворачивает массив попарно за log2(n) пакетных шагов.
+        :param operation (callable): Бинарная поэлементная операция над массивами.
+        :param identity (int): Нейтральный элемент операции.
+        :return:
+            Complex: Результат свёртки.
+        """
+        current = self
+        if len(current) == 0:
+            return Complex(identity, 0, backend="exact")
+        while len(current) > 1:
+            half = len(current) // 2
+            merged = operation(current[:half], current[half:2 * half])
+            if len(current) % 2:
+                merged = ComplexArray.concatenate([merged, current[2 * half:]])
+            current = merged
+        return current[0]
+
+    def sum(self):
+        """
+        :return:
+            Complex: Сумма элементов.
+        """
+        if not self.exact:
+            z = complex(self._data.sum())
+            return Complex(z.real, z.imag, backend="float")
+        return self._tree_reduce(ComplexArray.__add__, 0)
+
+    def prod(self):
+        """
+        :return:
+            Complex: Произведение элементов.
+        """
+        if not self.exact:
+            z = complex(self._data.prod())
+            return Complex(z.real, z.imag, backend="float")
+        return self._tree_reduce(ComplexArray.__mul__, 1)
+
+    def dot(self, other):
+        """
+        Скалярное произведение без сопряжения: сумма попарных произведений.
+        :param other (ComplexArray): Второй массив той же длины и того же режима.
+        :return:
+            Complex: Сумма произведений.
+        """
+        return (self * other).sum()
+
+    @staticmethod
+    def concatenate(arrays):
+        """
+        Объединяет несколько массивов одного режима.
+        :param arrays (list[ComplexArray]): Массивы.
+        :return:
+            ComplexArray: Новый массив.
+        """
+        arrays = list(arrays)
+        if not arrays:
+            return ComplexArray()
+        if any(array.exact != arrays[0].exact for array in arrays):
+            raise ValueError("Arrays must have the same mode")
+        if not arrays[0].exact:
+            return ComplexArray._from_data(np.concatenate([array._data for array in arrays]))
+        return ComplexArray._from_parts(RationalArray.concatenate([array._real for array in arrays]),
+                                        RationalArray.concatenate([array._imag for array in arrays]))
+
+    def __repr__(self):
+        mode = "exact" if self.exact else "float"
+        return f"ComplexArray([{', '.join(repr(c) for c in self.to_list())}], {mode})"
@@ -0,0 +1,289 @@
+from functools import lru_cache
+from math import cos, gcd, pi, sin
+
+from rational import Rational
+from complex import Complex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# число размеров, для которых хранятся таблицы поворотных множителей
+TWIDDLE_CACHE_SIZE = 64
+
+ENGINES = ("auto", "numpy", "python")
+
+
+def _to_builtin(value) -> complex:
+    """
+    Приводит число к встроенному complex.
+    :param value (Complex | Rational | int | float | complex): Исходное число.
+    :return:
+        complex: Значение во float.
+    """
+    if isinstance(value, Complex):
+        return complex(float(value._real), float(value._imag))
+    elif isinstance(value, complex):
+        return value
+    elif isinstance(value, (Rational, int, float)):
+        return complex(float(value))
+    else:
+        raise TypeError("values must be Complex, Rational, int, float or complex")
+
+
+@lru_cache(maxsize=TWIDDLE_CACHE_SIZE)
+def _twiddles(n):
+    """
+    Возвращает таблицу поворотных множителей exp(-2*pi*i*j/n) для j = 0..n-1.
+    Значения на осях (1, -i, -1, i) точные.
+    :param n (int): Размер преобразования.
+    :return:
+        tuple[complex, ...]: Таблица множителей.
+    """
+    table = []
+    for j in range(n):
+        if (4 * j) % n == 0:
+            table.append((1 + 0j, -1j, -1 + 0j, 1j)[4 * j // n])
+        else:
+            angle = -2 * pi * j / n
+            table.append(complex(cos(angle), sin(angle)))
+    return tuple(table)
+
+
+def _smallest_factor(n):
+    """
+    :return:
+        int: Наименьший простой делитель n (n > 1).
+    """
+    if n % 2 == 0:
+        return 2
+    p = 3
+    while p * p <= n:
+        if n % p == 0:
+            return p
+        p += 2
+    return n
+
+
+def _fft_radix2(values):
+    """
+    Итеративное БПФ по основанию 2 (длина — степень двойки).
+    :param values (list[complex]): Входная последовательность.
+    :return:
+        list[complex]: Прямое ДПФ.
+    """
+    n = len(values)
+    result = list(values)
+    # перестановка с обращением битов
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            result[i], result[j] = result[j], result[i]
+    table = _twiddles(n)
+    size = 2
+    while size <= n:
+        half = size // 2
+        step = n // size
+        for start in range(0, n, size):
+            for k in range(half):
+                u = result[start + k]
+                v = result[start + k + half] * table[k * step]
+                result[start + k] = u + v
+                result[start + k + half] = u - v
+        size *= 2
+    return result
+
+
+def _fft_mixed(values):
+    """
+    Рекурсивное БПФ со смешанным основанием (алгоритм Кули–Тьюки по наименьшему
+    простому делителю длины, для простых длин — прямое ДПФ).
+    :param values (list[complex]): Входная последовательность.
+    :return:
+        list[complex]: Прямое ДПФ.
+    """
+    n = len(values)
+    if n <= 1:
+        return list(values)
+    if n & (n - 1) == 0:
+        return _fft_radix2(values)
+    table = _twiddles(n)
+    p = _smallest_factor(n)
+    if p == n:
+        return [sum(values[j] * table[(j * k) % n] for j in range(n)) for k in range(n)]
+    m = n // p
+    parts = [_fft_mixed(values[r::p]) for r in range(p)]
+    return [sum(parts[r][k % m] * table[(r * k) % n] for r in range(p)) for k in range(n)]
+
+
+def _transform(values, inverse, engine):
+    """
+    Общая часть прямого и обратного преобразования во float.
+    :return:
+        list[Complex]: Результат в режиме "float".
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}")
+    data = [_to_builtin(value) for value in values]
+    n = len(data)
+    if n == 0:
+        return []
+    if engine == "numpy" or (engine == "auto" and np is not None):
+        if np is None:
+            raise ImportError("numpy is required for engine='numpy'")
+        array = np.asarray(data, dtype=np.complex128)
+        result = (np.fft.ifft(array) if inverse else np.fft.fft(array)).tolist()
+    elif inverse:
+        # обратное преобразование через прямое: ifft(x) = conj(fft(conj(x))) / n
+        result = [z.conjugate() / n for z in _fft_mixed([z.conjugate() for z in data])]
+    else:
+        result = _fft_mixed(data)
+    return [Complex._from_complex(z) for z in result]
+
+
+def fft(values, engine="auto"):
+    """
+    Функция прямого дискретного преобразования Фурье X[k] = sum x[j] * exp(-2*pi*i*j*k/n).
+    Вычисляется во float: через numpy.fft, если NumPy установлен, иначе чистым Python
+    (по основанию 2 для длин-степеней двойки, со смешанным основанием для остальных).
+    :param values (iterable[Complex | Rational | int | float | complex]): Входная последовательность.
+    :param engine: "auto", "numpy" или "python".
+    :return:
+        list[Complex]: Спектр в режиме "float".
+    """
+    return _transform(values, False, engine)
+
+
+def ifft(values, engine="auto"):
+    """
+    Функция обратного дискретного преобразования Фурье (с нормировкой 1/n).
+    :param values (iterable[Complex | Rational | int | float | complex]): Спектр.
+    :param engine: "auto", "numpy" или "python".
+    :return:
+        list[Complex]: Восстановленная последовательность в режиме "float".
+    """
+    return _transform(values, True, engine)
+
+
+def dft(values):
+    """
+    Прямое ДПФ по определению за O(n^2) операторами Complex.
+    Используется как эталон в тестах и бенчмарке.
+    :param values (list[Complex]): Входная последовательность.
+    :return:
+        list[Complex]: Спектр.
+    """
+    n = len(values)
+    roots = Complex.roots_of_unity(n) if n else []
+    result = []
+    for k in range(n):
+        total = Complex(0, 0, backend="exact")
+        for j, value in enumerate(values):
+            # exp(-2*pi*i*j*k/n) = корень с номером -j*k
+            total = total + value * roots[(-j * k) % n]
+        result.append(total)
+    return result
+
+
+def _gaussian_integers(values):
+    """
+    Приводит точные комплексные числа к общему знаменателю.
+    :param values (list[Complex]): Последовательность в режиме "exact".
+    :return:
+        tuple[list[int], list[int], int]: Числители действительных и мнимых частей и общий знаменатель.
+    """
+    denominator = 1
+    for value in values:
+        for part in (value._real, value._imag):
+            d = part._denominator
+            if denominator % d:
+                denominator = denominator // gcd(denominator, d) * d
+    reals = [value._real._numerator * (denominator // value._real._denominator) for value in values]
+    imags = [value._imag._numerator * (denominator // value._imag._denominator) for value in values]
+    return reals, imags, denominator
+
+
+def _pack(digits, width):
+    """
+    Упаковывает целые (возможно, отрицательные) числа в одно большое целое sum(digits[i] * 2^(width*i)).
+    :param digits (list[int]): Числа.
+    :param width (int): Ширина разряда в битах (кратна 8).
+    :return:
+        int: Упакованное число.
+    """
+    size = width // 8
+    positive = b"".join((d if d > 0 else 0).to_bytes(size, "little") for d in digits)
+    negative = b"".join((-d if d < 0 else 0).to_bytes(size, "little") for d in digits)
+    return int.from_bytes(positive, "little") - int.from_bytes(negative, "little")
+
+
+def _unpack(value, count, width):
+    """
+    Обратная к _pack операция для разрядов по модулю меньше 2^(width-1).
+    :param value (int): Упакованное число.
+    :param count (int): Число разрядов.
+    :param width (int): Ширина разряда в битах (кратна 8).
+    :return:
+        list[int]: Разряды.
+    """
+    size = width // 8
+    half = 1 << (width - 1)
+    # смещение на half в каждом разряде делает все разряды неотрицательными
+    offset = int.from_bytes((b"\x00" * (size - 1) + b"\x80") * count, "little")
+    data = (value + offset).to_bytes(size * count, "little")
+    return [int.from_bytes(data[i * size:(i + 1) * size], "little") - half for i in range(count)]
+
+
+def _backend_of(value):
+    """
+    :return:
+        str | None: "exact" для Rational и int, иначе None (вычислитель по умолчанию).
+    """
+    return "exact" if isinstance(value, (Rational, int)) else None
+
+
+def convolve(a, b):
+    """
+    Функция линейной свёртки двух последовательностей: c[k] = sum a[j] * b[k - j].
+    Для точных входов (гауссовы рациональные числа) результат точный: последовательности
+    приводятся к общему знаменателю, упаковываются в большие целые (подстановка Кронекера)
+    и перемножаются за три умножения целых. Если хотя бы одно число в режиме "float",
+    свёртка вычисляется через БПФ во float.
+    :param a (list[Complex | Rational | int]): Первая последовательность.
+    :param b (list[Complex | Rational | int]): Вторая последовательность.
+    :return:
+        list[Complex]: Свёртка длины len(a) + len(b) - 1.
+    """
+    # Rational и int точные, поэтому поднимаются до Complex в режиме "exact" при любом вычислителе по умолчанию
+    a = [value if isinstance(value, Complex) else Complex(value, backend=_backend_of(value)) for value in a]
+    b = [value if isinstance(value, Complex) else Complex(value, backend=_backend_of(value)) for value in b]
+    if not a or not b:
+        return []
+    count = len(a) + len(b) - 1
+    if any(value._real.__class__ is float for value in a + b):
+        size = 1 << (count - 1).bit_length()
+        fa = fft(a + [Complex(0, 0, backend="float")] * (size - len(a)))
+        fb = fft(b + [Complex(0, 0, backend="float")] * (size - len(b)))
+        return ifft([x * y for x, y in zip(fa, fb)])[:count]
+
+    ar, ai, da = _gaussian_integers(a)
+    br, bi, db = _gaussian_integers(b)
+    bound = 2 * min(len(a), len(b)) * max(map(abs, ar + ai)) * max(map(abs, br + bi))
+    width = (bound.bit_length() + 2 + 7) // 8 * 8
+    xr, xi = _pack(ar, width), _pack(ai, width)
+    yr, yi = _pack(br, width), _pack(bi, width)
+    # (xr + i*xi)(yr + i*yi) за три умножения
+    k1 = yr * (xr + xi)
+    k2 = xr * (yi - yr)
+    k3 = xi * (yr + yi)
+    reals = _unpack(k1 - k3, count, width)
+    imags = _unpack(k1 + k2, count, width)
+    denominator = da * db
+    return [Complex._from_parts(Rational(re, denominator), Rational(im, denominator))
+            for re, im in zip(reals, imags)]
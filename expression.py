@@ -0,0 +1,348 @@
+from rational import Rational
+from complex import Complex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# операции выражений: имя -> (запись в сгенерированном коде, коммутативность)
+OPERATIONS = {
+    "add": ("{0} + {1}", True),
+    "sub": ("{0} - {1}", False),
+    "mul": ("{0} * {1}", True),
+    "div": ("{0} / {1}", False),
+    "neg": ("-{0}", False),
+    "pow": ("{0} ** {1}", False),
+}
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (Complex, Rational, int, float, complex)) and not isinstance(value, bool)
+
+
+def _constant_key(value):
+    """
+    Ключ константы для устранения повторов: равные числа разных типов или режимов
+    (0.5 и Rational(1, 2)) дают разные результаты вычислений и не объединяются.
+    """
+    if isinstance(value, Complex):
+        return "Complex", value.backend, value
+    return value.__class__.__name__, value
+
+
+class Expression:
+    """
+    Узел графа выражения над Complex и Rational.
+    Операторы + - * / ** и унарный минус не вычисляют значение, а строят новый узел;
+    одинаковые подвыражения объединяются и вычисляются один раз при компиляции (compile_plan).
+    Атрибуты:
+        op (str): "var", "const" или имя операции из OPERATIONS.
+        args (tuple): Операнды (узлы Expression; для "var" — имя, для "const" — число, для "pow" — ещё и степень).
+    """
+    __slots__ = ('op', 'args')
+
+    def __init__(self, op: str, args: tuple):
+        self.op = op
+        self.args = args
+
+    @staticmethod
+    def _wrap(value):
+        if isinstance(value, Expression):
+            return value
+        elif _is_number(value):
+            return Expression("const", (value,))
+        raise TypeError("Unsupported operand type")
+
+    def __add__(self, other):
+        """
+        :param other (Expression | Complex | Rational | int | float | complex): Слагаемое.
+        :return:
+            Expression: Узел суммы.
+        """
+        return Expression("add", (self, Expression._wrap(other)))
+
+    def __sub__(self, other):
+        """
+        :param other (Expression | Complex | Rational | int | float | complex): Вычитаемое.
+        :return:
+            Expression: Узел разности.
+        """
+        return Expression("sub", (self, Expression._wrap(other)))
+
+    def __mul__(self, other):
+        """
+        :param other (Expression | Complex | Rational | int | float | complex): Множитель.
+        :return:
+            Expression: Узел произведения.
+        """
+        return Expression("mul", (self, Expression._wrap(other)))
+
+    def __truediv__(self, other):
+        """
+        :param other (Expression | Complex | Rational | int | float | complex): Делитель.
+        :return:
+            Expression: Узел частного.
+        """
+        return Expression("div", (self, Expression._wrap(other)))
+
+    def __neg__(self):
+        return Expression("neg", (self,))
+
+    def __pow__(self, other: int):
+        """
+        :param other (int): Целая степень.
+        :return:
+            Expression: Узел степени.
+        """
+        if not isinstance(other, int):
+            raise TypeError("Exponent must be an integer")
+        return Expression("pow", (self, other))
+
+    def __repr__(self):
+        if self.op == "var":
+            return self.args[0]
+        elif self.op == "const":
+            return repr(self.args[0])
+        elif self.op == "neg":
+            return f"(-{self.args[0]!r})"
+        elif self.op == "pow":
+            return f"({self.args[0]!r} ** {self.args[1]})"
+        return "(" + OPERATIONS[self.op][0].format(*map(repr, self.args)) + ")"
+
+
+def variable(name: str):
+    """
+    :param name (str): Имя переменной (идентификатор Python).
+    :return:
+        Expression: Переменная выражения.
+    """
+    # имена с подчёркиванием зарезервированы за регистрами плана
+    if not name.isidentifier() or name.startswith("_"):
+        raise ValueError(f"Variable name must be an identifier not starting with '_': {name!r}")
+    return Expression("var", (name,))
+
+
+def variables(names: str):
+    """
+    :param names (str): Имена через пробел, например "x y z".
+    :return:
+        tuple[Expression, ...]: Переменные.
+    """
+    return tuple(variable(name) for name in names.split())
+
+
+def constant(value):
+    """
+    :param value (Complex | Rational | int | float | complex): Число.
+    :return:
+        Expression: Константа выражения.
+    """
+    return Expression._wrap(value)
+
+
+def _lift(value, backend):
+    """
+    Приводит константу к Complex с заданным вычислителем.
+    """
+    if isinstance(value, Complex):
+        return value.to_float() if backend == "float" else value
+    elif isinstance(value, complex):
+        return Complex(value.real, value.imag, backend=backend)
+    return Complex(value, backend=backend)
+
+
+def _fold(op, values):
+    """
+    Вычисляет операцию над константами при компиляции.
+    """
+    if op == "neg":
+        return -values[0]
+    if op == "pow":
+        # int ** -k дал бы float, поэтому целое основание сначала становится дробью
+        base = Rational(values[0], 1) if isinstance(values[0], int) else values[0]
+        return base ** values[1]
+    # у Rational и int нет отражённых операторов, поэтому оба операнда приводятся к общему типу
+    if any(isinstance(v, (Complex, float, complex)) for v in values):
+        inexact = any(isinstance(v, (float, complex)) or isinstance(v, Complex) and v.backend == "float"
+                      for v in values)
+        a, b = (_lift(v, "float" if inexact else "exact") for v in values)
+    else:
+        a, b = (Rational(v, 1) if isinstance(v, int) else v for v in values)
+    return {"add": a.__add__, "sub": a.__sub__, "mul": a.__mul__, "div": a.__truediv__}[op](b)
+
+
+def _to_builtin(value) -> complex:
+    """
+    Приводит константу к встроенному complex для вычисления над массивами NumPy.
+    """
+    if isinstance(value, Complex):
+        return complex(float(value.real), float(value.imag))
+    elif isinstance(value, complex):
+        return value
+    return complex(float(value))
+
+
+class Plan:
+    """
+    Скомпилированный граф выражения: плоский список инструкций над регистрами
+    и функция Python, сгенерированная из этого списка.
+    Вызов плана выполняет инструкции подряд, без обхода графа и без разбора типов
+    узлов; операции выполняют сами входные значения, поэтому один план работает и со
+    скалярами (Complex, Rational), и с массивами (ComplexArray, ComplexIntervalArray,
+    np.ndarray), если все входы одного вида.
+    Атрибуты:
+        variables (tuple[str, ...]): Имена входов в порядке позиционных аргументов.
+        instructions (tuple[tuple, ...]): Инструкции (операция, регистр результата, операнды).
+        constants (tuple): Константы в регистрах вида _c<k>.
+        outputs (tuple[str, ...]): Регистры результатов.
+        source (str): Сгенерированный код.
+    """
+    __slots__ = ('variables', 'instructions', 'constants', 'outputs', 'source', '_single', '_function',
+                 '_float_constants')
+
+    def __init__(self, variables, instructions, constants, outputs, single):
+        self.variables = tuple(variables)
+        self.instructions = tuple(instructions)
+        self.constants = tuple(constants)
+        self.outputs = tuple(outputs)
+        self._single = single
+        lines = [f"def plan({', '.join(self.variables + ('_constants',))}):"]
+        if self.constants:
+            names = ", ".join(f"_c{k}" for k in range(len(self.constants)))
+            lines.append(f"    {names}, = _constants")
+        for op, target, operands in self.instructions:
+            lines.append(f"    {target} = {OPERATIONS[op][0].format(*operands)}")
+        result = self.outputs[0] if single else "(" + ", ".join(self.outputs) + ",)"
+        lines.append(f"    return {result}")
+        self.source = "\n".join(lines) + "\n"
+        namespace = {}
+        exec(compile(self.source, "<expression plan>", "exec"), namespace)
+        self._function = namespace["plan"]
+        self._float_constants = None
+
+    def __len__(self):
+        """
+        :return:
+            int: Число инструкций.
+        """
+        return len(self.instructions)
+
+    def __call__(self, *args, **kwargs):
+        """
+        Функция вычисления плана.
+        Если среди входов есть массив NumPy, константы подставляются как встроенный complex.
+        :param args: Значения переменных в порядке variables.
+        :param kwargs: Значения переменных по именам.
+        :return:
+            Значение выражения (или кортеж значений, если план собран из нескольких выражений).
+        """
+        if kwargs:
+            if len(args) + len(kwargs) != len(self.variables):
+                raise TypeError(f"Plan expects variables {self.variables}")
+            args = args + tuple(kwargs[name] for name in self.variables[len(args):])
+        elif len(args) != len(self.variables):
+            raise TypeError(f"Plan expects variables {self.variables}")
+        constants = self.constants
+        if np is not None and any(isinstance(arg, np.ndarray) for arg in args):
+            if self._float_constants is None:
+                self._float_constants = tuple(_to_builtin(c) for c in self.constants)
+            constants = self._float_constants
+        return self._function(*args, constants)
+
+    def __repr__(self):
+        return f"Plan(variables={self.variables}, instructions={len(self.instructions)})"
+
+
+def compile_plan(outputs, variables=None):
+    """
+    Функция компиляции выражения (или нескольких выражений) в план вычисления.
+    Одинаковые подвыражения, в том числе построенные независимо, объединяются:
+    узлы сравниваются по операции и операндам, для + и * — без учёта порядка операндов.
+    Подвыражения из одних констант вычисляются сразу (точно). Константа в
+    некоммутативной операции записывается так, чтобы вычисляемое значение было левым
+    операндом (у Complex нет отражённых операторов): c - x как -x + c, c / x как x ** -1 * c.
+    :param outputs (Expression | list[Expression]): Выражение или список выражений.
+    :param variables (list[str] | str | None): Порядок входов; по умолчанию — имена переменных по алфавиту.
+    :return:
+        Plan: Скомпилированный план.
+    """
+    single = isinstance(outputs, Expression) or _is_number(outputs)
+    roots = [Expression._wrap(outputs)] if single else [Expression._wrap(e) for e in outputs]
+
+    registers = {}      # id(узла) -> регистр
+    keys = {}           # структурный ключ -> регистр
+    folded = {}         # регистр константы -> значение
+    constants = []
+    instructions = []
+    names = set()
+
+    def constant_register(value):
+        key = ("const",) + _constant_key(value)
+        if key not in keys:
+            keys[key] = f"_c{len(constants)}"
+            constants.append(value)
+            folded[keys[key]] = value
+        return keys[key]
+
+    def emit(op, operands):
+        commutative = OPERATIONS[op][1]
+        key = (op,) + (tuple(sorted(operands)) if commutative else tuple(operands))
+        if key not in keys:
+            keys[key] = target = f"_r{len(instructions)}"
+            instructions.append((op, target, tuple(operands)))
+        return keys[key]
+
+    # обход в обратном порядке без рекурсии: узел обрабатывается после своих операндов
+    stack = [(root, False) for root in reversed(roots)]
+    while stack:
+        node, ready = stack.pop()
+        if id(node) in registers:
+            continue
+        children = [arg for arg in node.args if isinstance(arg, Expression)] if node.op not in ("var", "const") else []
+        if not ready and children:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children) if id(child) not in registers)
+            continue
+        if node.op == "var":
+            name = node.args[0]
+            names.add(name)
+            register = name
+        elif node.op == "const":
+            register = constant_register(node.args[0])
+        else:
+            operands = [registers[id(arg)] for arg in children]
+            if all(operand in folded for operand in operands):
+                values = [folded[operand] for operand in operands]
+                if node.op == "pow":
+                    values.append(node.args[1])
+                register = constant_register(_fold(node.op, values))
+            elif node.op == "pow":
+                register = emit("pow", [operands[0], str(node.args[1])])
+            elif node.op in ("add", "mul") and operands[0] in folded:
+                register = emit(node.op, [operands[1], operands[0]])
+            elif node.op == "sub" and operands[0] in folded:
+                register = emit("add", [emit("neg", [operands[1]]), operands[0]])
+            elif node.op == "div" and operands[0] in folded:
+                register = emit("mul", [emit("pow", [operands[1], "-1"]), operands[0]])
+            else:
+                register = emit(node.op, operands)
+        registers[id(node)] = register
+
+    if variables is None:
+        variables = sorted(names)
+    elif isinstance(variables, str):
+        variables = variables.split()
+    missing = names - set(variables)
+    if missing:
+        raise ValueError(f"Expression uses variables not listed in variables: {sorted(missing)}")
+    outputs = [registers[id(root)] for root in roots]
+    # промежуточные свёрнутые константы в план не попадают
+    used = [name for name in dict.fromkeys(
+        [operand for _, _, operands in instructions for operand in operands] + outputs) if name.startswith("_c")]
+    renamed = {name: f"_c{k}" for k, name in enumerate(used)}
+    constants = [constants[int(name[2:])] for name in used]
+    instructions = [(op, target, tuple(renamed.get(operand, operand) for operand in operands))
+                    for op, target, operands in instructions]
+    outputs = [renamed.get(output, output) for output in outputs]
+    return Plan(variables, instructions, constants, outputs, single)
@@ -0,0 +1,548 @@
+from math import gcd
+
+from rational import Rational
+from complex import Complex, _combine_hash
+
+
+def _round_div(n: int, m: int) -> int:
+    """
+    Округление n / m к ближайшему целому (половины округляются вверх).
+    :param n (int): Делимое.
+    :param m (int): Положительный делитель.
+    :return:
+        int: Ближайшее к n / m целое.
+    """
+    return (2 * n + m) // (2 * m)
+
+
+class GaussianInt:
+    """
+    Гауссово целое число a + bi с частями типа int.
+    Сложение, вычитание, умножение и возведение в неотрицательную степень остаются в целых
+    числах и не вычисляют НОД. Деление / возвращает точный Complex; для деления с остатком
+    есть //, % и divmod, для НОД — метод gcd.
+    С Complex, Rational и FixedDenomComplex число участвует в операторах наравне с Complex
+    (результат — Complex или FixedDenomComplex).
+    Атрибуты:
+        _real (int): Действительная часть.
+        _imag (int): Мнимая часть.
+    """
+    __slots__ = ('_real', '_imag')
+
+    def __init__(self, real: int, imag: int = 0):
+        """
+        :param real (int): Действительная часть.
+        :param imag (int): Мнимая часть.
+        Исключения:
+            TypeError: Если части не целые.
+        """
+        if not isinstance(real, int) or not isinstance(imag, int):
+            raise TypeError("Gaussian integer parts must be integers")
+        self._real = real
+        self._imag = imag
+
+    @classmethod
+    def _from_parts(cls, real: int, imag: int):
+        """
+        Создаёт гауссово целое из готовых частей без проверки типов.
+        :return:
+            GaussianInt: Новое число.
+        """
+        g = object.__new__(cls)
+        g._real = real
+        g._imag = imag
+        return g
+
+    @property
+    def real(self) -> int:
+        """
+        :return:
+            int: Действительная часть.
+        """
+        return self._real
+
+    @property
+    def imag(self) -> int:
+        """
+        :return:
+            int: Мнимая часть.
+        """
+        return self._imag
+
+    def norm(self) -> int:
+        """
+        :return:
+            int: Норма a^2 + b^2.
+        """
+        return self._real * self._real + self._imag * self._imag
+
+    def conjugate(self):
+        """
+        :return:
+            GaussianInt: Сопряжённое число a - bi.
+        """
+        return GaussianInt._from_parts(self._real, -self._imag)
+
+    def to_complex(self):
+        """
+        :return:
+            Complex: То же число в режиме "exact".
+        """
+        return Complex._from_parts(Rational._from_reduced(self._real, 1), Rational._from_reduced(self._imag, 1))
+
+    def __add__(self, other):
+        """
+        :param other (GaussianInt | int | FixedDenomComplex | Complex | Rational): Слагаемое.
+        :return:
+            GaussianInt | FixedDenomComplex | Complex: Сумма.
+        """
+        if isinstance(other, GaussianInt):
+            return GaussianInt._from_parts(self._real + other._real, self._imag + other._imag)
+        elif isinstance(other, int):
+            return GaussianInt._from_parts(self._real + other, self._imag)
+        elif isinstance(other, FixedDenomComplex):
+            return other + self
+        return self.to_complex() + other
+
+    def __sub__(self, other):
+        """
+        :param other (GaussianInt | int | FixedDenomComplex | Complex | Rational): Вычитаемое.
+        :return:
+            GaussianInt | FixedDenomComplex | Complex: Разность.
+        """
+        if isinstance(other, GaussianInt):
+            return GaussianInt._from_parts(self._real - other._real, self._imag - other._imag)
+        elif isinstance(other, int):
+            return GaussianInt._from_parts(self._real - other, self._imag)
+        elif isinstance(other, FixedDenomComplex):
+            return -other + self
+        return self.to_complex() - other
+
+    def __mul__(self, other):
+        """
+        :param other (GaussianInt | int | FixedDenomComplex | Complex | Rational): Множитель.
+        :return:
+            GaussianInt | FixedDenomComplex | Complex: Произведение.
+        """
+        if isinstance(other, GaussianInt):
+            a, b, c, d = self._real, self._imag, other._real, other._imag
+            return GaussianInt._from_parts(a * c - b * d, a * d + b * c)
+        elif isinstance(other, int):
+            return GaussianInt._from_parts(self._real * other, self._imag * other)
+        elif isinstance(other, FixedDenomComplex):
+            return other * self
+        return self.to_complex() * other
+
+    def __truediv__(self, other):
+        """
+        Точное деление; результат всегда Complex, даже если деление нацело.
+        :param other (GaussianInt | int | FixedDenomComplex | Complex | Rational): Делитель.
+        :return:
+            Complex: Частное.
+        """
+        if isinstance(other, (GaussianInt, FixedDenomComplex)):
+            other = other.to_complex()
+        return self.to_complex() / other
+
+    def __divmod__(self, other):
+        """
+        Деление с остатком: частное — ближайшее гауссово целое к self / other,
+        поэтому норма остатка не больше половины нормы делителя.
+        Исключения:
+            ZeroDivisionError: Если делитель равен нулю.
+        :param other (GaussianInt | int): Делитель.
+        :return:
+            tuple[GaussianInt, GaussianInt]: Частное q и остаток r, self = q * other + r.
+        """
+        if isinstance(other, int):
+            other = GaussianInt._from_parts(other, 0)
+        elif not isinstance(other, GaussianInt):
+            raise TypeError("Unsupported operand type")
+        a, b, c, d = self._real, self._imag, other._real, other._imag
+        norm = c * c + d * d
+        if norm == 0:
+            raise ZeroDivisionError("Gaussian integer division by zero")
+        # self * conj(other) / norm, округлённое к ближайшему
+        x = _round_div(a * c + b * d, norm)
+        y = _round_div(b * c - a * d, norm)
+        return GaussianInt._from_parts(x, y), GaussianInt._from_parts(a - (x * c - y * d), b - (x * d + y * c))
+
+    def __floordiv__(self, other):
+        """
+        :param other (GaussianInt | int): Делитель.
+        :return:
+            GaussianInt: Частное с округлением к ближайшему (см. __divmod__).
+        """
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        """
+        :param other (GaussianInt | int): Делитель.
+        :return:
+            GaussianInt: Остаток, норма которого не больше половины нормы делителя (см. __divmod__).
+        """
+        return divmod(self, other)[1]
+
+    def gcd(self, other):
+        """
+        Функция вычисления НОД алгоритмом Евклида.
+        Из четырёх ассоциированных делителей возвращается лежащий в первой четверти
+        (действительная часть положительна, мнимая неотрицательна); НОД двух нулей — ноль.
+        :param other (GaussianInt | int): Второе число.
+        :return:
+            GaussianInt: Наибольший общий делитель.
+        """
+        if isinstance(other, int):
+            other = GaussianInt._from_parts(other, 0)
+        a, b = self, other
+        while b._real or b._imag:
+            a, b = b, divmod(a, b)[1]
+        x, y = a._real, a._imag
+        # умножение на -1, i или -i переводит делитель в первую четверть
+        if x <= 0 and y > 0:
+            x, y = y, -x
+        elif x < 0 and y <= 0:
+            x, y = -x, -y
+        elif x >= 0 and y < 0:
+            x, y = -y, x
+        return GaussianInt._from_parts(x, y)
+
+    def __pow__(self, other: int):
+        """
+        :param other (int): Степень; отрицательная степень даёт Complex.
+        :return:
+            GaussianInt | Complex: Результат возведения в степень.
+        """
+        if not isinstance(other, int):
+            raise TypeError("Exponent must be an integer")
+        if other < 0:
+            return self.to_complex() ** other
+        result = GaussianInt._from_parts(1, 0)
+        base = self
+        while other:
+            if other & 1:
+                result = result * base
+            other >>= 1
+            if other:
+                base = base * base
+        return result
+
+    def __neg__(self):
+        """
+        :return:
+            GaussianInt: Противоположное число.
+        """
+        return GaussianInt._from_parts(-self._real, -self._imag)
+
+    def __eq__(self, other):
+        """
+        :param other (GaussianInt | int | FixedDenomComplex | Complex | Rational | float): Число.
+        :return:
+            bool: True, если числа равны.
+        """
+        if isinstance(other, GaussianInt):
+            return self._real == other._real and self._imag == other._imag
+        elif isinstance(other, int):
+            return self._real == other and self._imag == 0
+        elif isinstance(other, FixedDenomComplex):
+            return other == self
+        return self.to_complex() == other
+
+    def __ne__(self, other):
+        """
+        :param other (GaussianInt | int | FixedDenomComplex | Complex | Rational | float): Число.
+        :return:
+            bool: True, если числа не равны.
+        """
+        return not self == other
+
+    def __hash__(self):
+        """
+        :return:
+            int: Хеш, совпадающий с хешем равного Complex.
+        """
+        return _combine_hash(hash(self._real), hash(self._imag))
+
+    def __str__(self):
+        """
+        :return:
+            str: Запись вида "(a + bi)", как у Complex.
+        """
+        if self._imag >= 0:
+            return f"({self._real} + {self._imag}i)"
+        return f"({self._real} - {-self._imag}i)"
+
+    def __repr__(self):
+        """
+        :return:
+            str: Запись вида "GaussianInt(a, b)".
+        """
+        return f"GaussianInt({self._real}, {self._imag})"
+
+
+class FixedDenomComplex:
+    """
+    Комплексное число (a + bi) / scale с общим знаменателем scale для обеих частей,
+    например степенью двойки или десяти. Знаменатель не сокращается: сложение и вычитание
+    чисел с одинаковым scale складывают только целые числители, при разных scale (одна
+    степень делит другую) числитель домножается; умножение перемножает числители
+    и знаменатели. НОД не вычисляется ни в одной из этих операций.
+    Деление / возвращает точный Complex.
+    Атрибуты:
+        _real (int): Числитель действительной части.
+        _imag (int): Числитель мнимой части.
+        _scale (int): Общий положительный знаменатель.
+    """
+    __slots__ = ('_real', '_imag', '_scale')
+
+    def __init__(self, real: int, imag: int = 0, scale: int = 1):
+        """
+        :param real (int): Числитель действительной части.
+        :param imag (int): Числитель мнимой части.
+        :param scale (int): Общий знаменатель.
+        Исключения:
+            TypeError: Если аргументы не целые.
+            ValueError: Если scale не положителен.
+        """
+        if not all(isinstance(x, int) for x in (real, imag, scale)):
+            raise TypeError("Numerators and scale must be integers")
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        self._real = real
+        self._imag = imag
+        self._scale = scale
+
+    @classmethod
+    def _from_parts(cls, real: int, imag: int, scale: int):
+        """
+        Создаёт число из готовых числителей и знаменателя без проверок.
+        :return:
+            FixedDenomComplex: Новое число.
+        """
+        f = object.__new__(cls)
+        f._real = real
+        f._imag = imag
+        f._scale = scale
+        return f
+
+    @staticmethod
+    def from_complex(value, scale: int | None = None):
+        """
+        Функция перевода точного числа в представление с общим знаменателем.
+        Исключения:
+            ValueError: Если scale не делится на знаменатели частей (число непредставимо точно).
+        :param value (Complex | GaussianInt | Rational | int): Число; Complex в режиме "float" не допускается.
+        :param scale (int | None): Общий знаменатель; по умолчанию НОК знаменателей частей.
+        :return:
+            FixedDenomComplex: То же число.
+        """
+        if isinstance(value, GaussianInt):
+            value = value.to_complex()
+        elif not isinstance(value, Complex):
+            value = Complex(value, backend="exact")
+        if value._real.__class__ is float:
+            raise ValueError("Cannot represent a float-backed Complex exactly")
+        real, imag = value._real, value._imag
+        if scale is None:
+            d1, d2 = real._denominator, imag._denominator
+            scale = d1 // gcd(d1, d2) * d2
+        elif scale <= 0:
+            raise ValueError("scale must be positive")
+        if scale % real._denominator or scale % imag._denominator:
+            raise ValueError(f"scale {scale} is not a multiple of the denominators")
+        return FixedDenomComplex._from_parts(real._numerator * (scale // real._denominator),
+                                             imag._numerator * (scale // imag._denominator), scale)
+
+    @property
+    def scale(self) -> int:
+        """
+        :return:
+            int: Общий знаменатель.
+        """
+        return self._scale
+
+    @property
+    def numerators(self):
+        """
+        :return:
+            tuple[int, int]: Числители действительной и мнимой частей.
+        """
+        return self._real, self._imag
+
+    @property
+    def real(self):
+        """
+        :return:
+            Rational: Действительная часть (сокращённая).
+        """
+        return Rational(self._real, self._scale)
+
+    @property
+    def imag(self):
+        """
+        :return:
+            Rational: Мнимая часть (сокращённая).
+        """
+        return Rational(self._imag, self._scale)
+
+    def to_complex(self):
+        """
+        :return:
+            Complex: То же число в режиме "exact".
+        """
+        return Complex._from_parts(Rational(self._real, self._scale), Rational(self._imag, self._scale))
+
+    def with_scale(self, scale: int):
+        """
+        Функция перевода к другому общему знаменателю без потери точности.
+        Исключения:
+            ValueError: Если число непредставимо точно со знаменателем scale.
+        :param scale (int): Новый знаменатель.
+        :return:
+            FixedDenomComplex: То же число со знаменателем scale.
+        """
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        a, b = self._real * scale, self._imag * scale
+        if a % self._scale or b % self._scale:
+            raise ValueError(f"value is not representable with scale {scale}")
+        return FixedDenomComplex._from_parts(a // self._scale, b // self._scale, scale)
+
+    def _aligned(self, other):
+        """
+        Приводит два числа к общему знаменателю.
+        Если один знаменатель делит другой (степени одного основания), НОД не вычисляется.
+        :return:
+            tuple[int, int, int, int, int]: Числители self, числители other и общий знаменатель.
+        """
+        s, t = self._scale, other._scale
+        if s == t:
+            return self._real, self._imag, other._real, other._imag, s
+        if s > t and s % t == 0:
+            k = s // t
+            return self._real, self._imag, other._real * k, other._imag * k, s
+        if t > s and t % s == 0:
+            k = t // s
+            return self._real * k, self._imag * k, other._real, other._imag, t
+        g = gcd(s, t)
+        u, v = t // g, s // g
+        return self._real * u, self._imag * u, other._real * v, other._imag * v, s * u
+
+    def _coerce(self, other):
+        """
+        :return:
+            FixedDenomComplex | None: other в виде FixedDenomComplex или None, если нужна точная арифметика Complex.
+        """
+        if isinstance(other, FixedDenomComplex):
+            return other
+        elif isinstance(other, GaussianInt):
+            return FixedDenomComplex._from_parts(other._real, other._imag, 1)
+        elif isinstance(other, int):
+            return FixedDenomComplex._from_parts(other, 0, 1)
+        return None
+
+    def __add__(self, other):
+        """
+        :param other (FixedDenomComplex | GaussianInt | int | Complex | Rational): Слагаемое.
+        :return:
+            FixedDenomComplex | Complex: Сумма.
+        """
+        f = self._coerce(other)
+        if f is None:
+            return self.to_complex() + other
+        a, b, c, d, scale = self._aligned(f)
+        return FixedDenomComplex._from_parts(a + c, b + d, scale)
+
+    def __sub__(self, other):
+        """
+        :param other (FixedDenomComplex | GaussianInt | int | Complex | Rational): Вычитаемое.
+        :return:
+            FixedDenomComplex | Complex: Разность.
+        """
+        f = self._coerce(other)
+        if f is None:
+            return self.to_complex() - other
+        a, b, c, d, scale = self._aligned(f)
+        return FixedDenomComplex._from_parts(a - c, b - d, scale)
+
+    def __mul__(self, other):
+        """
+        :param other (FixedDenomComplex | GaussianInt | int | Complex | Rational): Множитель.
+        :return:
+            FixedDenomComplex | Complex: Произведение (знаменатели перемножаются).
+        """
+        f = self._coerce(other)
+        if f is None:
+            return self.to_complex() * other
+        a, b, c, d = self._real, self._imag, f._real, f._imag
+        return FixedDenomComplex._from_parts(a * c - b * d, a * d + b * c, self._scale * f._scale)
+
+    def __truediv__(self, other):
+        """
+        :param other (FixedDenomComplex | GaussianInt | int | Complex | Rational): Делитель.
+        :return:
+            Complex: Частное.
+        """
+        if isinstance(other, (GaussianInt, FixedDenomComplex)):
+            other = other.to_complex()
+        return self.to_complex() / other
+
+    def __pow__(self, other: int):
+        """
+        :param other (int): Степень; отрицательная степень даёт Complex.
+        :return:
+            FixedDenomComplex | Complex: Результат возведения в степень.
+        """
+        if not isinstance(other, int):
+            raise TypeError("Exponent must be an integer")
+        if other < 0:
+            return self.to_complex() ** other
+        g = GaussianInt._from_parts(self._real, self._imag) ** other
+        return FixedDenomComplex._from_parts(g._real, g._imag, self._scale ** other)
+
+    def __neg__(self):
+        """
+        :return:
+            FixedDenomComplex: Противоположное число с тем же знаменателем.
+        """
+        return FixedDenomComplex._from_parts(-self._real, -self._imag, self._scale)
+
+    def __eq__(self, other):
+        """
+        :param other (FixedDenomComplex | GaussianInt | int | Complex | Rational | float): Число.
+        :return:
+            bool: True, если числа равны (сравнение перекрёстным умножением, без сокращения).
+        """
+        f = self._coerce(other)
+        if f is None:
+            return self.to_complex() == other
+        return self._real * f._scale == f._real * self._scale and self._imag * f._scale == f._imag * self._scale
+
+    def __ne__(self, other):
+        """
+        :param other (FixedDenomComplex | GaussianInt | int | Complex | Rational | float): Число.
+        :return:
+            bool: True, если числа не равны.
+        """
+        return not self == other
+
+    def __hash__(self):
+        """
+        :return:
+            int: Хеш, совпадающий с хешем равного Complex.
+        """
+        return hash(self.to_complex())
+
+    def __str__(self):
+        """
+        :return:
+            str: Запись равного Complex (части в несократимом виде).
+        """
+        return str(self.to_complex())
+
+    def __repr__(self):
+        """
+        :return:
+            str: Запись вида "FixedDenomComplex(a, b, scale=d)" с несокращёнными числителями.
+        """
+        return f"FixedDenomComplex({self._real}, {self._imag}, scale={self._scale})"
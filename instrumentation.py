@@ -0,0 +1,345 @@
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import wraps
+from math import gcd as _gcd
+
+# переменная окружения, включающая инструментирование при импорте rational и complex
+ENV_VARIABLE = "RATIONAL_INSTRUMENT"
+# файл, в который при выходе из процесса записывается снимок (*.prom — формат Prometheus, иначе JSON)
+ENV_OUTPUT = "RATIONAL_INSTRUMENT_OUTPUT"
+
+# инструментируемые методы; статические методы и методы класса не оборачиваются,
+# кроме Rational._from_reduced, у которого считается только число вызовов
+RATIONAL_METHODS = (
+    "__init__", "__add__", "__sub__", "__mul__", "__truediv__", "__pow__", "__neg__", "__abs__",
+    "__eq__", "__ne__", "__hash__", "__float__", "__str__", "reduce",
+)
+COMPLEX_METHODS = (
+    "__init__", "__add__", "__sub__", "__mul__", "__truediv__", "__pow__", "__neg__",
+    "__eq__", "__ne__", "__hash__", "fma", "inverse", "powers", "to_exact", "to_float",
+)
+
+_statistics = None
+_depth = 0
+_originals = []
+_patched = set()
+
+
+def _bucket(value):
+    """
+    Верхняя граница корзины гистограммы: наименьшая степень двойки, не меньшая value.
+    :param value (int): Неотрицательное значение.
+    :return:
+        int: Граница корзины (0 для нуля).
+    """
+    return 1 << (value - 1).bit_length() if value > 0 else 0
+
+
+class Statistics:
+    """
+    Накопленная статистика инструментирования.
+    Атрибуты:
+        calls (dict): Число вызовов по методам ("Rational.__add__" -> int).
+        timings (dict): Гистограммы длительности вызовов по методам: граница корзины, нс -> число вызовов.
+            Время включает вложенные вызовы.
+        time_ns (dict): Суммарное время по методам, нс.
+        reductions (int): Число дробей, приведённых к каноническому виду сокращением на gcd
+            (вызовов Rational.__init__).
+        prereduced (int): Число дробей, созданных Rational._from_reduced из уже несократимой пары
+            (так строят результаты операторы, разбор и декодирование); вместе с reductions — все
+            созданные дроби.
+        gcd_calls (int): Число вызовов gcd в модулях rational и complex.
+        gcd_bits (int): Суммарная длина в битах наибольшего аргумента gcd (оценка стоимости).
+        numerator_bits (dict): Гистограмма длины в битах числителей результатов: граница корзины -> число.
+        denominator_bits (dict): То же для знаменателей.
+    """
+    __slots__ = ('calls', 'timings', 'time_ns', 'reductions', 'prereduced', 'gcd_calls', 'gcd_bits',
+                 'numerator_bits', 'denominator_bits')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Обнуляет статистику.
+        """
+        self.calls = {}
+        self.timings = {}
+        self.time_ns = {}
+        self.reductions = 0
+        self.prereduced = 0
+        self.gcd_calls = 0
+        self.gcd_bits = 0
+        self.numerator_bits = {}
+        self.denominator_bits = {}
+
+    def _record_call(self, name, elapsed):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.time_ns[name] = self.time_ns.get(name, 0) + elapsed
+        histogram = self.timings.setdefault(name, {})
+        bound = _bucket(elapsed)
+        histogram[bound] = histogram.get(bound, 0) + 1
+
+    def _record_rational(self, r):
+        bound = _bucket(r._numerator.bit_length())
+        self.numerator_bits[bound] = self.numerator_bits.get(bound, 0) + 1
+        bound = _bucket(r._denominator.bit_length())
+        self.denominator_bits[bound] = self.denominator_bits.get(bound, 0) + 1
+
+    def to_dict(self):
+        """
+        :return:
+            dict: Снимок статистики из встроенных типов (ключи гистограмм — строки).
+        """
+        def histogram(counts):
+            return {str(bound): counts[bound] for bound in sorted(counts)}
+
+        return {
+            "calls": dict(sorted(self.calls.items())),
+            "time_ns": dict(sorted(self.time_ns.items())),
+            "timings_ns": {name: histogram(counts) for name, counts in sorted(self.timings.items())},
+            "reductions": self.reductions,
+            "prereduced": self.prereduced,
+            "gcd_calls": self.gcd_calls,
+            "gcd_bits": self.gcd_bits,
+            "numerator_bits": histogram(self.numerator_bits),
+            "denominator_bits": histogram(self.denominator_bits),
+        }
+
+    def to_json(self, indent=None):
+        """
+        :param indent (int | None): Отступ, как в json.dumps.
+        :return:
+            str: Снимок статистики в JSON.
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "rational"):
+        """
+        Функция экспорта снимка в текстовом формате Prometheus.
+        Длительности и длины в битах выводятся как гистограммы с накопленными корзинами.
+        :param prefix (str): Префикс имён метрик.
+        :return:
+            str: Текст метрик.
+        """
+        lines = []
+
+        def header(name, kind, text):
+            lines.append(f"# HELP {prefix}_{name} {text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def histogram(name, counts, total, labels="", scale=1):
+            cumulative = 0
+            for bound in sorted(counts):
+                cumulative += counts[bound]
+                lines.append(f'{prefix}_{name}_bucket{{{labels}le="{bound * scale:g}"}} {cumulative}')
+            lines.append(f'{prefix}_{name}_bucket{{{labels}le="+Inf"}} {cumulative}')
+            suffix = "{" + labels.rstrip(",") + "}" if labels else ""
+            lines.append(f"{prefix}_{name}_sum{suffix} {total * scale:g}")
+            lines.append(f"{prefix}_{name}_count{suffix} {cumulative}")
+
+        header("calls_total", "counter", "Calls per instrumented method.")
+        for name in sorted(self.calls):
+            lines.append(f'{prefix}_calls_total{{method="{name}"}} {self.calls[name]}')
+        header("call_duration_seconds", "histogram", "Wall time per call, including nested calls.")
+        for name in sorted(self.timings):
+            histogram("call_duration_seconds", self.timings[name], self.time_ns[name], f'method="{name}",', 1e-9)
+        header("reductions_total", "counter", "Rational values normalized by gcd in Rational.__init__.")
+        lines.append(f"{prefix}_reductions_total {self.reductions}")
+        header("prereduced_total", "counter", "Rational values built by Rational._from_reduced from a canonical pair.")
+        lines.append(f"{prefix}_prereduced_total {self.prereduced}")
+        header("gcd_calls_total", "counter", "gcd calls in rational and complex.")
+        lines.append(f"{prefix}_gcd_calls_total {self.gcd_calls}")
+        header("gcd_bits_total", "counter", "Sum of the bit length of the largest gcd argument.")
+        lines.append(f"{prefix}_gcd_bits_total {self.gcd_bits}")
+        for name, counts in (("numerator_bits", self.numerator_bits), ("denominator_bits", self.denominator_bits)):
+            header(name, "histogram", f"Bit length of result {name.split('_')[0]}s.")
+            total = sum(bound * count for bound, count in counts.items())
+            histogram(name, counts, total)
+        return "\n".join(lines) + "\n"
+
+
+def _wrap(cls, name, function, stats):
+    """
+    Создаёт обёртку метода, считающую вызовы, время и длину результата в битах.
+    """
+    from rational import Rational
+    Complex = getattr(sys.modules.get("complex"), "Complex", None)
+    label = f"{cls.__name__}.{name}"
+    clock = time.perf_counter_ns
+    record_call = stats._record_call
+    record_rational = stats._record_rational
+    if name == "_from_reduced":
+        # вызывается на каждый результат операторов: считаются только вызовы, без времени и длины
+        function = function.__func__
+
+        @wraps(function)
+        def wrapper(owner, n, m):
+            stats.prereduced += 1
+            return function(owner, n, m)
+        return classmethod(wrapper)
+    if name == "__init__" and cls is Rational:
+        @wraps(function)
+        def wrapper(self, *args, **kwargs):
+            start = clock()
+            function(self, *args, **kwargs)
+            record_call(label, clock() - start)
+            stats.reductions += 1
+            record_rational(self)
+        return wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        result = function(*args, **kwargs)
+        record_call(label, clock() - start)
+        kind = result.__class__
+        if kind is Rational:
+            record_rational(result)
+        elif kind is Complex and result._real.__class__ is not float:
+            record_rational(result._real)
+            record_rational(result._imag)
+        return result
+    return wrapper
+
+
+def _patch_loaded():
+    """
+    Подменяет методы Rational и Complex и функцию gcd в модулях rational и complex обёртками.
+    Обрабатываются только уже загруженные модули, в которых класс определён; повторный вызов
+    подменяет лишь модули, загруженные с тех пор. Исходные объекты запоминаются в _originals.
+    """
+    stats = _statistics
+    for module_name, class_name, names in (("rational", "Rational", RATIONAL_METHODS),
+                                           ("complex", "Complex", COMPLEX_METHODS)):
+        module = sys.modules.get(module_name)
+        if module is None or module in _patched or not hasattr(module, class_name):
+            continue
+        _patched.add(module)
+        _originals.append((module, "gcd", module.gcd))
+        module.gcd = _counting_gcd(stats)
+        cls = getattr(module, class_name)
+        if class_name == "Rational":
+            names = names + ("_from_reduced",)
+        for name in names:
+            function = cls.__dict__[name]
+            _originals.append((cls, name, function))
+            setattr(cls, name, _wrap(cls, name, function, stats))
+
+
+def _counting_gcd(stats):
+    def gcd(*args):
+        stats.gcd_calls += 1
+        stats.gcd_bits += max(abs(a).bit_length() for a in args) if args else 0
+        return _gcd(*args)
+    return gcd
+
+
+def _unpatch():
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    _patched.clear()
+
+
+def enable(stats=None):
+    """
+    Функция включения инструментирования.
+    Методы Rational и Complex подменяются обёртками только на время работы; после disable
+    восстанавливаются исходные методы, поэтому выключенное инструментирование ничего не стоит.
+    Повторные вызовы вложены: обёртки снимаются, когда число disable сравняется с числом enable.
+    :param stats (Statistics | None): Куда накапливать статистику (для внешнего включения; по умолчанию новая).
+    :return:
+        Statistics: Активная статистика.
+    """
+    global _statistics, _depth
+    _depth += 1
+    if _depth == 1:
+        _statistics = stats if stats is not None else Statistics()
+        # при включении из переменной окружения модуль complex может быть ещё не загружен
+        # до конца: тогда Complex подменяется из его собственного вызова enable_from_environment
+        import rational
+        if "complex" not in sys.modules:
+            import complex
+        _patch_loaded()
+    return _statistics
+
+
+def disable():
+    """
+    Функция выключения инструментирования (парная к enable).
+    :return:
+        Statistics | None: Накопленная статистика.
+    """
+    global _depth
+    if _depth == 0:
+        return _statistics
+    _depth -= 1
+    if _depth == 0:
+        _unpatch()
+    return _statistics
+
+
+def is_enabled() -> bool:
+    """
+    :return:
+        bool: True, если методы сейчас подменены обёртками.
+    """
+    return _depth > 0
+
+
+def statistics():
+    """
+    :return:
+        Statistics | None: Статистика последнего (или текущего) включения.
+    """
+    return _statistics
+
+
+@contextmanager
+def instrument():
+    """
+    Контекстный менеджер, включающий инструментирование на время блока.
+    Внутри уже включённого инструментирования продолжает накапливать ту же статистику.
+    :return:
+        Statistics: Статистика (остаётся доступной после выхода из блока).
+    """
+    stats = enable()
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def _write_snapshot(path):
+    stats = _statistics
+    if stats is None:
+        return
+    text = stats.to_prometheus() if path.endswith(".prom") else stats.to_json(indent=2)
+    with open(path, "w") as file:
+        file.write(text)
+
+
+def enable_from_environment():
+    """
+    Включает инструментирование, если задана переменная окружения RATIONAL_INSTRUMENT
+    (любое значение, кроме пустого и "0"). Если задана RATIONAL_INSTRUMENT_OUTPUT,
+    при выходе из процесса туда записывается снимок.
+    Вызывается в конце модулей rational и complex.
+    :return:
+        bool: True, если инструментирование включено.
+    """
+    if os.environ.get(ENV_VARIABLE, "") in ("", "0"):
+        return False
+    if is_enabled():
+        _patch_loaded()
+        return True
+    enable()
+    output = os.environ.get(ENV_OUTPUT)
+    if output:
+        atexit.register(_write_snapshot, output)
+    return True
@@ -0,0 +1,706 @@
+from fractions import Fraction
+from functools import reduce, wraps
+from math import atan2, hypot, inf, nextafter, pi
+import operator
+import sys
+
+from rational import Rational
+from complex import Complex
+
+try:
+    import numpy as np
+    from complex_array import ComplexArray
+except ImportError:
+    np = None
+
+# на сколько ulp расширяются границы модуля и аргумента: math.hypot и math.atan2
+# не округляются корректно, но их ошибка не превышает 1 ulp
+TRANSCENDENTAL_ULPS = 2
+
+
+def _down(x):
+    return nextafter(x, -inf)
+
+
+def _up(x):
+    return nextafter(x, inf)
+
+
+def _widen_down(x, ulps):
+    for _ in range(ulps):
+        x = nextafter(x, -inf)
+    return x
+
+
+def _widen_up(x, ulps):
+    for _ in range(ulps):
+        x = nextafter(x, inf)
+    return x
+
+
+def _hypot_down(x, y):
+    """
+    Нижняя граница sqrt(x^2 + y^2) для неотрицательных x, y.
+    """
+    if x == 0 or y == 0:
+        # на осях модуль равен модулю второй координаты и вычисляется без ошибки
+        return x + y
+    return max(0.0, _widen_down(hypot(x, y), TRANSCENDENTAL_ULPS))
+
+
+def _hypot_up(x, y):
+    """
+    Верхняя граница sqrt(x^2 + y^2) для неотрицательных x, y.
+    """
+    if x == 0 or y == 0:
+        return x + y
+    return _widen_up(hypot(x, y), TRANSCENDENTAL_ULPS)
+
+
+class _ScalarOps:
+    """
+    Операции над границами-float для ComplexInterval.
+    """
+    down = staticmethod(_down)
+    up = staticmethod(_up)
+    low = staticmethod(min)
+    high = staticmethod(max)
+    any = staticmethod(bool)
+
+    @staticmethod
+    def times(x, y):
+        # граница inf означает конечное число за пределами float, поэтому 0 * inf = 0
+        return 0.0 if x == 0 or y == 0 else x * y
+
+    @staticmethod
+    def fill(x, value):
+        return value if x != x else x
+
+
+class _ArrayOps:
+    """
+    Те же операции над массивами границ для ComplexIntervalArray.
+    """
+    @staticmethod
+    def down(x):
+        return np.nextafter(x, -np.inf)
+
+    @staticmethod
+    def up(x):
+        return np.nextafter(x, np.inf)
+
+    @staticmethod
+    def low(*xs):
+        return reduce(np.minimum, xs)
+
+    @staticmethod
+    def high(*xs):
+        return reduce(np.maximum, xs)
+
+    @staticmethod
+    def any(mask):
+        return bool(np.any(mask))
+
+    @staticmethod
+    def times(x, y):
+        return np.where((x == 0) | (y == 0), 0.0, x * y)
+
+    @staticmethod
+    def fill(x, value):
+        return np.where(np.isnan(x), value, x)
+
+
+def _array_errors(method):
+    """
+    Выход границ массива за диапазон float (inf) и промежуточные inf * 0 и inf / inf
+    обрабатываются явно и дают строгую оболочку, поэтому предупреждения NumPy о них отключаются.
+    """
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with np.errstate(over="ignore", invalid="ignore"):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+# Действительные интервалы — пары (нижняя, верхняя граница). Результат каждой операции
+# с плавающей точкой отличается от точного не больше чем на половину ulp, поэтому сдвиг
+# на один ulp наружу (nextafter) даёт строгую оболочку. Бесконечные границы обозначают
+# конечные числа вне диапазона float (см. _float_enclosure).
+
+def _add(ops, a, b):
+    return ops.down(a[0] + b[0]), ops.up(a[1] + b[1])
+
+
+def _sub(ops, a, b):
+    return ops.down(a[0] - b[1]), ops.up(a[1] - b[0])
+
+
+def _mul(ops, a, b):
+    times = ops.times
+    products = (times(a[0], b[0]), times(a[0], b[1]), times(a[1], b[0]), times(a[1], b[1]))
+    return ops.down(ops.low(*products)), ops.up(ops.high(*products))
+
+
+def _square(ops, a):
+    products = (a[0] * a[0], ops.times(a[0], a[1]), a[1] * a[1])
+    # если интервал содержит ноль, минимальное произведение отрицательно, а квадрат — нет
+    return ops.high(0.0, ops.down(ops.low(*products))), ops.up(ops.high(products[0], products[2]))
+
+
+def _div(ops, a, b):
+    """
+    Деление на интервал b, не содержащий нуля.
+    Частное бесконечных границ (inf / inf) может быть любым, поэтому вместо него берутся обе бесконечности.
+    """
+    quotients = (a[0] / b[0], a[0] / b[1], a[1] / b[0], a[1] / b[1])
+    return (ops.down(ops.low(*(ops.fill(q, -inf) for q in quotients))),
+            ops.up(ops.high(*(ops.fill(q, inf) for q in quotients))))
+
+
+def _float_enclosure(value):
+    """
+    Наименьший интервал из float, содержащий точное число.
+    Число вне диапазона float заключается в интервал от наибольшего float до бесконечности.
+    :param value (Rational | int): Число.
+    :return:
+        tuple[float, float]: Границы (совпадают, если число представимо во float точно).
+    """
+    try:
+        x = float(value)
+    except OverflowError:
+        if value.numerator > 0:
+            return sys.float_info.max, inf
+        return -inf, -sys.float_info.max
+    if Rational.from_float(x) == value:
+        return x, x
+    return _down(x), _up(x)
+
+
+def _exact_value(node):
+    """
+    Вычисляет точное значение оболочки по графу операций, из которого она получена.
+    Обход выполняется без рекурсии, поэтому длинные цепочки операций не упираются в предел стека.
+    Вычисленные значения запоминаются, а граф под ними освобождается.
+    """
+    stack = [node]
+    while stack:
+        current = stack[-1]
+        if current._exact is not None:
+            stack.pop()
+            continue
+        if current._source is None:
+            raise ValueError("Enclosure has no exact value to fall back on")
+        operation, operands = current._source
+        pending = [x for x in operands if isinstance(x, _Enclosure) and x._exact is None]
+        if pending:
+            stack.extend(pending)
+            continue
+        current._exact = operation(*(x._exact if isinstance(x, _Enclosure) else x for x in operands))
+        current._source = None
+        stack.pop()
+    return node._exact
+
+
+class _Enclosure:
+    """
+    Общая часть оболочек: ссылка на точное значение или на операцию, которая его даёт.
+    Атрибуты:
+        _exact: Точное значение (Complex или ComplexArray) или None, если оно ещё не вычислено.
+        _source (tuple | None): Операция и операнды, из которых получена оболочка.
+    """
+    __slots__ = ('_exact', '_source')
+
+    def exact(self):
+        """
+        Функция получения точного значения, заключённого в оболочку.
+        Значение вычисляется точной арифметикой Rational по всей цепочке операций
+        только при первом вызове.
+        Исключения:
+            ValueError: Если оболочка создана из границ, а не из чисел.
+        :return:
+            Complex | ComplexArray: Точное значение.
+        """
+        return _exact_value(self)
+
+    def detach(self):
+        """
+        Функция получения той же оболочки без ссылки на граф операций.
+        Граф держит в памяти все промежуточные оболочки; после detach точное сравнение
+        недоступно, зато память освобождается.
+        :return:
+            Оболочка того же типа.
+        """
+        return self._from_bounds(self._real, self._imag, None, None)
+
+
+class ComplexInterval(_Enclosure):
+    """
+    Комплексное число, заданное строгой оболочкой: прямоугольником
+    [real_lo, real_hi] + [imag_lo, imag_hi]i с границами типа float.
+    Операции + - * / и ** выполняются во float с округлением наружу, поэтому точный
+    результат всегда лежит внутри оболочки. Каждая оболочка помнит, из чего получена,
+    и сравнение ==, которое нельзя решить по границам, досчитывается точно в Rational.
+    Атрибуты:
+        _real (tuple[float, float]): Границы действительной части.
+        _imag (tuple[float, float]): Границы мнимой части.
+    """
+    __slots__ = ('_real', '_imag')
+
+    def __init__(self, value):
+        """
+        Инициализация наименьшей оболочкой точного числа.
+        :param value (Complex | Rational | int | float | complex): Число.
+        """
+        if isinstance(value, complex):
+            value = Complex(value.real, value.imag, backend="exact")
+        elif not isinstance(value, Complex):
+            value = Complex(value, backend="exact")
+        else:
+            value = value.to_exact()
+        self._real = _float_enclosure(value._real)
+        self._imag = _float_enclosure(value._imag)
+        self._exact = value
+        self._source = None
+
+    @classmethod
+    def _from_bounds(cls, real, imag, operation, operands):
+        z = object.__new__(cls)
+        z._real = real
+        z._imag = imag
+        z._exact = None
+        z._source = (operation, operands) if operation is not None else None
+        return z
+
+    @staticmethod
+    def from_bounds(real_lo: float, real_hi: float, imag_lo: float, imag_hi: float):
+        """
+        Функция создания оболочки по границам.
+        У такой оболочки нет точного значения, поэтому сравнение, которое нельзя решить
+        по границам, вызывает ValueError.
+        :return:
+            ComplexInterval: Оболочка.
+        """
+        if not (real_lo <= real_hi and imag_lo <= imag_hi):
+            raise ValueError("Lower bounds must not exceed upper bounds")
+        return ComplexInterval._from_bounds((float(real_lo), float(real_hi)), (float(imag_lo), float(imag_hi)), None, None)
+
+    @property
+    def real(self):
+        """
+        :return:
+            tuple[float, float]: Границы действительной части.
+        """
+        return self._real
+
+    @property
+    def imag(self):
+        """
+        :return:
+            tuple[float, float]: Границы мнимой части.
+        """
+        return self._imag
+
+    @property
+    def midpoint(self) -> complex:
+        """
+        :return:
+            complex: Центр прямоугольника (округлённый).
+        """
+        return complex((self._real[0] + self._real[1]) / 2, (self._imag[0] + self._imag[1]) / 2)
+
+    @property
+    def radius(self) -> float:
+        """
+        :return:
+            float: Верхняя оценка расстояния от midpoint до любой точки оболочки.
+        """
+        m = self.midpoint
+        dx = max(m.real - self._real[0], self._real[1] - m.real)
+        dy = max(m.imag - self._imag[0], self._imag[1] - m.imag)
+        return _widen_up(hypot(_up(dx), _up(dy)), TRANSCENDENTAL_ULPS)
+
+    def contains(self, value) -> bool:
+        """
+        Функция точной проверки принадлежности числа оболочке.
+        :param value (Complex | Rational | int | float): Число.
+        :return:
+            bool: True, если число лежит в прямоугольнике.
+        """
+        if not isinstance(value, Complex):
+            value = Complex(value, backend="exact")
+        value = value.to_exact()
+        x = Fraction(value._real._numerator, value._real._denominator)
+        y = Fraction(value._imag._numerator, value._imag._denominator)
+        # Fraction сравнивается с float точно, в том числе с бесконечными границами
+        return self._real[0] <= x <= self._real[1] and self._imag[0] <= y <= self._imag[1]
+
+    def _is_point(self) -> bool:
+        return self._real[0] == self._real[1] and self._imag[0] == self._imag[1]
+
+    def __add__(self, other):
+        """
+        :param other (ComplexInterval | Complex | Rational | int | float | complex): Слагаемое.
+        :return:
+            ComplexInterval: Оболочка суммы.
+        """
+        other = _as_interval(other)
+        return ComplexInterval._from_bounds(_add(_ScalarOps, self._real, other._real),
+                                            _add(_ScalarOps, self._imag, other._imag),
+                                            operator.add, (self, other))
+
+    def __sub__(self, other):
+        """
+        :param other (ComplexInterval | Complex | Rational | int | float | complex): Вычитаемое.
+        :return:
+            ComplexInterval: Оболочка разности.
+        """
+        other = _as_interval(other)
+        return ComplexInterval._from_bounds(_sub(_ScalarOps, self._real, other._real),
+                                            _sub(_ScalarOps, self._imag, other._imag),
+                                            operator.sub, (self, other))
+
+    def __mul__(self, other):
+        """
+        :param other (ComplexInterval | Complex | Rational | int | float | complex): Множитель.
+        :return:
+            ComplexInterval: Оболочка произведения.
+        """
+        other = _as_interval(other)
+        a, b, c, d = self._real, self._imag, other._real, other._imag
+        real = _sub(_ScalarOps, _mul(_ScalarOps, a, c), _mul(_ScalarOps, b, d))
+        imag = _add(_ScalarOps, _mul(_ScalarOps, a, d), _mul(_ScalarOps, b, c))
+        return ComplexInterval._from_bounds(real, imag, operator.mul, (self, other))
+
+    def __truediv__(self, other):
+        """
+        Исключения:
+            ZeroDivisionError: Если оболочка делителя содержит ноль.
+        :param other (ComplexInterval | Complex | Rational | int | float | complex): Делитель.
+        :return:
+            ComplexInterval: Оболочка частного.
+        """
+        other = _as_interval(other)
+        real, imag = _divide(_ScalarOps, self._real, self._imag, other._real, other._imag)
+        return ComplexInterval._from_bounds(real, imag, operator.truediv, (self, other))
+
+    def __neg__(self):
+        return ComplexInterval._from_bounds((-self._real[1], -self._real[0]), (-self._imag[1], -self._imag[0]),
+                                            operator.neg, (self,))
+
+    def __pow__(self, other: int):
+        """
+        :param other (int): Целая степень.
+        :return:
+            ComplexInterval: Оболочка степени.
+        """
+        return _power(self, other, ComplexInterval(1))
+
+    def abs(self):
+        """
+        Функция вычисления строгих границ модуля.
+        :return:
+            tuple[float, float]: Нижняя и верхняя граница |z|.
+        """
+        (a, b), (c, d) = self._real, self._imag
+        # ближайшая к нулю и самая далёкая точки прямоугольника
+        x = a if a > 0 else (-b if b < 0 else 0.0)
+        y = c if c > 0 else (-d if d < 0 else 0.0)
+        u, v = max(-a, b), max(-c, d)
+        return _hypot_down(x, y), _hypot_up(u, v)
+
+    def arg(self):
+        """
+        Функция вычисления строгих границ аргумента (в радианах, как у Complex.arg).
+        Если прямоугольник задевает ноль или отрицательную действительную полуось
+        (разрез atan2), возвращается весь промежуток [-pi, pi].
+        :return:
+            tuple[float, float]: Нижняя и верхняя граница arg z.
+        """
+        (a, b), (c, d) = self._real, self._imag
+        if a <= 0 and c <= 0 <= d:
+            return -_up(pi), _up(pi)
+        angles = (atan2(c, a), atan2(c, b), atan2(d, a), atan2(d, b))
+        return _widen_down(min(angles), TRANSCENDENTAL_ULPS), _widen_up(max(angles), TRANSCENDENTAL_ULPS)
+
+    def __eq__(self, other):
+        """
+        Проверка на равенство.
+        Непересекающиеся оболочки не равны, совпадающие точки равны; в остальных случаях
+        сравниваются точные значения (exact).
+        Исключения:
+            ValueError: Если решение требует точных значений, а у оболочки их нет.
+        :param other (ComplexInterval | Complex | Rational | int | float | complex): Число.
+        :return:
+            bool: True, если точные значения равны.
+        """
+        other = _as_interval(other)
+        if (self._real[1] < other._real[0] or other._real[1] < self._real[0]
+                or self._imag[1] < other._imag[0] or other._imag[1] < self._imag[0]):
+            return False
+        if self._is_point() and other._is_point():
+            return True
+        return self.exact() == other.exact()
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ComplexInterval([{self._real[0]!r}, {self._real[1]!r}] + [{self._imag[0]!r}, {self._imag[1]!r}]i)"
+
+
+def _as_interval(value):
+    """
+    Приводит операнд к ComplexInterval.
+    """
+    if isinstance(value, ComplexInterval):
+        return value
+    elif isinstance(value, (Complex, Rational, int, float, complex)):
+        return ComplexInterval(value)
+    raise TypeError("Unsupported operand type")
+
+
+def _divide(ops, a, b, c, d):
+    """
+    Оболочка частного (a + bi) / (c + di) = ((ac + bd) + (bc - ad)i) / (c^2 + d^2).
+    """
+    norm = _add(ops, _square(ops, c), _square(ops, d))
+    if ops.any(norm[0] <= 0):
+        raise ZeroDivisionError("Divisor enclosure contains zero")
+    real = _add(ops, _mul(ops, a, c), _mul(ops, b, d))
+    imag = _sub(ops, _mul(ops, b, c), _mul(ops, a, d))
+    return _div(ops, real, norm), _div(ops, imag, norm)
+
+
+def _power(base, exponent, one):
+    """
+    Возведение оболочки в целую степень двоичным методом.
+    :param one: Оболочка единицы того же вида, что и base.
+    """
+    if not isinstance(exponent, int):
+        raise TypeError("Exponent must be an integer")
+    if exponent < 0:
+        return one / _power(base, -exponent, one)
+    result = one
+    while exponent:
+        if exponent & 1:
+            result = base if result is one else result * base
+        exponent >>= 1
+        if exponent:
+            base = base * base
+    return result
+
+
+class ComplexIntervalArray(_Enclosure):
+    """
+    Массив оболочек ComplexInterval с поэлементными операциями над массивами границ NumPy.
+    Операции и округление наружу те же, что у ComplexInterval (np.nextafter вместо
+    math.nextafter); точные значения для сравнения досчитываются одним ComplexArray.
+    Атрибуты:
+        _real (tuple[np.ndarray, np.ndarray]): Границы действительных частей.
+        _imag (tuple[np.ndarray, np.ndarray]): Границы мнимых частей.
+    """
+    __slots__ = ('_real', '_imag')
+
+    def __init__(self, values=()):
+        """
+        Инициализация наименьшими оболочками точных чисел.
+        :param values (iterable[Complex | Rational | int | float | complex] | ComplexArray): Числа.
+        """
+        if isinstance(values, ComplexArray):
+            values = values.to_list()
+        items = [ComplexInterval(value) for value in values]
+        self._real = tuple(np.array([z._real[k] for z in items], dtype=np.float64) for k in range(2))
+        self._imag = tuple(np.array([z._imag[k] for z in items], dtype=np.float64) for k in range(2))
+        self._exact = ComplexArray([z._exact for z in items])
+        self._source = None
+
+    @classmethod
+    def _from_bounds(cls, real, imag, operation, operands):
+        z = object.__new__(cls)
+        z._real = real
+        z._imag = imag
+        z._exact = None
+        z._source = (operation, operands) if operation is not None else None
+        return z
+
+    @staticmethod
+    def from_bounds(real_lo, real_hi, imag_lo, imag_hi):
+        """
+        Функция создания массива оболочек по массивам границ (без точных значений).
+        :return:
+            ComplexIntervalArray: Массив оболочек.
+        """
+        bounds = [np.array(x, dtype=np.float64) for x in (real_lo, real_hi, imag_lo, imag_hi)]
+        if np.any(bounds[0] > bounds[1]) or np.any(bounds[2] > bounds[3]):
+            raise ValueError("Lower bounds must not exceed upper bounds")
+        return ComplexIntervalArray._from_bounds((bounds[0], bounds[1]), (bounds[2], bounds[3]), None, None)
+
+    @property
+    def real(self):
+        """
+        :return:
+            tuple[np.ndarray, np.ndarray]: Границы действительных частей.
+        """
+        return self._real
+
+    @property
+    def imag(self):
+        """
+        :return:
+            tuple[np.ndarray, np.ndarray]: Границы мнимых частей.
+        """
+        return self._imag
+
+    def __len__(self):
+        return len(self._real[0])
+
+    def __getitem__(self, index: int):
+        """
+        :param index (int): Индекс.
+        :return:
+            ComplexInterval: Оболочка элемента (точное значение берётся из точного массива).
+        """
+        index = range(len(self))[index]
+        return ComplexInterval._from_bounds((float(self._real[0][index]), float(self._real[1][index])),
+                                            (float(self._imag[0][index]), float(self._imag[1][index])),
+                                            operator.getitem, (self, index))
+
+    def _coerce(self, other):
+        """
+        :return:
+            tuple: Границы (real, imag) второго операнда и сам операнд для точного пересчёта.
+        """
+        if isinstance(other, ComplexIntervalArray):
+            if len(other) != len(self):
+                raise ValueError("Arrays must have the same length")
+            return other._real, other._imag, other
+        other = _as_interval(other)
+        return other._real, other._imag, other
+
+    @_array_errors
+    def __add__(self, other):
+        """
+        :param other (ComplexIntervalArray | ComplexInterval | Complex | Rational | int | float | complex): Слагаемое.
+        :return:
+            ComplexIntervalArray: Поэлементная сумма.
+        """
+        c, d, other = self._coerce(other)
+        return ComplexIntervalArray._from_bounds(_add(_ArrayOps, self._real, c), _add(_ArrayOps, self._imag, d),
+                                                 operator.add, (self, other))
+
+    @_array_errors
+    def __sub__(self, other):
+        """
+        :param other (ComplexIntervalArray | ComplexInterval | Complex | Rational | int | float | complex): Вычитаемое.
+        :return:
+            ComplexIntervalArray: Поэлементная разность.
+        """
+        c, d, other = self._coerce(other)
+        return ComplexIntervalArray._from_bounds(_sub(_ArrayOps, self._real, c), _sub(_ArrayOps, self._imag, d),
+                                                 operator.sub, (self, other))
+
+    @_array_errors
+    def __mul__(self, other):
+        """
+        :param other (ComplexIntervalArray | ComplexInterval | Complex | Rational | int | float | complex): Множитель.
+        :return:
+            ComplexIntervalArray: Поэлементное произведение.
+        """
+        c, d, other = self._coerce(other)
+        a, b = self._real, self._imag
+        real = _sub(_ArrayOps, _mul(_ArrayOps, a, c), _mul(_ArrayOps, b, d))
+        imag = _add(_ArrayOps, _mul(_ArrayOps, a, d), _mul(_ArrayOps, b, c))
+        return ComplexIntervalArray._from_bounds(real, imag, operator.mul, (self, other))
+
+    @_array_errors
+    def __truediv__(self, other):
+        """
+        Исключения:
+            ZeroDivisionError: Если оболочка хотя бы одного делителя содержит ноль.
+        :param other (ComplexIntervalArray | ComplexInterval | Complex | Rational | int | float | complex): Делитель.
+        :return:
+            ComplexIntervalArray: Поэлементное частное.
+        """
+        c, d, other = self._coerce(other)
+        real, imag = _divide(_ArrayOps, self._real, self._imag, c, d)
+        return ComplexIntervalArray._from_bounds(real, imag, operator.truediv, (self, other))
+
+    def __neg__(self):
+        return ComplexIntervalArray._from_bounds((-self._real[1], -self._real[0]), (-self._imag[1], -self._imag[0]),
+                                                 operator.neg, (self,))
+
+    @_array_errors
+    def __pow__(self, other: int):
+        """
+        :param other (int): Целая степень.
+        :return:
+            ComplexIntervalArray: Поэлементная степень.
+        """
+        return _power(self, other, ComplexIntervalArray([1] * len(self)))
+
+    @_array_errors
+    def abs(self):
+        """
+        :return:
+            tuple[np.ndarray, np.ndarray]: Поэлементные нижние и верхние границы модуля.
+        """
+        (a, b), (c, d) = self._real, self._imag
+        x = np.where(a > 0, a, np.where(b < 0, -b, 0.0))
+        y = np.where(c > 0, c, np.where(d < 0, -d, 0.0))
+        u, v = np.maximum(-a, b), np.maximum(-c, d)
+        low, high = np.hypot(x, y), np.hypot(u, v)
+        for _ in range(TRANSCENDENTAL_ULPS):
+            low, high = np.nextafter(low, -np.inf), np.nextafter(high, np.inf)
+        # на осях модуль равен модулю второй координаты и вычисляется без ошибки
+        low = np.where(x == 0, y, np.where(y == 0, x, np.maximum(low, 0.0)))
+        high = np.where(u == 0, v, np.where(v == 0, u, high))
+        return low, high
+
+    def arg(self):
+        """
+        :return:
+            tuple[np.ndarray, np.ndarray]: Поэлементные границы аргумента (как у ComplexInterval.arg).
+        """
+        (a, b), (c, d) = self._real, self._imag
+        angles = (np.arctan2(c, a), np.arctan2(c, b), np.arctan2(d, a), np.arctan2(d, b))
+        low, high = _ArrayOps.low(*angles), _ArrayOps.high(*angles)
+        for _ in range(TRANSCENDENTAL_ULPS):
+            low, high = np.nextafter(low, -np.inf), np.nextafter(high, np.inf)
+        cut = (a <= 0) & (c <= 0) & (0 <= d)
+        return np.where(cut, -_up(pi), low), np.where(cut, _up(pi), high)
+
+    def equal(self, other):
+        """
+        Функция поэлементного сравнения (правила те же, что у ComplexInterval.__eq__).
+        Точные значения вычисляются, только если хотя бы один элемент нельзя решить по границам.
+        :param other (ComplexIntervalArray | ComplexInterval | Complex | Rational | int | float | complex): Второй операнд.
+        :return:
+            np.ndarray: Массив bool.
+        """
+        c, d, other = self._coerce(other)
+        (a, b), (e, f) = self._real, self._imag
+        disjoint = (b < c[0]) | (c[1] < a) | (f < d[0]) | (d[1] < e)
+        points = (a == b) & (e == f) & (c[0] == c[1]) & (d[0] == d[1])
+        result = ~disjoint & points
+        undecided = np.flatnonzero(~disjoint & ~points)
+        if len(undecided):
+            exact = self.exact().to_list()
+            if isinstance(other, ComplexIntervalArray):
+                others = other.exact().to_list()
+            else:
+                others = [other.exact()] * len(self)
+            for i in undecided.tolist():
+                result[i] = exact[i] == others[i]
+        return result
+
+    def to_list(self):
+        """
+        :return:
+            list[ComplexInterval]: Оболочки элементов.
+        """
+        return [self[i] for i in range(len(self))]
+
+    def __repr__(self):
+        return f"ComplexIntervalArray(len={len(self)})"
@@ -0,0 +1,566 @@
+from math import gcd
+from operator import mul
+
+from rational import Rational
+from complex import Complex, _to_rational
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BACKENDS = ("exact", "float")
+
+# размер квадратного блока при умножении матриц в точном режиме
+BLOCK_SIZE = 32
+
+
+def _lcm_of_denominators(values):
+    """
+    :param values (iterable[Rational]): Дроби.
+    :return:
+        int: Наименьшее общее кратное знаменателей.
+    """
+    denominator = 1
+    for value in values:
+        d = value._denominator
+        if denominator % d:
+            denominator = denominator // gcd(denominator, d) * d
+    return denominator
+
+
+def _dot(a, b):
+    """
+    :return:
+        int: Скалярное произведение двух списков целых (цикл выполняется на уровне C).
+    """
+    return sum(map(mul, a, b))
+
+
+def _gaussian_mul(x, y):
+    return x[0] * y[0] - x[1] * y[1], x[0] * y[1] + x[1] * y[0]
+
+
+def _gaussian_sub(x, y):
+    return x[0] - y[0], x[1] - y[1]
+
+
+def _gaussian_exact_div(x, y):
+    """
+    Деление гауссовых целых, если известно, что оно нацело.
+    :return:
+        tuple[int, int]: Частное.
+    """
+    norm = y[0] * y[0] + y[1] * y[1]
+    return (x[0] * y[0] + x[1] * y[1]) // norm, (x[1] * y[0] - x[0] * y[1]) // norm
+
+
+def _integer_mul(x, y):
+    return x * y
+
+
+def _integer_sub(x, y):
+    return x - y
+
+
+def _integer_exact_div(x, y):
+    return x // y
+
+
+def _bareiss(rows, size, ops, full):
+    """
+    Исключение Гаусса без дробей (алгоритм Барейса) на месте.
+    Каждый новый элемент равен (pivot * a[i][j] - a[i][k] * a[k][j]) / prev, где prev — предыдущий
+    ведущий элемент; деление всегда нацело, а все промежуточные значения — миноры исходной
+    матрицы, поэтому их размер ограничен оценкой Адамара.
+    :param rows (list[list]): Целочисленная (или гауссова целочисленная) матрица, возможно расширенная.
+    :param size (int): Число строк и ведущих столбцов.
+    :param ops (tuple): Операции кольца (mul, sub, exact_div, zero, one).
+    :param full (bool): Исключать и над ведущим элементом (вариант Гаусса–Жордана). Тогда левый
+        блок становится равен det * E, а правый — det * A^-1 * B.
+    :return:
+        tuple: (последний ведущий элемент, знак перестановки строк); ведущий элемент равен нулю
+        для вырожденной матрицы.
+    """
+    ring_mul, ring_sub, ring_div, zero, one = ops
+    width = len(rows[0]) if rows else 0
+    sign = 1
+    previous = one
+    for k in range(size):
+        pivot_index = next((i for i in range(k, size) if rows[i][k] != zero), None)
+        if pivot_index is None:
+            return zero, sign
+        if pivot_index != k:
+            rows[k], rows[pivot_index] = rows[pivot_index], rows[k]
+            sign = -sign
+        pivot_row = rows[k]
+        pivot = pivot_row[k]
+        for i in range(size) if full else range(k + 1, size):
+            if i == k:
+                continue
+            row = rows[i]
+            factor = row[k]
+            for j in range(k + 1, width):
+                row[j] = ring_div(ring_sub(ring_mul(pivot, row[j]), ring_mul(factor, pivot_row[j])), previous)
+            row[k] = zero
+        previous = pivot
+    return previous, sign
+
+
+class _Matrix:
+    """
+    Общая часть плотных матриц RationalMatrix и ComplexMatrix.
+    В режиме "exact" элементы хранятся как кортеж строк, в режиме "float" — как массив NumPy.
+    Объект неизменяемый: все операции возвращают новую матрицу.
+    """
+    __slots__ = ('_rows', '_data')
+    _dtype = None
+    _ring = None
+
+    def __init__(self, rows=(), backend=None):
+        """
+        Инициализация матрицы.
+        :param rows (iterable[iterable]): Строки матрицы.
+        :param backend: "exact" (по умолчанию) или "float" (массив NumPy).
+        """
+        if backend is None:
+            backend = "exact"
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
+        rows = [list(row) for row in rows]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("Rows must have the same length")
+        if backend == "exact":
+            self._rows = tuple(tuple(self._element(value) for value in row) for row in rows)
+            self._data = None
+        else:
+            if np is None:
+                raise ImportError("numpy is required for the float backend")
+            self._rows = None
+            self._data = np.array([[self._scalar(value) for value in row] for row in rows],
+                                  dtype=self._dtype).reshape(len(rows), width)
+
+    @classmethod
+    def _from_rows(cls, rows):
+        """
+        Создаёт точную матрицу из готовых строк без преобразования элементов.
+        :return:
+            _Matrix: Новая матрица.
+        """
+        matrix = object.__new__(cls)
+        matrix._rows = tuple(tuple(row) for row in rows)
+        matrix._data = None
+        return matrix
+
+    @classmethod
+    def _from_data(cls, data):
+        """
+        Создаёт матрицу в режиме "float" из готового массива NumPy.
+        :return:
+            _Matrix: Новая матрица.
+        """
+        matrix = object.__new__(cls)
+        matrix._rows = None
+        matrix._data = data
+        return matrix
+
+    @classmethod
+    def identity(cls, n: int, backend=None):
+        """
+        :param n (int): Размер.
+        :param backend: "exact" или "float".
+        :return:
+            _Matrix: Единичная матрица n x n.
+        """
+        return cls([[1 if i == j else 0 for j in range(n)] for i in range(n)], backend=backend)
+
+    @property
+    def backend(self) -> str:
+        """
+        :return:
+            str: "exact" или "float".
+        """
+        return "exact" if self._data is None else "float"
+
+    @property
+    def shape(self):
+        """
+        :return:
+            tuple[int, int]: Число строк и столбцов.
+        """
+        if self._data is not None:
+            return self._data.shape
+        return len(self._rows), len(self._rows[0]) if self._rows else 0
+
+    def __getitem__(self, index):
+        """
+        Функция получения элемента.
+        :param index (tuple[int, int]): Номер строки и столбца.
+        :return:
+            Элемент матрицы.
+        """
+        i, j = index
+        if self._data is not None:
+            return self._wrap(self._data[i, j])
+        return self._rows[i][j]
+
+    def to_list(self):
+        """
+        :return:
+            list[list]: Элементы матрицы по строкам.
+        """
+        if self._data is not None:
+            return [[self._wrap(value) for value in row] for row in self._data.tolist()]
+        return [list(row) for row in self._rows]
+
+    def to_numpy(self):
+        """
+        :return:
+            np.ndarray: Значения во float (копия).
+        """
+        if self._data is not None:
+            return self._data.copy()
+        return np.array([[self._scalar(value) for value in row] for row in self._rows],
+                        dtype=self._dtype).reshape(self.shape)
+
+    def to_float(self):
+        """
+        :return:
+            _Matrix: Матрица в режиме "float".
+        """
+        return self if self._data is not None else type(self)._from_data(self.to_numpy())
+
+    def to_exact(self):
+        """
+        Значения float переводятся в дроби без округления.
+        :return:
+            _Matrix: Матрица в режиме "exact".
+        """
+        return self if self._data is None else type(self)(self._data.tolist())
+
+    def transpose(self):
+        """
+        :return:
+            _Matrix: Транспонированная матрица.
+        """
+        if self._data is not None:
+            return type(self)._from_data(self._data.T.copy())
+        return type(self)._from_rows(zip(*self._rows))
+
+    def _check(self, other):
+        """
+        Проверяет, что второй операнд — матрица того же типа, режима и размера.
+        """
+        if not isinstance(other, type(self)):
+            raise TypeError("Unsupported operand type")
+        if other.backend != self.backend:
+            raise ValueError("Matrices must have the same backend")
+        if other.shape != self.shape:
+            raise ValueError("Matrices must have the same shape")
+
+    def __add__(self, other):
+        """
+        Поэлементное сложение матриц.
+        :param other (_Matrix): Матрица того же типа и размера.
+        :return:
+            _Matrix: Сумма.
+        """
+        self._check(other)
+        if self._data is not None:
+            return type(self)._from_data(self._data + other._data)
+        return type(self)._from_rows([[x + y for x, y in zip(a, b)] for a, b in zip(self._rows, other._rows)])
+
+    def __sub__(self, other):
+        """
+        Поэлементное вычитание матриц.
+        :param other (_Matrix): Матрица того же типа и размера.
+        :return:
+            _Matrix: Разность.
+        """
+        self._check(other)
+        if self._data is not None:
+            return type(self)._from_data(self._data - other._data)
+        return type(self)._from_rows([[x - y for x, y in zip(a, b)] for a, b in zip(self._rows, other._rows)])
+
+    def __neg__(self):
+        """
+        :return:
+            _Matrix: Матрица с противоположными элементами.
+        """
+        if self._data is not None:
+            return type(self)._from_data(-self._data)
+        return type(self)._from_rows([[-x for x in row] for row in self._rows])
+
+    def __mul__(self, other):
+        """
+        Умножение матрицы на число.
+        :param other: Число того же типа, что и элементы (или int).
+        :return:
+            _Matrix: Новая матрица.
+        """
+        if self._data is not None:
+            return type(self)._from_data(self._data * self._scalar(other))
+        scalar = self._element(other)
+        return type(self)._from_rows([[x * scalar for x in row] for row in self._rows])
+
+    def __matmul__(self, other):
+        """
+        Функция умножения матриц.
+        В режиме "exact" каждая строка левой матрицы и каждый столбец правой приводятся к общему
+        знаменателю, после чего элемент результата — скалярное произведение списков целых,
+        которое сокращается один раз. Строки и столбцы обходятся блоками BLOCK_SIZE x BLOCK_SIZE,
+        чтобы блок столбцов оставался в кеше, пока по нему проходят строки.
+        В режиме "float" умножение выполняет NumPy.
+        :param other (_Matrix): Матрица того же типа и режима.
+        :return:
+            _Matrix: Произведение.
+        """
+        if not isinstance(other, type(self)):
+            raise TypeError("Unsupported operand type")
+        if other.backend != self.backend:
+            raise ValueError("Matrices must have the same backend")
+        n, inner = self.shape
+        if other.shape[0] != inner:
+            raise ValueError("Matrix shapes are not aligned")
+        m = other.shape[1]
+        if self._data is not None:
+            return type(self)._from_data(self._data @ other._data)
+        left = [self._scale_left(row) for row in self._rows]
+        right = [self._scale_right(column) for column in zip(*other._rows)]
+        result = [[None] * m for _ in range(n)]
+        for i0 in range(0, n, BLOCK_SIZE):
+            for j0 in range(0, m, BLOCK_SIZE):
+                columns = right[j0:j0 + BLOCK_SIZE]
+                for i in range(i0, min(i0 + BLOCK_SIZE, n)):
+                    row = left[i]
+                    target = result[i]
+                    for j, column in enumerate(columns, j0):
+                        target[j] = self._dot_scaled(row, column)
+        return type(self)._from_rows(result)
+
+    def _require_square(self):
+        n, m = self.shape
+        if n != m:
+            raise ValueError("Matrix must be square")
+        return n
+
+    def det(self):
+        """
+        Функция вычисления определителя.
+        В режиме "exact" строки приводятся к целым (умножением на общий знаменатель строки),
+        и определитель целочисленной матрицы считается алгоритмом Барейса без дробей.
+        :return:
+            Определитель (Rational или Complex; float/Complex во float в режиме "float").
+        """
+        n = self._require_square()
+        if self._data is not None:
+            return self._wrap(np.linalg.det(self._data) if n else 1.0)
+        if n == 0:
+            return self._element(1)
+        rows = []
+        scale = 1
+        for row in self._rows:
+            integers, denominator = self._integers(row)
+            rows.append(integers)
+            scale *= denominator
+        pivot, sign = _bareiss(rows, n, self._ring, full=False)
+        if sign < 0:
+            pivot = self._ring_negate(pivot)
+        return self._from_ring(pivot, scale)
+
+    def solve(self, b):
+        """
+        Функция решения системы A * X = B.
+        В режиме "exact" используется вариант Гаусса–Жордана алгоритма Барейса над расширенной
+        целочисленной матрицей [A | B]: дроби появляются только в ответе, по одной на элемент.
+        Исключения:
+            ValueError: Если матрица вырождена.
+        :param b (_Matrix | list): Правая часть — матрица того же типа или список чисел.
+        :return:
+            _Matrix | list: Решение в том же виде, что и правая часть.
+        """
+        n = self._require_square()
+        vector = not isinstance(b, _Matrix)
+        if vector:
+            b = type(self)([[value] for value in b], backend=self.backend)
+        elif not isinstance(b, type(self)):
+            raise TypeError("Unsupported operand type")
+        if b.backend != self.backend:
+            raise ValueError("Matrices must have the same backend")
+        if b.shape[0] != n:
+            raise ValueError("Matrix shapes are not aligned")
+        if self._data is not None:
+            try:
+                solution = type(self)._from_data(np.linalg.solve(self._data, b._data))
+            except np.linalg.LinAlgError:
+                raise ValueError("Matrix is singular") from None
+        else:
+            rows = [self._integers(left + right)[0] for left, right in zip(self._rows, b._rows)]
+            pivot, _ = _bareiss(rows, n, self._ring, full=True)
+            if pivot == self._ring[3]:
+                raise ValueError("Matrix is singular")
+            solution = type(self)._from_rows([[self._divide_ring(value, pivot) for value in row[n:]]
+                                              for row in rows])
+        return [row[0] for row in solution.to_list()] if vector else solution
+
+    def inverse(self):
+        """
+        Функция обращения матрицы (решение A * X = E).
+        Исключения:
+            ValueError: Если матрица вырождена.
+        :return:
+            _Matrix: Обратная матрица.
+        """
+        return self.solve(type(self).identity(self._require_square(), backend=self.backend))
+
+    def __eq__(self, other):
+        """
+        Проверка на равенство матриц одного типа и размера.
+        :return:
+            bool: True, если все элементы совпадают.
+        """
+        if not isinstance(other, type(self)):
+            raise TypeError("Unsupported operand type")
+        if other.shape != self.shape:
+            return False
+        if self._data is not None or other._data is not None:
+            return bool(np.array_equal(self.to_numpy(), other.to_numpy()))
+        return all(x == y for a, b in zip(self._rows, other._rows) for x, y in zip(a, b))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        rows = ", ".join("[" + ", ".join(repr(value) for value in row) + "]" for row in self.to_list())
+        suffix = ", backend='float'" if self._data is not None else ""
+        return f"{type(self).__name__}([{rows}]{suffix})"
+
+
+class RationalMatrix(_Matrix):
+    """
+    Плотная матрица дробей Rational (в режиме "float" — массив float64).
+    """
+    __slots__ = ()
+    _dtype = "float64"
+    _ring = (_integer_mul, _integer_sub, _integer_exact_div, 0, 1)
+
+    @staticmethod
+    def _element(value):
+        return _to_rational(value)
+
+    @staticmethod
+    def _scalar(value):
+        return float(value)
+
+    @staticmethod
+    def _wrap(value):
+        return float(value)
+
+    @staticmethod
+    def _scale(values):
+        """
+        :return:
+            tuple[list[int], int]: Числители после приведения к общему знаменателю и сам знаменатель.
+        """
+        denominator = _lcm_of_denominators(values)
+        return [value._numerator * (denominator // value._denominator) for value in values], denominator
+
+    _integers = _scale_left = _scale_right = _scale
+
+    @staticmethod
+    def _dot_scaled(row, column):
+        return Rational(_dot(row[0], column[0]), row[1] * column[1])
+
+    @staticmethod
+    def _ring_negate(value):
+        return -value
+
+    @staticmethod
+    def _from_ring(value, denominator):
+        return Rational(value, denominator)
+
+    _divide_ring = _from_ring
+
+
+class ComplexMatrix(_Matrix):
+    """
+    Плотная матрица комплексных чисел Complex (в режиме "float" — массив complex128).
+    Точный режим работает с гауссовыми рациональными числами.
+    """
+    __slots__ = ()
+    _dtype = "complex128"
+    _ring = (_gaussian_mul, _gaussian_sub, _gaussian_exact_div, (0, 0), (1, 0))
+
+    @staticmethod
+    def _element(value):
+        if isinstance(value, Complex):
+            return value.to_exact()
+        elif isinstance(value, complex):
+            return Complex(value.real, value.imag, backend="exact")
+        return Complex(value, backend="exact")
+
+    @staticmethod
+    def _scalar(value):
+        if isinstance(value, Complex):
+            return complex(float(value._real), float(value._imag))
+        return complex(value) if isinstance(value, complex) else complex(float(value))
+
+    @staticmethod
+    def _wrap(value):
+        return Complex._from_complex(complex(value))
+
+    @staticmethod
+    def _scale(values):
+        """
+        :return:
+            tuple[list[int], list[int], int]: Числители действительных и мнимых частей после приведения
+            к общему знаменателю и сам знаменатель.
+        """
+        denominator = _lcm_of_denominators([part for value in values for part in (value._real, value._imag)])
+        reals = [value._real._numerator * (denominator // value._real._denominator) for value in values]
+        imags = [value._imag._numerator * (denominator // value._imag._denominator) for value in values]
+        return reals, imags, denominator
+
+    @staticmethod
+    def _integers(values):
+        reals, imags, denominator = ComplexMatrix._scale(values)
+        return list(zip(reals, imags)), denominator
+
+    @staticmethod
+    def _scale_left(values):
+        # для строки a + bi заранее считается a + b
+        a, b, denominator = ComplexMatrix._scale(values)
+        return a, b, [x + y for x, y in zip(a, b)], denominator
+
+    @staticmethod
+    def _scale_right(values):
+        # для столбца c + di заранее считаются d - c и c + d
+        c, d, denominator = ComplexMatrix._scale(values)
+        return c, [y - x for x, y in zip(c, d)], [x + y for x, y in zip(c, d)], denominator
+
+    @staticmethod
+    def _dot_scaled(row, column):
+        # (a + bi)(c + di) за три скалярных произведения вместо четырёх
+        a, b, a_plus_b, d1 = row
+        c, d_minus_c, c_plus_d, d2 = column
+        k1 = _dot(a_plus_b, c)
+        k2 = _dot(a, d_minus_c)
+        k3 = _dot(b, c_plus_d)
+        denominator = d1 * d2
+        return Complex._from_parts(Rational(k1 - k3, denominator), Rational(k1 + k2, denominator))
+
+    @staticmethod
+    def _ring_negate(value):
+        return -value[0], -value[1]
+
+    @staticmethod
+    def _from_ring(value, denominator):
+        return Complex._from_parts(Rational(value[0], denominator), Rational(value[1], denominator))
+
+    @staticmethod
+    def _divide_ring(value, divisor):
+        return Complex._from_parts(Rational(value[0], 1), Rational(value[1], 1)) / \
+            Complex._from_parts(Rational(divisor[0], 1), Rational(divisor[1], 1))
@@ -0,0 +1,275 @@
+import struct
+
+import numpy as np
+
+from rational import Rational
+from complex import Complex
+from complex_array import ComplexArray
+from rational_array import RationalArray
+import codec
+
+# заголовок файла: сигнатура, версия, число элементов, смещение и длина таблицы переполнений
+MAGIC = b"RCMAP"
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+
+_HEADER = struct.Struct("<5sBxxQQQ")
+_RECORD = struct.Struct("<qqqq")
+# -2**63 в столбцы не записывается: RationalArray считает, что модуль любого элемента помещается в int64
+_INT64_MAX = (1 << 63) - 1
+
+# число записей, копящихся в памяти перед сбросом на диск
+WRITE_BATCH = 4096
+
+
+def _to_exact(value):
+    """
+    Приводит значение к точному Complex.
+    :param value (Complex | Rational | int): Значение.
+    :return:
+        Complex: Число в режиме "exact".
+    """
+    if isinstance(value, Complex):
+        return value.to_exact()
+    elif isinstance(value, (Rational, int)):
+        return Complex(value, backend="exact")
+    raise TypeError("values must be Complex, Rational or int")
+
+
+class MappedArrayWriter:
+    """
+    Потоковая запись массива комплексных дробей в файл для MappedComplexArray.
+    Каждый элемент — запись из четырёх int64 (числитель и знаменатель действительной и мнимой
+    частей). Элемент, часть которого не помещается в int64, записывается с нулевыми знаменателями,
+    а сами числа — в таблицу переполнений в конце файла (индекс и запись codec).
+    """
+    __slots__ = ('_file', '_batch', '_count', '_overflow')
+
+    def __init__(self, path):
+        """
+        :param path (str | os.PathLike): Путь к создаваемому файлу.
+        """
+        self._file = open(path, "wb")
+        self._file.write(bytes(HEADER_SIZE))
+        self._batch = bytearray()
+        self._count = 0
+        self._overflow = bytearray()
+
+    def append(self, value):
+        """
+        :param value (Complex | Rational | int): Значение.
+        """
+        value = _to_exact(value)
+        parts = (value._real._numerator, value._real._denominator, value._imag._numerator, value._imag._denominator)
+        if all(-_INT64_MAX <= part <= _INT64_MAX for part in parts):
+            self._batch += _RECORD.pack(*parts)
+        else:
+            self._batch += _RECORD.pack(0, 0, 0, 0)
+            codec._write_varint(self._overflow, self._count)
+            codec._encode(self._overflow, value)
+        self._count += 1
+        if len(self._batch) >= WRITE_BATCH * _RECORD.size:
+            self._file.write(self._batch)
+            self._batch = bytearray()
+
+    def extend(self, values):
+        """
+        :param values (iterable[Complex | Rational | int]): Значения.
+        """
+        for value in values:
+            self.append(value)
+
+    def close(self):
+        """
+        Дописывает таблицу переполнений и заголовок и закрывает файл.
+        """
+        if self._file.closed:
+            return
+        self._file.write(self._batch)
+        self._batch = bytearray()
+        overflow_offset = HEADER_SIZE + self._count * _RECORD.size
+        self._file.write(self._overflow)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, self._count, overflow_offset, len(self._overflow)))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def save(path, values):
+    """
+    Функция записи последовательности в файл.
+    :param path (str | os.PathLike): Путь к файлу.
+    :param values (iterable[Complex | Rational | int]): Значения.
+    """
+    with MappedArrayWriter(path) as writer:
+        writer.extend(values)
+
+
+def load(path):
+    """
+    Функция открытия файла, записанного MappedArrayWriter или save.
+    :param path (str | os.PathLike): Путь к файлу.
+    :return:
+        MappedComplexArray: Массив, отображённый в память.
+    """
+    return MappedComplexArray(path)
+
+
+class MappedComplexArray:
+    """
+    Массив комплексных дробей, отображённый в память (np.memmap, только чтение).
+    Столбцы числителей и знаменателей — представления отображения без копирования;
+    срезы тоже разделяют отображение. Объекты Complex создаются только при обращении
+    к отдельному элементу. Таблица переполнений читается один раз при открытии.
+    """
+    __slots__ = ('_records', '_indices', '_overflow')
+
+    def __init__(self, path):
+        """
+        Исключения:
+            ValueError: Если файл не является массивом этого формата или записан другой версией.
+        :param path (str | os.PathLike): Путь к файлу.
+        """
+        with open(path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+                raise ValueError("Not a mapped complex array file")
+            magic, version, count, overflow_offset, overflow_size = _HEADER.unpack_from(header)
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported format version: {version}")
+            file.seek(overflow_offset)
+            table = file.read(overflow_size)
+        if count:
+            records = np.memmap(path, dtype=np.int64, mode="r", offset=HEADER_SIZE, shape=(count, 4))
+            self._records = records.view(np.ndarray)
+        else:
+            self._records = np.empty((0, 4), dtype=np.int64)
+        self._indices = range(count)
+        self._overflow = {}
+        pos = 0
+        while pos < len(table):
+            index, pos = codec._read_varint(table, pos)
+            self._overflow[index], pos = codec._decode(table, pos)
+
+    def _view(self, records, indices):
+        """
+        Создаёт представление той же таблицы переполнений с другими записями.
+        :return:
+            MappedComplexArray: Новое представление.
+        """
+        array = object.__new__(MappedComplexArray)
+        array._records = records
+        array._indices = indices
+        array._overflow = self._overflow
+        return array
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        """
+        Функция получения элемента или среза.
+        :param index (int | slice): Индекс или срез.
+        :return:
+            Complex | MappedComplexArray: Элемент (создаётся при обращении) или представление среза без копирования.
+        """
+        if isinstance(index, slice):
+            return self._view(self._records[index], self._indices[index])
+        a, b, c, d = self._records[index].tolist()
+        if b == 0:
+            return self._overflow[self._indices[index]]
+        return Complex._from_parts(Rational._from_reduced(a, b), Rational._from_reduced(c, d))
+
+    def _column(self, k):
+        view = self._records[:, k]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def real_numerators(self):
+        """
+        :return:
+            np.ndarray: Числители действительных частей (int64, без копирования; 0 у переполненных элементов).
+        """
+        return self._column(0)
+
+    @property
+    def real_denominators(self):
+        """
+        :return:
+            np.ndarray: Знаменатели действительных частей (0 у переполненных элементов).
+        """
+        return self._column(1)
+
+    @property
+    def imag_numerators(self):
+        """
+        :return:
+            np.ndarray: Числители мнимых частей.
+        """
+        return self._column(2)
+
+    @property
+    def imag_denominators(self):
+        """
+        :return:
+            np.ndarray: Знаменатели мнимых частей.
+        """
+        return self._column(3)
+
+    @property
+    def is_int64(self) -> bool:
+        """
+        :return:
+            bool: True, если ни один элемент представления не хранится в таблице переполнений.
+        """
+        return not self._overflow or not np.any(self._records[:, 1] == 0)
+
+    def to_list(self):
+        """
+        :return:
+            list[Complex]: Все элементы представления.
+        """
+        return list(self)
+
+    def to_complex_array(self):
+        """
+        Функция получения ComplexArray в точном режиме.
+        Если переполнений нет, столбцы ComplexArray — те же представления отображения
+        (копирование не выполняется); иначе столбцы переводятся в Python int и дополняются
+        значениями из таблицы переполнений.
+        :return:
+            ComplexArray: Массив в точном режиме.
+        """
+        columns = [self._records[:, k] for k in range(4)]
+        if not self.is_int64:
+            columns = [column.astype(object) for column in columns]
+            for i in np.flatnonzero(self._records[:, 1] == 0).tolist():
+                value = self._overflow[self._indices[i]]
+                columns[0][i], columns[1][i] = value._real._numerator, value._real._denominator
+                columns[2][i], columns[3][i] = value._imag._numerator, value._imag._denominator
+        return ComplexArray._from_parts(RationalArray._from_columns(columns[0], columns[1]),
+                                        RationalArray._from_columns(columns[2], columns[3]))
+
+    def to_numpy(self):
+        """
+        :return:
+            np.ndarray: Значения в complex128 (копия).
+        """
+        if not self.is_int64:
+            return self.to_complex_array().to_numpy()
+        real = self._records[:, 0] / self._records[:, 1]
+        imag = self._records[:, 2] / self._records[:, 3]
+        return real + 1j * imag
+
+    def __repr__(self):
+        return f"MappedComplexArray(len={len(self)}, overflow={len(self._overflow)})"
@@ -0,0 +1,230 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from operator import mul
+
+from rational import Rational
+from complex import Complex
+
+# входы короче этого считаются в текущем процессе: запуск пула дороже самой работы
+MIN_PARALLEL_ITEMS = 256
+
+# желаемое время обработки одного фрагмента в рабочем процессе, с
+TARGET_CHUNK_SECONDS = 0.05
+
+# сколько фрагментов в среднем приходится на один процесс (для выравнивания нагрузки)
+CHUNKS_PER_WORKER = 4
+
+# число элементов, на которых автонастройка измеряет скорость работы
+SAMPLE_SIZE = 32
+
+
+def _encode(values):
+    """
+    Упаковывает фрагмент в компактный вид для передачи между процессами.
+    Дроби передаются как плоский кортеж числителей и знаменателей, комплексные числа — как
+    кортеж из четырёх целых на элемент (или пар float для режима "float"); это заметно короче
+    и быстрее pickle самих объектов. Целые передаются отдельным видом и остаются int, поэтому
+    тип результата не зависит от того, считался ли он в пуле. Остальные значения (в том числе
+    смесь int и Rational или точных и float-чисел Complex) передаются как есть.
+    :param values (list): Элементы фрагмента.
+    :return:
+        tuple[str, tuple]: Вид фрагмента и данные.
+    """
+    if all(value.__class__ is int for value in values):
+        return "int", tuple(values)
+    if all(isinstance(value, Rational) for value in values):
+        payload = []
+        for value in values:
+            payload += (value._numerator, value._denominator)
+        return "rational", tuple(payload)
+    if all(isinstance(value, Complex) for value in values):
+        if all(value._real.__class__ is not float for value in values):
+            payload = []
+            for value in values:
+                payload += (value._real._numerator, value._real._denominator,
+                            value._imag._numerator, value._imag._denominator)
+            return "complex", tuple(payload)
+        if all(value._real.__class__ is float for value in values):
+            return "float", tuple(value._as_complex() for value in values)
+    return "object", tuple(values)
+
+
+def _decode(kind, payload):
+    """
+    Обратная к _encode операция. Дроби уже несократимы, поэтому собираются без gcd.
+    :return:
+        list: Элементы фрагмента.
+    """
+    if kind == "rational":
+        return [Rational._from_reduced(payload[i], payload[i + 1]) for i in range(0, len(payload), 2)]
+    elif kind == "complex":
+        return [Complex._from_parts(Rational._from_reduced(payload[i], payload[i + 1]),
+                                    Rational._from_reduced(payload[i + 2], payload[i + 3]))
+                for i in range(0, len(payload), 4)]
+    elif kind == "float":
+        return [Complex._from_complex(z) for z in payload]
+    return list(payload)
+
+
+def _sum(values):
+    """
+    :return:
+        Rational | Complex: Сумма с одним сокращением в конце.
+    """
+    if any(isinstance(value, Complex) for value in values):
+        return Complex.sum(values)
+    return Rational.sum(values)
+
+
+def _prod(values):
+    """
+    :return:
+        Rational | Complex: Произведение.
+    """
+    if any(isinstance(value, Complex) for value in values):
+        return reduce(mul, values, Complex(1, 0, backend="exact"))
+    return reduce(mul, values, Rational(1, 1))
+
+
+def _dot(pairs):
+    """
+    :param pairs (list[tuple]): Пары множителей.
+    :return:
+        Rational | Complex: Сумма попарных произведений.
+    """
+    products = []
+    for a, b in pairs:
+        # у Rational нет умножения на Complex, поэтому комплексный множитель ставится первым
+        products.append(b * a if isinstance(b, Complex) and not isinstance(a, Complex) else a * b)
+    return _sum(products)
+
+
+def _map_worker(function, kind, payload):
+    return _encode([function(value) for value in _decode(kind, payload)])
+
+
+def _reduce_worker(operation, kind, payload):
+    return _encode([operation(_decode(kind, payload))])
+
+
+def _dot_worker(kind_a, payload_a, kind_b, payload_b):
+    return _encode([_dot(list(zip(_decode(kind_a, payload_a), _decode(kind_b, payload_b))))])
+
+
+def autotune_chunk_size(work, values, workers=None):
+    """
+    Подбирает размер фрагмента.
+    Время работы work измеряется на первых SAMPLE_SIZE элементах; фрагмент выбирается так,
+    чтобы его обработка занимала около TARGET_CHUNK_SECONDS (накладные расходы на передачу
+    малы по сравнению с работой), но на каждый процесс приходилось не меньше CHUNKS_PER_WORKER
+    фрагментов (чтобы процессы не простаивали в конце).
+    :param work (callable): Функция, обрабатывающая список элементов.
+    :param values (list): Все элементы.
+    :param workers (int | None): Число процессов (по умолчанию os.cpu_count()).
+    :return:
+        int: Размер фрагмента.
+    """
+    workers = workers or os.cpu_count() or 1
+    if not values:
+        return 1
+    sample = values[:SAMPLE_SIZE]
+    start = time.perf_counter()
+    work(sample)
+    per_item = (time.perf_counter() - start) / len(sample)
+    by_time = int(TARGET_CHUNK_SECONDS / per_item) if per_item > 0 else len(values)
+    by_balance = -(-len(values) // (workers * CHUNKS_PER_WORKER))
+    return max(1, min(by_time, by_balance))
+
+
+def _run(worker, shards, workers, executor):
+    """
+    Выполняет worker над закодированными фрагментами в пуле процессов.
+    :param shards (list[tuple]): Аргументы worker для каждого фрагмента.
+    :return:
+        list: Раскодированные результаты в порядке фрагментов.
+    """
+    if executor is not None:
+        results = list(executor.map(worker, *zip(*shards)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(worker, *zip(*shards)))
+    return [value for kind, payload in results for value in _decode(kind, payload)]
+
+
+def _shards(values, chunk_size):
+    return [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+
+def pmap(function, iterable, workers=None, chunk_size=None, executor=None):
+    """
+    Параллельный аналог list(map(function, iterable)) для Complex/Rational.
+    Функция должна быть определена на уровне модуля (её передаёт pickle).
+    :param function (callable): Функция одного аргумента.
+    :param iterable (iterable): Элементы.
+    :param workers (int | None): Число процессов (по умолчанию os.cpu_count()).
+    :param chunk_size (int | None): Размер фрагмента; если не указан, подбирается autotune_chunk_size.
+    :param executor (ProcessPoolExecutor | None): Готовый пул; без него пул создаётся на время вызова.
+    :return:
+        list: Результаты в исходном порядке.
+    """
+    values = list(iterable)
+    if len(values) < MIN_PARALLEL_ITEMS or (workers == 1 and executor is None):
+        return [function(value) for value in values]
+    if chunk_size is None:
+        chunk_size = autotune_chunk_size(lambda shard: [function(value) for value in shard], values, workers)
+    shards = [(function,) + _encode(shard) for shard in _shards(values, chunk_size)]
+    return _run(_map_worker, shards, workers, executor)
+
+
+def _preduce(operation, values, workers, chunk_size, executor):
+    """
+    Общая часть psum и pprod: каждый процесс сворачивает свой фрагмент, результаты
+    сворачиваются в текущем процессе.
+    """
+    if len(values) < MIN_PARALLEL_ITEMS or (workers == 1 and executor is None):
+        return operation(values)
+    if chunk_size is None:
+        chunk_size = autotune_chunk_size(operation, values, workers)
+    shards = [(operation,) + _encode(shard) for shard in _shards(values, chunk_size)]
+    return operation(_run(_reduce_worker, shards, workers, executor))
+
+
+def psum(iterable, workers=None, chunk_size=None, executor=None):
+    """
+    Параллельная сумма дробей или комплексных чисел.
+    :param iterable (iterable[Rational | Complex | int]): Слагаемые.
+    :return:
+        Rational | Complex: Сумма.
+    """
+    return _preduce(_sum, list(iterable), workers, chunk_size, executor)
+
+
+def pprod(iterable, workers=None, chunk_size=None, executor=None):
+    """
+    Параллельное произведение дробей или комплексных чисел.
+    :param iterable (iterable[Rational | Complex | int]): Множители.
+    :return:
+        Rational | Complex: Произведение.
+    """
+    return _preduce(_prod, list(iterable), workers, chunk_size, executor)
+
+
+def pdot(a, b, workers=None, chunk_size=None, executor=None):
+    """
+    Параллельное скалярное произведение (без сопряжения).
+    :param a (iterable[Rational | Complex | int]): Первый вектор.
+    :param b (iterable[Rational | Complex | int]): Второй вектор той же длины.
+    :return:
+        Rational | Complex: Сумма попарных произведений.
+    """
+    a, b = list(a), list(b)
+    if len(a) != len(b):
+        raise ValueError("Vectors must have the same length")
+    if len(a) < MIN_PARALLEL_ITEMS or (workers == 1 and executor is None):
+        return _dot(list(zip(a, b)))
+    if chunk_size is None:
+        chunk_size = autotune_chunk_size(_dot, list(zip(a, b)), workers)
+    shards = [_encode(x) + _encode(y) for x, y in zip(_shards(a, chunk_size), _shards(b, chunk_size))]
+    return _sum(_run(_dot_worker, shards, workers, executor))
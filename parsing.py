@@ -0,0 +1,64 @@
+import codecs
+
+from rational import Rational
+from complex import Complex
+
+# размер блока, которым iter_parse читает файл
+CHUNK_SIZE = 1 << 16
+
+PARSERS = {
+    "rational": Rational.parse,
+    "complex": Complex.parse,
+}
+
+
+def iter_parse(fileobj, kind: str = "complex", chunk_size: int = CHUNK_SIZE, separator: str = "\n"):
+    """
+    Генератор разбора значений из текстового потока: по одному значению на запись,
+    записи разделены separator (по умолчанию — перевод строки), пустые записи пропускаются.
+    Файл читается блоками по chunk_size символов, поэтому целиком в память не загружается;
+    запись, разрезанная границей блока, разбирается после дочитывания.
+    Двоичные файлы декодируются как UTF-8.
+    Исключения:
+        ValueError: Если запись не распознана (в сообщении указан её номер).
+    :param fileobj: Файл (или любой объект с методом read), открытый на чтение.
+    :param kind (str): "complex" (Complex.parse) или "rational" (Rational.parse).
+    :param chunk_size (int): Размер блока чтения.
+    :param separator (str): Разделитель записей.
+    :return:
+        iterator[Complex | Rational]: Значения в порядке записей.
+    """
+    if kind not in PARSERS:
+        raise ValueError(f"kind must be one of {tuple(PARSERS)}")
+    parse = PARSERS[kind]
+    tail = ""
+    number = 0
+    # многобайтовый символ может быть разрезан границей блока: декодер хранит его начало до следующего блока
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if isinstance(chunk, bytes):
+            final = not chunk
+            chunk = decoder.decode(chunk, final)
+            if not chunk and not final:
+                continue
+        if not chunk:
+            break
+        records = (tail + chunk).split(separator)
+        tail = records.pop()
+        for record in records:
+            number += 1
+            if record and not record.isspace():
+                yield _parse_record(parse, record, number)
+    if tail and not tail.isspace():
+        yield _parse_record(parse, tail, number + 1)
+
+
+def _parse_record(parse, record, number):
+    """
+    Разбирает одну запись, добавляя её номер в сообщение об ошибке.
+    """
+    try:
+        return parse(record)
+    except ValueError as error:
+        raise ValueError(f"record {number}: {error}") from None
@@ -0,0 +1,331 @@
+from rational import Rational
+from complex import Complex, _to_rational
+from complex_fft import convolve
+
+try:
+    from complex_array import ComplexArray
+    from rational_array import RationalArray
+except ImportError:
+    ComplexArray = RationalArray = None
+
+# начиная с этой длины обоих множителей произведение считается через complex_fft.convolve
+MULTIPLY_THRESHOLD = 32
+
+
+def _as_builtin(value) -> complex:
+    """
+    :return:
+        complex: Коэффициент или точка во float.
+    """
+    if isinstance(value, Complex):
+        return complex(float(value._real), float(value._imag))
+    return complex(float(value))
+
+
+class Polynomial:
+    """
+    Многочлен с коэффициентами Rational или Complex.
+    Коэффициенты хранятся по возрастанию степеней без старших нулей; если хотя бы один
+    коэффициент комплексный, все коэффициенты приводятся к Complex.
+    Объект неизменяемый: все операции возвращают новый многочлен.
+    """
+    __slots__ = ('_coefficients',)
+
+    def __init__(self, coefficients=()):
+        """
+        Инициализация многочлена.
+        :param coefficients (iterable[Rational | Complex | int | float | complex]): Коэффициенты
+            по возрастанию степеней: coefficients[k] — коэффициент при x^k.
+        """
+        items = []
+        for value in coefficients:
+            if isinstance(value, (Rational, Complex)):
+                items.append(value)
+            elif isinstance(value, complex):
+                items.append(Complex(value.real, value.imag, backend="exact"))
+            else:
+                items.append(_to_rational(value))
+        self._coefficients = Polynomial._normalize(items)
+
+    @staticmethod
+    def _normalize(items):
+        """
+        Приводит коэффициенты к одному типу и отбрасывает старшие нули.
+        :param items (list[Rational | Complex]): Коэффициенты.
+        :return:
+            tuple[Rational | Complex, ...]: Нормализованные коэффициенты.
+        """
+        if any(isinstance(value, Complex) for value in items):
+            items = [value if isinstance(value, Complex) else Complex(value, backend="exact") for value in items]
+        while items and items[-1] == 0:
+            items.pop()
+        return tuple(items)
+
+    @classmethod
+    def _from_coefficients(cls, items):
+        """
+        Создаёт многочлен из готового списка Rational/Complex без проверки типов.
+        :return:
+            Polynomial: Новый многочлен.
+        """
+        polynomial = object.__new__(cls)
+        polynomial._coefficients = Polynomial._normalize(list(items))
+        return polynomial
+
+    @property
+    def coefficients(self):
+        """
+        :return:
+            tuple[Rational | Complex, ...]: Коэффициенты по возрастанию степеней.
+        """
+        return self._coefficients
+
+    @property
+    def degree(self) -> int:
+        """
+        :return:
+            int: Степень многочлена (-1 для нулевого многочлена).
+        """
+        return len(self._coefficients) - 1
+
+    @property
+    def is_complex(self) -> bool:
+        """
+        :return:
+            bool: True, если коэффициенты хранятся как Complex.
+        """
+        return bool(self._coefficients) and isinstance(self._coefficients[0], Complex)
+
+    def _lift(self):
+        """
+        :return:
+            list[Complex]: Коэффициенты в виде Complex.
+        """
+        if self.is_complex:
+            return list(self._coefficients)
+        return [Complex(value, backend="exact") for value in self._coefficients]
+
+    def _coerce(self, other):
+        """
+        Приводит второй операнд к многочлену.
+        :param other (Polynomial | Rational | Complex | int | float | complex): Второй операнд.
+        :return:
+            Polynomial: Операнд в виде многочлена.
+        """
+        if isinstance(other, Polynomial):
+            return other
+        if isinstance(other, (Rational, Complex, int, float, complex)):
+            return Polynomial([other])
+        raise TypeError("Unsupported operand type")
+
+    def _pair(self, other):
+        """
+        Приводит коэффициенты обоих многочленов к общему типу.
+        :return:
+            tuple[list, list]: Коэффициенты self и other.
+        """
+        if self.is_complex or other.is_complex:
+            return self._lift(), other._lift()
+        return list(self._coefficients), list(other._coefficients)
+
+    def __call__(self, x):
+        """
+        Функция вычисления значения многочлена по схеме Горнера.
+        Для комплексных значений каждый шаг acc * x + c выполняется через Complex.fma,
+        т.е. с одним сокращением дробей на шаг.
+        :param x (Rational | Complex | int | float): Точка.
+        :return:
+            Rational | Complex: Значение многочлена.
+        """
+        if not self._coefficients:
+            return Complex(0, 0) if isinstance(x, Complex) else Rational(0, 1)
+        if isinstance(x, Complex) or self.is_complex:
+            coefficients = self._lift()
+            if not isinstance(x, Complex):
+                x = Complex(x, backend="exact")
+            result = coefficients[-1]
+            for c in reversed(coefficients[:-1]):
+                result = result.fma(x, c)
+            return result
+        x = _to_rational(x)
+        result = self._coefficients[-1]
+        for c in reversed(self._coefficients[:-1]):
+            result = result * x + c
+        return result
+
+    evaluate = __call__
+
+    def evaluate_many(self, points):
+        """
+        Функция вычисления многочлена во многих точках.
+        Для ComplexArray и RationalArray схема Горнера выполняется пакетно: degree шагов
+        над целыми массивами вместо цикла по точкам.
+        :param points (ComplexArray | RationalArray | iterable[Rational | Complex | int | float]): Точки.
+        :return:
+            ComplexArray | RationalArray | list: Значения в том же виде, что и точки.
+        """
+        if ComplexArray is not None and isinstance(points, (ComplexArray, RationalArray)):
+            if isinstance(points, RationalArray) and self.is_complex:
+                points = ComplexArray.from_rationals(points)
+            zeros = points * 0
+            if not self._coefficients:
+                return zeros
+            result = zeros + self._coefficients[-1]
+            for c in reversed(self._coefficients[:-1]):
+                result = result * points + c
+            return result
+        return [self(x) for x in points]
+
+    def __add__(self, other):
+        """
+        Функция сложения многочленов (или многочлена и числа).
+        :param other (Polynomial | Rational | Complex | int | float | complex): Второе слагаемое.
+        :return:
+            Polynomial: Сумма.
+        """
+        a, b = self._pair(self._coerce(other))
+        if len(a) < len(b):
+            a, b = b, a
+        return Polynomial._from_coefficients([x + y for x, y in zip(a, b)] + a[len(b):])
+
+    def __neg__(self):
+        """
+        :return:
+            Polynomial: Многочлен с противоположными коэффициентами.
+        """
+        return Polynomial._from_coefficients([-c for c in self._coefficients])
+
+    def __sub__(self, other):
+        """
+        Функция вычитания многочленов (или числа из многочлена).
+        :param other (Polynomial | Rational | Complex | int | float | complex): Вычитаемое.
+        :return:
+            Polynomial: Разность.
+        """
+        return self + (-self._coerce(other))
+
+    def __mul__(self, other):
+        """
+        Функция умножения многочленов (или многочлена на число).
+        Короткие многочлены перемножаются «в столбик» за O(n*m); если оба множителя длиннее
+        MULTIPLY_THRESHOLD, произведение считается как свёртка complex_fft.convolve:
+        точные коэффициенты упаковываются в одно большое целое (подстановка Кронекера,
+        умножение целых в CPython — Карацуба), коэффициенты во float — через БПФ.
+        :param other (Polynomial | Rational | Complex | int | float | complex): Второй множитель.
+        :return:
+            Polynomial: Произведение.
+        """
+        other = self._coerce(other)
+        if not self._coefficients or not other._coefficients:
+            return Polynomial()
+        a, b = self._pair(other)
+        if min(len(a), len(b)) >= MULTIPLY_THRESHOLD:
+            product = convolve(a, b)
+            if not (self.is_complex or other.is_complex):
+                product = [c._real for c in product]
+            return Polynomial._from_coefficients(product)
+        product = [None] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                term = x * y
+                product[i + j] = term if product[i + j] is None else product[i + j] + term
+        return Polynomial._from_coefficients(product)
+
+    def derivative(self):
+        """
+        :return:
+            Polynomial: Производная многочлена.
+        """
+        return Polynomial._from_coefficients([c * k for k, c in enumerate(self._coefficients) if k > 0])
+
+    def roots(self, refine: int = 1, tolerance: float = 1e-12, max_iterations: int = 500):
+        """
+        Функция поиска всех корней многочлена.
+        Сначала корни ищутся методом Дюрана–Кернера во float, затем каждый корень уточняется
+        refine шагами метода Ньютона в точной арифметике (из точного значения float без округления).
+        Один точный шаг примерно удваивает число верных знаков простого корня.
+        :param refine (int): Число точных шагов Ньютона; 0 — вернуть корни в режиме "float".
+        :param tolerance (float): Относительная точность остановки итераций во float.
+        :param max_iterations (int): Максимальное число итераций Дюрана–Кернера.
+        :return:
+            list[Complex]: Корни с учётом кратности.
+        """
+        if self.degree < 0:
+            raise ValueError("Zero polynomial has infinitely many roots")
+        coefficients = [_as_builtin(c) for c in self._coefficients]
+        leading = coefficients[-1]
+        monic = [c / leading for c in coefficients]
+        n = self.degree
+        approximations = [(0.4 + 0.9j) ** k for k in range(n)]
+        for _ in range(max_iterations):
+            change = 0.0
+            for i, z in enumerate(approximations):
+                value = 0j
+                for c in reversed(monic):
+                    value = value * z + c
+                denominator = 1 + 0j
+                for j, w in enumerate(approximations):
+                    if j != i:
+                        denominator *= z - w
+                if denominator == 0:
+                    # совпавшие приближения разводятся малым сдвигом
+                    denominator = complex(tolerance, tolerance)
+                step = value / denominator
+                approximations[i] = z - step
+                change = max(change, abs(step) / max(1.0, abs(z)))
+            if change <= tolerance:
+                break
+        result = [Complex._from_complex(z) for z in approximations]
+        if refine <= 0:
+            return result
+        derivative = self.derivative()
+        refined = []
+        for z in result:
+            z = z.to_exact()
+            for _ in range(refine):
+                slope = derivative(z)
+                if slope == 0:
+                    break
+                z = z - self(z) / slope
+            refined.append(z)
+        return refined
+
+    def __eq__(self, other):
+        """
+        Проверка на равенство многочленов (или многочлена и числа).
+        :param other (Polynomial | Rational | Complex | int | float | complex): Второй операнд.
+        :return:
+            bool: True, если все коэффициенты совпадают.
+        """
+        a, b = self._pair(self._coerce(other))
+        return len(a) == len(b) and all(x == y for x, y in zip(a, b))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        """
+        Хеш совпадает для равных многочленов: хеши Complex с нулевой мнимой частью
+        и равной дроби одинаковы.
+        :return:
+            int: Хеш многочлена.
+        """
+        return hash(self._coefficients)
+
+    def __str__(self):
+        """
+        :return:
+            str: Запись вида "c0 + c1*x + c2*x^2".
+        """
+        if not self._coefficients:
+            return "0"
+        terms = []
+        for k, c in enumerate(self._coefficients):
+            if c == 0:
+                continue
+            text = str(c)
+            terms.append(text if k == 0 else f"{text}*x" if k == 1 else f"{text}*x^{k}")
+        return " + ".join(terms)
+
+    def __repr__(self):
+        return f"Polynomial([{', '.join(repr(c) for c in self._coefficients)}])"
@@ -1,22 +1,353 @@
+from collections import OrderedDict
+from contextlib import contextmanager
 from fractions import Fraction
+from math import gcd, inf, nextafter
+import os
+import re
+import sys
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+# десятичная запись числа: целое, с дробной частью и/или порядком
+_NUMBER = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?"
+# дробь: число или "число / число"
+_TERM = rf"{_NUMBER}(?:\s*/\s*{_NUMBER})?"
+# наибольший модуль десятичного порядка в Rational.parse и Complex.parse: порядок задаёт
+# длину числителя или знаменателя, и без ограничения одна запись "1e-99999999" разбирается минутами
+PARSE_MAX_EXPONENT = 10000
+_RATIONAL_RE = re.compile(
+    rf"\s*(?:(?P<value>{_TERM})"
+    r"|Rational\(\s*(?P<rn>[+-]?\d+)\s*,\s*(?P<rd>[+-]?\d+)\s*\)"
+    r"|Rational number:\s*(?P<pn>[+-]?\d+)\s*/\s*(?P<pd>[+-]?\d+))\s*")
+
+
+def _decimal_ratio(text):
+    """
+    Переводит десятичную запись числа в точную пару (числитель, знаменатель) без float.
+    Исключения:
+        ValueError: Если модуль порядка больше PARSE_MAX_EXPONENT.
+    :param text (str): Запись, соответствующая _NUMBER.
+    :return:
+        tuple[int, int]: Числитель и положительный знаменатель (не обязательно несократимые).
+    """
+    mantissa, _, exponent = text.replace("E", "e").partition("e")
+    integer, _, fraction = mantissa.partition(".")
+    numerator = int(integer + fraction)
+    exponent = int(exponent) if exponent else 0
+    if abs(exponent) > PARSE_MAX_EXPONENT:
+        raise ValueError(f"Exponent {exponent} exceeds PARSE_MAX_EXPONENT ({PARSE_MAX_EXPONENT})")
+    scale = exponent - len(fraction)
+    if scale >= 0:
+        return numerator * 10 ** scale, 1
+    return numerator, 10 ** -scale
+
+
+def _term_ratio(text):
+    """
+    Переводит запись дроби ("число" или "число / число") в пару (числитель, знаменатель).
+    :param text (str): Запись, соответствующая _TERM.
+    :return:
+        tuple[int, int]: Числитель и знаменатель (знаменатель может быть отрицательным или нулём).
+    """
+    top, slash, bottom = text.partition("/")
+    if "." in top or "e" in top or "E" in top:
+        n, d = _decimal_ratio(top.strip())
+    else:
+        n, d = int(top), 1
+    if slash:
+        if "." in bottom or "e" in bottom or "E" in bottom:
+            n2, d2 = _decimal_ratio(bottom.strip())
+            return n * d2, d * n2
+        return n, d * int(bottom)
+    return n, d
+
+
+class _InternTable:
+    """
+    Таблица интернирования малых дробей с вытеснением по LRU.
+    Атрибуты:
+        maxsize (int): Максимальное число вытесняемых записей.
+        max_component (int): Наибольший модуль числителя и знаменателя интернируемой дроби.
+        pinned (dict): Закреплённые значения (0, 1, -1, 1/2, -1/2), которые никогда не вытесняются.
+        entries (OrderedDict): Остальные записи в порядке последнего использования.
+    """
+    __slots__ = ('maxsize', 'max_component', 'pinned', 'entries', 'hits', 'misses')
+
+    def __init__(self, maxsize: int, max_component: int):
+        self.maxsize = maxsize
+        self.max_component = max_component
+        self.pinned = {}
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, n: int, m: int):
+        """
+        Возвращает интернированную дробь n / m, создавая её при промахе.
+        :param n: Числитель несократимой дроби.
+        :param m: Положительный знаменатель.
+        :return:
+            Rational: Общий экземпляр дроби.
+        """
+        key = (n, m)
+        r = self.pinned.get(key)
+        if r is not None:
+            self.hits += 1
+            return r
+        entries = self.entries
+        r = entries.get(key)
+        if r is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return r
+        self.misses += 1
+        r = object.__new__(Rational)
+        r._numerator = n
+        r._denominator = m
+        entries[key] = r
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return r
+
+
+_intern_table = None
+
+
+class _PrecisionPolicy:
+    """
+    Политика ограниченной точности: знаменатель каждой новой дроби не больше max_denominator.
+    Дробь с большим знаменателем заменяется ближайшей дробью с допустимым знаменателем
+    (наилучшее рациональное приближение, как Fraction.limit_denominator).
+    Атрибуты:
+        max_denominator (int): Наибольший допустимый знаменатель.
+        roundings (int): Число округлённых дробей.
+        error_bound (float): Сумма модулей ошибок всех округлений (округлена вверх).
+        max_error (float): Наибольшая ошибка одного округления.
+    """
+    __slots__ = ('max_denominator', 'roundings', 'error_bound', 'max_error')
+
+    def __init__(self, max_denominator: int):
+        self.max_denominator = max_denominator
+        self.roundings = 0
+        self.error_bound = 0.0
+        self.max_error = 0.0
+
+    def round(self, n: int, m: int):
+        """
+        Находит ближайшую к n / m дробь со знаменателем не больше max_denominator
+        и учитывает ошибку округления.
+        :param n: Числитель.
+        :param m: Положительный знаменатель, больший max_denominator.
+        :return:
+            tuple[int, int]: Несократимые числитель и знаменатель приближения.
+        """
+        bound = self.max_denominator
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        a, b = n, m
+        while True:
+            k = a // b
+            q2 = q0 + k * q1
+            if q2 > bound:
+                break
+            p0, q0, p1, q1 = p1, q1, p0 + k * p1, q2
+            a, b = b, a - k * b
+        k = (bound - q0) // q1
+        # из двух граничных приближений выбирается ближайшее
+        if 2 * b * (q0 + k * q1) <= m:
+            p, q = p1, q1
+        else:
+            p, q = p0 + k * p1, q0 + k * q1
+        error = nextafter(abs(p * m - n * q) / (q * m), inf)
+        self.roundings += 1
+        self.error_bound = nextafter(self.error_bound + error, inf)
+        if error > self.max_error:
+            self.max_error = error
+        return p, q
+
+
+_precision_policy = None
+
 
 class Rational:
     """
     Класс для работы с рациональными числами.
     Атрибуты:
-        __numerator (int): Числитель дроби
-        __denominator (int): Знаменатель дроби
+        _numerator (int): Числитель дроби
+        _denominator (int): Знаменатель дроби
+    Объекты неизменяемы: арифметические операции всегда возвращают новую дробь.
+    Дробь всегда хранится в каноническом виде: несократима, знак находится в числителе,
+    знаменатель положителен.
     """
+    __slots__ = ('_numerator', '_denominator')
+
     def __init__(self, n: int, m: int):
         """
         Инициализация дроби с заданным числителем и знаменателем.
+        Дробь сразу приводится к каноническому виду.
 
         Аргументы:
             n (int): Числитель дроби.
             m (int): Знаменатель дроби.
+        Исключения:
+            TypeError: Если числитель или знаменатель не являются целыми числами.
+            ValueError: Если знаменатель равен нулю.
+        """
+        if not isinstance(n, int) or not isinstance(m, int):
+            raise TypeError("Numerator and denominator must be integers")
+        if m == 0:
+            raise ValueError("Denominator cannot be zero.")
+        if m < 0:
+            n, m = -n, -m
+        common_divisor = gcd(n, m)
+        if common_divisor != 1:
+            n //= common_divisor
+            m //= common_divisor
+        policy = _precision_policy
+        if policy is not None and m > policy.max_denominator:
+            n, m = policy.round(n, m)
+        self._numerator = n
+        self._denominator = m
+
+    @classmethod
+    def _from_reduced(cls, n: int, m: int):
+        """
+        Создаёт дробь без проверки и сокращения.
+        Используется операторами, когда результат заведомо канонический.
+        :param n: Числитель, взаимно простой со знаменателем.
+        :param m: Положительный знаменатель.
+        :return:
+            Rational: Новая дробь.
+        """
+        policy = _precision_policy
+        if policy is not None and m > policy.max_denominator:
+            n, m = policy.round(n, m)
+        table = _intern_table
+        if table is not None and cls is Rational:
+            bound = table.max_component
+            if m <= bound and -bound <= n <= bound:
+                return table.get(n, m)
+        r = object.__new__(cls)
+        r._numerator = n
+        r._denominator = m
+        return r
+
+    @staticmethod
+    def enable_interning(maxsize: int = 4096, max_component: int = 64):
+        """
+        Включает интернирование малых дробей.
+        После включения операции, результат которых равен малой дроби, возвращают общий
+        экземпляр из таблицы вместо создания нового. Значения 0, 1, -1, 1/2 и -1/2 закреплены,
+        остальные вытесняются по LRU при превышении maxsize.
+        :param maxsize: Максимальное число вытесняемых записей в таблице.
+        :param max_component: Наибольший модуль числителя и знаменателя интернируемой дроби.
+        """
+        global _intern_table
+        if maxsize < 0 or max_component < 1:
+            raise ValueError("maxsize must be non-negative and max_component must be positive")
+        table = _InternTable(maxsize, max_component)
+        for n, m in ((0, 1), (1, 1), (-1, 1), (1, 2), (-1, 2)):
+            if m <= max_component and abs(n) <= max_component:
+                r = object.__new__(Rational)
+                r._numerator = n
+                r._denominator = m
+                table.pinned[(n, m)] = r
+        _intern_table = table
+
+    @staticmethod
+    def disable_interning():
+        """
+        Выключает интернирование и освобождает таблицу.
+        """
+        global _intern_table
+        _intern_table = None
+
+    @staticmethod
+    def interning_info():
+        """
+        Возвращает статистику таблицы интернирования.
+        :return:
+            dict | None: Попадания, промахи, размер и ограничения таблицы, или None, если интернирование выключено.
+        """
+        table = _intern_table
+        if table is None:
+            return None
+        return {
+            "hits": table.hits,
+            "misses": table.misses,
+            "size": len(table.pinned) + len(table.entries),
+            "maxsize": table.maxsize,
+            "max_component": table.max_component,
+        }
+
+    @staticmethod
+    def enable_precision_cap(max_bits: int | None = None, max_denominator: int | None = None):
+        """
+        Включает режим ограниченной точности для всех новых дробей (и частей Complex в режиме "exact").
+        Дробь, знаменатель которой превышает предел, заменяется ближайшей дробью с допустимым
+        знаменателем; так длина чисел в итерационных алгоритмах перестаёт расти.
+        Ошибки округлений суммируются, см. precision_info.
+        Исключения:
+            ValueError: Если не задан ровно один из пределов или предел меньше 1.
+        :param max_bits: Наибольшая длина знаменателя в битах.
+        :param max_denominator: Наибольший знаменатель.
+        """
+        global _precision_policy
+        if (max_bits is None) == (max_denominator is None):
+            raise ValueError("Exactly one of max_bits and max_denominator must be given")
+        if max_bits is not None:
+            max_denominator = (1 << max_bits) - 1 if max_bits > 0 else 0
+        if max_denominator < 1:
+            raise ValueError("Denominator cap must be at least 1")
+        _precision_policy = _PrecisionPolicy(max_denominator)
+
+    @staticmethod
+    def disable_precision_cap():
+        """
+        Выключает режим ограниченной точности; уже созданные дроби не меняются.
+        """
+        global _precision_policy
+        _precision_policy = None
+
+    @staticmethod
+    def precision_info():
         """
-        self.__numerator = n
-        self.__denominator = m
+        Возвращает статистику режима ограниченной точности.
+        error_bound — сумма модулей ошибок всех округлений; это оценка внесённой ошибки,
+        а не строгая граница ошибки результата: последующие операции могут её усилить
+        (строгие границы даёт интервальная арифметика).
+        :return:
+            dict | None: Предел знаменателя, число округлений, суммарная и наибольшая ошибка, или None, если режим выключен.
+        """
+        policy = _precision_policy
+        if policy is None:
+            return None
+        return {
+            "max_denominator": policy.max_denominator,
+            "roundings": policy.roundings,
+            "error_bound": policy.error_bound,
+            "max_error": policy.max_error,
+        }
+
+    @staticmethod
+    @contextmanager
+    def precision_cap(max_bits: int | None = None, max_denominator: int | None = None):
+        """
+        Контекстный менеджер, включающий режим ограниченной точности на время блока.
+        Внутри блока ведётся своя статистика; по выходе восстанавливается прежняя политика.
+        :param max_bits: Наибольшая длина знаменателя в битах.
+        :param max_denominator: Наибольший знаменатель.
+        :return:
+            _PrecisionPolicy: Политика блока; её атрибуты roundings, error_bound и max_error
+            обновляются по мере вычислений и доступны после выхода из блока.
+        """
+        global _precision_policy
+        previous = _precision_policy
+        Rational.enable_precision_cap(max_bits, max_denominator)
+        try:
+            yield _precision_policy
+        finally:
+            _precision_policy = previous
 
     #getter
     @property
@@ -26,23 +357,7 @@ class Rational:
         :return:
             int: Числитель дроби
         """
-        return self.__numerator
-
-    #setter
-    @numerator.setter
-    def numerator(self, value: int):
-        """
-        Устанавливает числитель дроби.
-        :param value: Новое значение числителя. Может быть целым числом или объектом Rational.
-        Исключения:
-            ValueError: Если значение не является целым числом или объектом Rational.
-        """
-        if isinstance(value, int):
-            self.__numerator = value
-        elif isinstance(value, Rational):
-            self.__numerator = value.numerator
-        else:
-            raise ValueError("Numerator must be an integer or Rational")
+        return self._numerator
 
     @property
     def denominator(self):
@@ -51,77 +366,43 @@ class Rational:
         :return:
             int: Знаменатель дроби
         """
-        return self.__denominator
-
-    @denominator.setter
-    def denominator(self, value: int):
-        """
-        Устанавливает знаменатель дроби.
-        :param value: Новое значение знаменателя. Может быть целым числом или объектом Rational.
-        Исключения:
-            ValueError: Если значение не является целым числом или объектом Rational, или если знаменатель равен нулю.
-        """
-        if isinstance(value, int):
-            if value == 0:
-                raise ValueError("Denominator cannot be zero.")
-            self.__denominator = value
-        elif isinstance(value, Rational):
-            self.__denominator = value.denominator
-        else:
-            raise ValueError("Denominator must be an integer or Rational.")
-        if value != 0:
-            self.__denominator = value
-        else:
-            raise ValueError("Division by zero")
-
+        return self._denominator
 
     def reduce(self):
         """
         Функция сокращает дробь до несократимого вида.
-        Метод находит наибольший общий делитель (НОД) числителя и знаменателя
-        и делит их на него, чтобы сократить дробь.
+        Дробь сокращается уже при создании, поэтому метод ничего не делает
+        и оставлен для совместимости.
+        :return:
+            Rational: Текущая дробь.
         """
-        def gcd(a, b):
-            while b:
-                a, b = b, a % b
-            return a
-
-
-        numerator = self.numerator if isinstance(self.numerator, int) else self.numerator.numerator
-        denominator = self.denominator if isinstance(self.denominator, int) else self.denominator.numerator
-
-        common_divisor = gcd(numerator, denominator)
-
-
-        if isinstance(self.numerator, int):
-            self.numerator = self.numerator // common_divisor
-        else:
-            self.numerator = Rational(self.numerator.numerator // common_divisor, self.numerator.denominator)
-
-        if isinstance(self.denominator, int):
-            self.denominator = self.denominator // common_divisor
-        else:
-            self.denominator = Rational(self.denominator.numerator // common_divisor, self.denominator.denominator)
-        if self.denominator < 0:
-            self.numerator *= -1
-            self.denominator *= -1
+        return self
 
 
     def __add__(self, other):
         """
         Функция сложения рационального числа с другим числом (дробью или целым числом).
+        Используется алгоритм Хенричи: НОД считается от знаменателей, а не от произведений.
             :param other: Другое рациональное число.
             :return:
                 Сумма двух рациональных чисел.
         """
         if isinstance(other, Rational): # проверка на соответствие типов (other это тип Rational)
-            r = Rational(self.numerator * other.denominator + self.denominator * other.numerator,
-                         self.denominator * other.denominator)
-            r.reduce()
-            return r
+            a, b = self._numerator, self._denominator
+            c, d = other._numerator, other._denominator
+            g = gcd(b, d)
+            if g == 1:
+                return Rational._from_reduced(a * d + b * c, b * d)
+            s = b // g
+            t = a * (d // g) + c * s
+            g2 = gcd(t, g)
+            if g2 == 1:
+                return Rational._from_reduced(t, s * d)
+            return Rational._from_reduced(t // g2, s * (d // g2))
         elif isinstance(other, int):
-            return Rational(self.numerator + other * self.denominator,
-                            self.denominator)
+            # (a + k*b) / b несократима, если несократима a / b
+            return Rational._from_reduced(self._numerator + other * self._denominator,
+                                          self._denominator)
         else:
             raise TypeError("Denominator must be an integer or Rational")
 
@@ -134,13 +415,10 @@ class Rational:
             Разность двух рациональных чисел.
         """
         if isinstance(other, Rational):
-            r = Rational(self.numerator * other.denominator - self.denominator * other.numerator,
-                         self.denominator * other.denominator)
-            r.reduce()
-            return r
+            return self + Rational._from_reduced(-other._numerator, other._denominator)
         elif isinstance(other, int):
-            return Rational(self.numerator - other * self.denominator,
-                            self.denominator)
+            return Rational._from_reduced(self._numerator - other * self._denominator,
+                                          self._denominator)
         else:
             raise TypeError("Denominator must be an integer or Rational")
 
@@ -148,33 +426,29 @@ class Rational:
     def __mul__(self, other):
         """
         Функция умножения рационального числа на другое число (другую дробь или целое число).
+        Перекрёстные НОД сокращают множители до умножения, поэтому результат уже несократим.
         :param other: Другое рациональное число.
         :return:
             Новая дробь, представляющая результат умножения.
         """
         if isinstance(other, Rational):
-            # убедимся, что числители и знаменатели — целые числа
-            numerator1 = self.numerator if isinstance(self.numerator, int) else self.numerator.numerator
-            denominator1 = self.denominator if isinstance(self.denominator, int) else self.denominator.numerator
-            numerator2 = other.numerator if isinstance(other.numerator, int) else other.numerator.numerator
-            denominator2 = other.denominator if isinstance(other.denominator, int) else other.denominator.numerator
-
-            new_numerator = numerator1 * numerator2
-            new_denominator = denominator1 * denominator2
-
-            r = Rational(new_numerator, new_denominator)
-            r.reduce()
-            return r
+            a, b = self._numerator, self._denominator
+            c, d = other._numerator, other._denominator
+            g1 = gcd(a, d)
+            if g1 > 1:
+                a //= g1
+                d //= g1
+            g2 = gcd(c, b)
+            if g2 > 1:
+                c //= g2
+                b //= g2
+            return Rational._from_reduced(a * c, b * d)
         elif isinstance(other, int):
-            numerator = self.numerator if isinstance(self.numerator, int) else self.numerator.numerator
-            denominator = self.denominator if isinstance(self.denominator, int) else self.denominator.numerator
-
-            new_numerator = numerator * other
-            new_denominator = denominator
-
-            r = Rational(new_numerator, new_denominator)
-            r.reduce()
-            return r
+            b = self._denominator
+            g = gcd(other, b)
+            if g > 1:
+                return Rational._from_reduced(self._numerator * (other // g), b // g)
+            return Rational._from_reduced(self._numerator * other, b)
         else:
             raise TypeError("Unsupported operand type")
 
@@ -187,139 +461,90 @@ class Rational:
             Новая дробь, представляющая результат деления.
         """
         if isinstance(other, Rational):
-            if other.numerator == 0:
+            c = other._numerator
+            if c == 0:
                 raise ZeroDivisionError("Cannot divide by zero")
-            r = Rational(self.numerator * other.denominator, self.denominator * other.numerator)
-            r.reduce()
-            return r
+            a, b = self._numerator, self._denominator
+            d = other._denominator
+            g1 = gcd(a, c)
+            if g1 > 1:
+                a //= g1
+                c //= g1
+            g2 = gcd(d, b)
+            if g2 > 1:
+                d //= g2
+                b //= g2
+            if c < 0:
+                return Rational._from_reduced(-a * d, -b * c)
+            return Rational._from_reduced(a * d, b * c)
         elif isinstance(other, int):
             if other == 0:
                 raise ZeroDivisionError("Cannot divide by zero")
-            return Rational(self.numerator, self.denominator * other)
+            a = self._numerator
+            g = gcd(a, other)
+            if g > 1:
+                a //= g
+                other //= g
+            if other < 0:
+                return Rational._from_reduced(-a, self._denominator * -other)
+            return Rational._from_reduced(a, self._denominator * other)
         else:
             raise TypeError("Denominator must be an integer or Rational")
 
 
     def __eq__(self, other):
         """
-        Функция сравнения двух дробей.
-        :param other: Число, с которым нужно сравнить текущую дробь.
+        Функция сравнения дроби с числом.
+        Обе дроби канонические, поэтому достаточно сравнить числители и знаменатели.
+        С Fraction и float сравнение точное, как у Fraction, поэтому равные числа имеют равный хеш
+        и дроби можно смешивать с ними в множествах и ключах словарей.
+        :param other (Rational | int | Fraction | float): Число, с которым нужно сравнить текущую дробь.
         :return:
-            bool: True, если дроби равны, иначе False.
+            bool: True, если числа равны, иначе False (NotImplemented для прочих типов).
         """
-        if isinstance(other, Rational):  # проверка на соответствие типов(other это тип Rational)
-            return (self.numerator * other.denominator) == (self.denominator * other.numerator)
+        if isinstance(other, (Rational, Fraction)):
+            return self._numerator == other.numerator and self._denominator == other.denominator
         elif isinstance(other, int):
-            return self.numerator == (other * self.denominator)
-        else:
-            raise TypeError("other operand must be an integer or Rational")
+            return self._denominator == 1 and self._numerator == other
+        elif isinstance(other, float):
+            if other != other or other in (inf, -inf):
+                return False
+            return self == Rational.from_float(other)
+        return NotImplemented
 
 
     def __ne__(self, other):
         """
-        Функция проверки на неравенство двух дробей.
-        :param other: Число, с которым нужно сравнить текущую дробь.
-        :return:
-            bool: True, если дроби не равны, иначе False.
-        """
-        if not isinstance(other, Rational | int):
-            raise TypeError("other operand must be an integer or Rational")
-        return not self == other
-
-
-    def __iadd__(self, other):
-        """
-        Функция сложения с присваиванием текущей дроби с другим числом (дробью или целым числом).
-        :param other: Число, которое нужно добавить к текущей дроби.
-        :return:
-            Rational: Текущая дробь после сложения.
-        """
-        if isinstance(other, Rational):
-            new_numerator = self.numerator * other.denominator + other.numerator * self.denominator
-            new_denominator = self.denominator * other.denominator
-            self.numerator = new_numerator
-            self.denominator = new_denominator
-            self.reduce()
-            return self
-        elif isinstance(other, int):
-            new_numerator = self.numerator + other * self.denominator
-            self.numerator = new_numerator
-            return self
-        else:
-            raise TypeError("other operand must be an integer or Rational")
-
-
-    def __isub__(self, other):
-        """
-        Функция вычитания с присваиванием из текущей дроби другого числа (дроби или целого числа).
-        :param other: Число, которое нужно вычесть из текущей дроби.
+        Функция проверки на неравенство дроби и числа.
+        :param other (Rational | int | Fraction | float): Число, с которым нужно сравнить текущую дробь.
         :return:
-            Rational: Текущая дробь после вычитания.
+            bool: True, если числа не равны, иначе False (NotImplemented для прочих типов).
         """
-        if isinstance(other, Rational):
-            new_numerator = self.numerator * other.denominator - self.denominator * other.numerator
-            new_denominator = self.denominator * other.denominator
-            self.numerator = new_numerator
-            self.denominator = new_denominator
-            self.reduce()
-            return self
-        elif isinstance(other, int):
-            new_numerator = self.numerator - other * self.denominator
-            self.numerator = new_numerator
-            self.reduce()
-            return self
-        else:
-            raise TypeError("other operand must be an integer or Rational")
-
-
-    def __imul__(self, other):
-        """
-        Функция умножения с присваиванием текущей дроби на другое число (дробь или целое число).
-        :param other: Число, на которое нужно умножить текущую дробь.
-        :return:
-            Текущая дробь после умножения.
-        """
-        if isinstance(other, Rational):
-            new_numerator = self.numerator * other.numerator
-            new_denominator = self.denominator * other.denominator
-            self.numerator = new_numerator
-            self.denominator = new_denominator
-            self.reduce()
-            return self
-        elif isinstance(other, int):
-            new_numerator = self.numerator * other
-            self.numerator = new_numerator
-            self.reduce()
-            return self
-        else:
-            raise TypeError("other operand must be an integer or Rational")
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
 
-    def __itruediv__(self, other):
+    def __hash__(self):
         """
-        Функция деления с присваиванием текущей дроби на другое число (дробь или целое число).
-        :param other: Число, на которое нужно разделить текущую дробь.
+        Функция получения хеша дроби.
+        Равные дроби имеют одинаковый хеш, совпадающий с хешем Fraction и int.
         :return:
-            Текущая дробь после деления.
-        """
-        if isinstance(other, Rational):
-            if other.numerator == 0:
-                raise ZeroDivisionError("Cannot divide by zero")
-            new_numerator = self.numerator * other.denominator
-            new_denominator = self.denominator * other.numerator
-            self.numerator = new_numerator
-            self.denominator = new_denominator
-            self.reduce()
-            return self
-        elif isinstance(other, int):
-            if other == 0:
-                raise ValueError("Cannot divide by zero")
-            new_denominator = self.denominator * other
-            self.denominator = new_denominator
-            self.reduce()
-            return self
+            int: Хеш дроби.
+        """
+        # тот же алгоритм, что и в Fraction.__hash__, но без создания Fraction
+        numerator = self._numerator
+        try:
+            inverse = pow(self._denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            # знаменатель кратен модулю хеширования
+            result = _HASH_INF
         else:
-            raise TypeError("other operand must be an integer or Rational")
+            result = hash(hash(abs(numerator)) * inverse)
+        if numerator < 0:
+            result = -result
+        return -2 if result == -1 else result
 
 
     def __neg__(self):
@@ -328,22 +553,29 @@ class Rational:
         :return:
             Rational: Противоположное число.
         """
-        return Rational(-self.numerator, self.denominator)
+        return Rational._from_reduced(-self._numerator, self._denominator)
 
 
-    def __pow__(self, other: int | None):
+    def __pow__(self, other: int):
         """
         Функция возведения дроби в степень.
         :param other(int): Степень, в которую нужно возвести дробь.
         :return:
             Новая дробь, представляющая результат возведения в степень.
         """
+        if not isinstance(other, int):
+            raise TypeError("Exponent must be an integer")
         if other < 0:
-            return Rational(self.denominator ** (other), self.numerator ** (other))
+            if self._numerator == 0:
+                raise ZeroDivisionError("Cannot raise zero to a negative power")
+            numerator, denominator = self._denominator ** -other, self._numerator ** -other
+            if denominator < 0:
+                return Rational._from_reduced(-numerator, -denominator)
+            return Rational._from_reduced(numerator, denominator)
         elif other > 0:
-            return Rational(self.numerator ** (abs(other)), self.denominator ** (abs(other)))
+            return Rational._from_reduced(self._numerator ** other, self._denominator ** other)
         else:
-            return Rational(1,1)
+            return Rational._from_reduced(1, 1)
 
 
     def __abs__(self):
@@ -352,7 +584,7 @@ class Rational:
         :return:
             Новая дробь, представляющая абсолютное значение текущей дроби.
         """
-        return Rational(abs(self.numerator), abs(self.denominator))
+        return Rational._from_reduced(abs(self._numerator), self._denominator)
 
     def __str__(self):
         """
@@ -360,10 +592,7 @@ class Rational:
         :return:
             Строковое представление дроби, округленное до 10 знаков после запятой.
         """
-        numerator = self.__numerator if isinstance(self.__numerator, int) else self.__numerator.numerator
-        denominator = self.__denominator if isinstance(self.__denominator, int) else self.__denominator.numerator
-
-        result = numerator / denominator
+        result = self._numerator / self._denominator
         return str(round(result, 10))
 
     def __float__(self):
@@ -372,20 +601,92 @@ class Rational:
         :return:
             float: Десятичное представление дроби.
         """
-        numerator = self.numerator if isinstance(self.numerator, int) else self.numerator.numerator
-        denominator = self.denominator if isinstance(self.denominator, int) else self.denominator.numerator
-        return numerator / denominator
+        return self._numerator / self._denominator
 
     @staticmethod
-    def from_float(value: float):
+    def sum(iterable, start=0):
+        """
+        Функция суммирования последовательности дробей с отложенным сокращением.
+        Промежуточные суммы не сокращаются, поэтому для длинных последовательностей
+        это значительно быстрее, чем последовательное применение оператора +.
+        :param iterable (iterable[Rational | int]): Слагаемые.
+        :param start (Rational | int): Начальное значение суммы.
+        :return:
+            Rational: Сумма в каноническом виде.
+        """
+        accumulator = RationalAccumulator(start)
+        add = accumulator.add
+        for value in iterable:
+            add(value)
+        return accumulator.value()
+
+    @staticmethod
+    def from_float(value: float, max_denominator: int | None = None):
         """
         Функция получения Rational из float.
+        По умолчанию преобразование точное: используется float.as_integer_ratio(), поэтому
+        Rational.from_float(0.1) равно 3602879701896397 / 36028797018963968.
+        Если указан max_denominator, возвращается ближайшая дробь со знаменателем
+        не больше max_denominator (поиск по цепным дробям).
         :param value: float, из которого нужно получить Rational.
+        :param max_denominator: Наибольший допустимый знаменатель при приближении.
+        Исключения:
+            OverflowError: Если value бесконечно.
+            ValueError: Если value равно NaN.
         :return:
             Rational: Rational, полученный из float.
         """
-        frac = Fraction(value).limit_denominator()
-        return Rational(frac.numerator, frac.denominator)
+        if max_denominator is None:
+            return Rational._from_reduced(*value.as_integer_ratio())
+        frac = Fraction(value).limit_denominator(max_denominator)
+        return Rational._from_reduced(frac.numerator, frac.denominator)
+
+    @staticmethod
+    def from_floats(values):
+        """
+        Функция точного преобразования последовательности float в список Rational.
+        Принимает список, массив NumPy, array.array или memoryview: буферы переводятся
+        в список Python float одним вызовом tolist().
+        :param values: Последовательность или буфер чисел float.
+        :return:
+            list[Rational]: Точные дроби в том же порядке.
+        """
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        from_reduced = Rational._from_reduced
+        result = []
+        append = result.append
+        for value in values:
+            if value.__class__ is not float:
+                value = float(value)
+            append(from_reduced(*value.as_integer_ratio()))
+        return result
+
+    @staticmethod
+    def parse(text: str):
+        """
+        Функция разбора текстовой записи дроби.
+        Понимает целые ("-7"), десятичные ("0.25", "-1.5e-3"), дроби ("3/4", "-1 / 2", "0.5/3")
+        и вывод repr ("Rational(1, 3)") и print_fraction ("Rational number: 1 / 3").
+        Десятичная запись переводится точно, без float: "0.1" — это ровно 1/10.
+        Исключения:
+            ValueError: Если запись не распознана, знаменатель равен нулю или модуль порядка
+                больше PARSE_MAX_EXPONENT.
+        :param text (str): Запись дроби.
+        :return:
+            Rational: Дробь.
+        """
+        match = _RATIONAL_RE.fullmatch(text)
+        if match is None:
+            raise ValueError(f"Invalid rational literal: {text!r}")
+        value = match.group("value")
+        if value is not None:
+            n, d = _term_ratio(value)
+        elif match.group("rn") is not None:
+            n, d = int(match.group("rn")), int(match.group("rd"))
+        else:
+            n, d = int(match.group("pn")), int(match.group("pd"))
+        return Rational(n, d)
 
 
     def __repr__(self):
@@ -394,7 +695,7 @@ class Rational:
         :return:
             str: Строковое представление объекта Rational.
         """
-        return f"Rational({self.__numerator}, {self.__denominator})"
+        return f"Rational({self._numerator}, {self._denominator})"
 
     def print_fraction(self):
         """
@@ -402,4 +703,120 @@ class Rational:
         :return:
             str: Строковое представление дроби в виде "числитель / знаменатель".
         """
-        return f"Rational number: {self.__numerator} / {self.__denominator}"
+        return f"Rational number: {self._numerator} / {self._denominator}"
+
+
+class RationalAccumulator:
+    """
+    Накопитель суммы рациональных чисел с отложенным сокращением.
+    Сумма хранится как несокращённая дробь над общим знаменателем (НОК знаменателей слагаемых):
+    при каждом сложении считается только НОД знаменателей, а НОД числителя со знаменателем —
+    один раз, когда результат запрашивается через value().
+    В отличие от Rational, накопитель изменяемый.
+    Атрибуты:
+        _numerator (int): Несокращённый числитель суммы.
+        _denominator (int): Общий знаменатель слагаемых (всегда положительный).
+    """
+    __slots__ = ('_numerator', '_denominator')
+
+    def __init__(self, start=0):
+        """
+        Инициализация накопителя начальным значением.
+        :param start (Rational | int): Начальное значение суммы.
+        """
+        self._numerator = 0
+        self._denominator = 1
+        self.add(start)
+
+    def add(self, value):
+        """
+        Прибавляет число к сумме без сокращения.
+        :param value (Rational | int): Слагаемое.
+        :return:
+            RationalAccumulator: Текущий накопитель.
+        """
+        if isinstance(value, Rational):
+            a, b = value._numerator, value._denominator
+        elif isinstance(value, int):
+            self._numerator += value * self._denominator
+            return self
+        else:
+            raise TypeError("other operand must be an integer or Rational")
+        d = self._denominator
+        if b == 1:
+            self._numerator += a * d
+        elif d % b == 0:
+            self._numerator += a * (d // b)
+        else:
+            g = gcd(d, b)
+            s = b // g
+            self._numerator = self._numerator * s + a * (d // g)
+            self._denominator = d * s
+        return self
+
+    def sub(self, value):
+        """
+        Вычитает число из суммы без сокращения.
+        :param value (Rational | int): Вычитаемое.
+        :return:
+            RationalAccumulator: Текущий накопитель.
+        """
+        if isinstance(value, Rational):
+            return self.add(Rational._from_reduced(-value._numerator, value._denominator))
+        elif isinstance(value, int):
+            return self.add(-value)
+        else:
+            raise TypeError("other operand must be an integer or Rational")
+
+    def __iadd__(self, other):
+        """
+        Функция прибавления числа к сумме на месте (acc += x), то же, что add.
+        :param other (Rational | int): Слагаемое.
+        :return:
+            RationalAccumulator: Текущий накопитель.
+        """
+        return self.add(other)
+
+    def __isub__(self, other):
+        """
+        Функция вычитания числа из суммы на месте (acc -= x), то же, что sub.
+        :param other (Rational | int): Вычитаемое.
+        :return:
+            RationalAccumulator: Текущий накопитель.
+        """
+        return self.sub(other)
+
+    def value(self):
+        """
+        Возвращает сумму в каноническом виде (единственное сокращение).
+        :return:
+            Rational: Текущее значение суммы.
+        """
+        return Rational(self._numerator, self._denominator)
+
+    def __eq__(self, other):
+        """
+        Функция сравнения накопленной суммы с числом.
+        :param other (RationalAccumulator | Rational | int): Число, с которым нужно сравнить сумму.
+        :return:
+            bool: True, если значения равны, иначе False.
+        """
+        if isinstance(other, RationalAccumulator):
+            other = other.value()
+        return self.value() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        Функция получения строкового представления накопителя.
+        :return:
+            str: Запись вида "RationalAccumulator(Rational(n, d))" с сокращённой суммой.
+        """
+        return f"RationalAccumulator({self.value()!r})"
+
+
+# инструментирование из переменной окружения (см. instrumentation.enable_from_environment)
+if os.environ.get("RATIONAL_INSTRUMENT", "") not in ("", "0"):
+    import instrumentation
+    instrumentation.enable_from_environment()
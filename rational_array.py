@@ -0,0 +1,388 @@
+import numpy as np
+
+from rational import Rational
+
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _max_abs(column) -> int:
+    """
+    Возвращает наибольший модуль элемента столбца как Python int.
+    :param column (np.ndarray): Столбец int64 или object.
+    :return:
+        int: Наибольший модуль (0 для пустого столбца).
+    """
+    if len(column) == 0:
+        return 0
+    return int(np.abs(column).max())
+
+
+def _promote(*columns):
+    """
+    Переводит столбцы в хранение Python int (dtype=object).
+    :return:
+        tuple[np.ndarray, ...]: Столбцы с dtype=object.
+    """
+    return tuple(column if column.dtype == object else column.astype(object) for column in columns)
+
+
+def _is_int64(*columns) -> bool:
+    return all(column.dtype == np.int64 for column in columns)
+
+
+def _pack(n, d):
+    """
+    Возвращает пару столбцов в самом компактном представлении:
+    столбцы object, все значения которых помещаются в int64, переводятся обратно в int64.
+    :param n (np.ndarray): Числители.
+    :param d (np.ndarray): Знаменатели.
+    :return:
+        tuple[np.ndarray, np.ndarray]: Числители и знаменатели.
+    """
+    if n.dtype == object and _max_abs(n) <= _INT64_MAX and _max_abs(d) <= _INT64_MAX:
+        return n.astype(np.int64), d.astype(np.int64)
+    return n, d
+
+
+def _add(n1, d1, n2, d2):
+    """
+    Поэлементная сумма несократимых дробей по алгоритму Хенричи.
+    Если промежуточные значения могут выйти за int64, вычисление выполняется в Python int.
+    :return:
+        tuple[np.ndarray, np.ndarray]: Несократимые числители и знаменатели результата.
+    """
+    g = np.gcd(d1, d2)
+    s = d1 // g
+    e = d2 // g
+    if _is_int64(n1, n2, s, e):
+        bound_n = _max_abs(n1) * _max_abs(e) + _max_abs(n2) * _max_abs(s)
+        bound_d = _max_abs(s) * _max_abs(d2)
+        if bound_n > _INT64_MAX or bound_d > _INT64_MAX:
+            n1, n2, s, e, d2, g = _promote(n1, n2, s, e, d2, g)
+    t = n1 * e + n2 * s
+    g2 = np.gcd(t, g)
+    return _pack(t // g2, s * (d2 // g2))
+
+
+def _mul(n1, d1, n2, d2):
+    """
+    Поэлементное произведение несократимых дробей с перекрёстными НОД.
+    Если произведения могут выйти за int64, вычисление выполняется в Python int.
+    :return:
+        tuple[np.ndarray, np.ndarray]: Несократимые числители и знаменатели результата.
+    """
+    g1 = np.gcd(n1, d2)
+    g2 = np.gcd(n2, d1)
+    a, d = n1 // g1, d2 // g1
+    c, b = n2 // g2, d1 // g2
+    if _is_int64(a, b, c, d):
+        if _max_abs(a) * _max_abs(c) > _INT64_MAX or _max_abs(b) * _max_abs(d) > _INT64_MAX:
+            a, b, c, d = _promote(a, b, c, d)
+    return _pack(a * c, b * d)
+
+
+def _reciprocal(n, d):
+    """
+    Поэлементно обращает несократимые дроби.
+    Исключения:
+        ZeroDivisionError: Если хотя бы одна дробь равна нулю.
+    :return:
+        tuple[np.ndarray, np.ndarray]: Числители и знаменатели обратных дробей.
+    """
+    if np.any(n == 0):
+        raise ZeroDivisionError("Cannot divide by zero")
+    negative = n < 0
+    return np.where(negative, -d, d), np.where(negative, -n, n)
+
+
+class RationalArray:
+    """
+    Одномерный столбцовый массив рациональных чисел.
+    Числители и знаменатели хранятся в двух непрерывных массивах int64; сокращение
+    выполняется пакетно через np.gcd. Если результат операции может переполнить int64,
+    массив автоматически переходит на хранение Python int (dtype=object) и возвращается
+    к int64, как только значения снова помещаются.
+    Все элементы хранятся в каноническом виде, как и у Rational.
+    """
+    __slots__ = ('_num', '_den')
+
+    def __init__(self, values=()):
+        """
+        Инициализация массива из последовательности дробей или целых чисел.
+        :param values (iterable[Rational | int]): Элементы массива.
+        """
+        numerators = []
+        denominators = []
+        for value in values:
+            if isinstance(value, Rational):
+                numerators.append(value.numerator)
+                denominators.append(value.denominator)
+            elif isinstance(value, int):
+                numerators.append(value)
+                denominators.append(1)
+            else:
+                raise TypeError("values must be Rational or int")
+        self._num, self._den = RationalArray._columns(numerators, denominators)
+
+    @staticmethod
+    def _columns(numerators, denominators):
+        """
+        Создаёт пару столбцов из списков Python int, выбирая int64, если значения помещаются.
+        :return:
+            tuple[np.ndarray, np.ndarray]: Числители и знаменатели.
+        """
+        n = np.empty(len(numerators), dtype=object)
+        n[:] = numerators
+        d = np.empty(len(denominators), dtype=object)
+        d[:] = denominators
+        return _pack(n, d)
+
+    @classmethod
+    def _from_columns(cls, n, d):
+        """
+        Создаёт массив из готовых канонических столбцов без проверки.
+        :return:
+            RationalArray: Новый массив.
+        """
+        array = object.__new__(cls)
+        array._num = n
+        array._den = d
+        return array
+
+    @classmethod
+    def from_columns(cls, numerators, denominators):
+        """
+        Создаёт массив из произвольных числителей и знаменателей с пакетным приведением
+        к каноническому виду.
+        :param numerators (array_like[int]): Числители.
+        :param denominators (array_like[int]): Знаменатели.
+        Исключения:
+            ValueError: Если длины не совпадают или есть нулевой знаменатель.
+        :return:
+            RationalArray: Новый массив.
+        """
+        n, d = cls._columns([int(x) for x in numerators], [int(x) for x in denominators])
+        if len(n) != len(d):
+            raise ValueError("numerators and denominators must have the same length")
+        if np.any(d == 0):
+            raise ValueError("Denominator cannot be zero.")
+        negative = d < 0
+        n = np.where(negative, -n, n)
+        d = np.where(negative, -d, d)
+        g = np.gcd(n, d)
+        return cls._from_columns(*_pack(n // g, d // g))
+
+    @property
+    def numerators(self):
+        """
+        :return:
+            np.ndarray: Числители (только для чтения).
+        """
+        view = self._num.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def denominators(self):
+        """
+        :return:
+            np.ndarray: Знаменатели (только для чтения).
+        """
+        view = self._den.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def is_int64(self) -> bool:
+        """
+        :return:
+            bool: True, если массив хранится в int64, False при хранении Python int.
+        """
+        return self._num.dtype == np.int64
+
+    def to_list(self):
+        """
+        Функция преобразования массива в список Rational.
+        :return:
+            list[Rational]: Элементы массива.
+        """
+        return [Rational._from_reduced(n, d) for n, d in zip(self._num.tolist(), self._den.tolist())]
+
+    def to_numpy(self):
+        """
+        Функция получения значений в виде массива float64.
+        :return:
+            np.ndarray: Массив float64.
+        """
+        return np.array([n / d for n, d in zip(self._num.tolist(), self._den.tolist())], dtype=np.float64)
+
+    def __len__(self):
+        return len(self._num)
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, index):
+        """
+        Функция получения элемента или среза.
+        :param index (int | slice): Индекс или срез.
+        :return:
+            Rational | RationalArray: Элемент или новый массив для среза.
+        """
+        if isinstance(index, slice):
+            return RationalArray._from_columns(self._num[index].copy(), self._den[index].copy())
+        return Rational._from_reduced(int(self._num[index]), int(self._den[index]))
+
+    def _coerce(self, other):
+        """
+        Приводит второй операнд к паре столбцов той же длины.
+        :param other (RationalArray | Rational | int): Второй операнд.
+        :return:
+            tuple[np.ndarray, np.ndarray]: Числители и знаменатели операнда.
+        """
+        if isinstance(other, RationalArray):
+            if len(other) != len(self):
+                raise ValueError("Arrays must have the same length")
+            return other._num, other._den
+        if isinstance(other, int):
+            other = Rational(other, 1)
+        if not isinstance(other, Rational):
+            raise TypeError("Unsupported operand type")
+        n = len(self)
+        return RationalArray._columns([other.numerator] * n, [other.denominator] * n)
+
+    def __add__(self, other):
+        """
+        Поэлементное сложение с массивом или скаляром.
+        :param other (RationalArray | Rational | int): Второй операнд.
+        :return:
+            RationalArray: Новый массив.
+        """
+        return RationalArray._from_columns(*_add(self._num, self._den, *self._coerce(other)))
+
+    def __sub__(self, other):
+        """
+        Поэлементное вычитание массива или скаляра.
+        :param other (RationalArray | Rational | int): Второй операнд.
+        :return:
+            RationalArray: Новый массив.
+        """
+        n, d = self._coerce(other)
+        return RationalArray._from_columns(*_add(self._num, self._den, -n, d))
+
+    def __mul__(self, other):
+        """
+        Поэлементное умножение на массив или скаляр.
+        :param other (RationalArray | Rational | int): Второй операнд.
+        :return:
+            RationalArray: Новый массив.
+        """
+        return RationalArray._from_columns(*_mul(self._num, self._den, *self._coerce(other)))
+
+    def __truediv__(self, other):
+        """
+        Поэлементное деление на массив или скаляр.
+        :param other (RationalArray | Rational | int): Делитель.
+        Исключения:
+            ZeroDivisionError: Если хотя бы один делитель равен нулю.
+        :return:
+            RationalArray: Новый массив.
+        """
+        return RationalArray._from_columns(*_mul(self._num, self._den, *_reciprocal(*self._coerce(other))))
+
+    def __neg__(self):
+        return RationalArray._from_columns(-self._num, self._den.copy())
+
+    def __abs__(self):
+        return RationalArray._from_columns(np.abs(self._num), self._den.copy())
+
+    def inverse(self):
+        """
+        Поэлементное обращение дробей.
+        :return:
+            RationalArray: Новый массив.
+        """
+        return RationalArray._from_columns(*_reciprocal(self._num, self._den))
+
+    def __pow__(self, other: int):
+        """
+        Поэлементное возведение в целую степень.
+        :param other (int): Показатель степени.
+        :return:
+            RationalArray: Новый массив.
+        """
+        if not isinstance(other, int):
+            raise TypeError("Exponent must be an integer")
+        n, d = self._num, self._den
+        if other < 0:
+            n, d = _reciprocal(n, d)
+            other = -other
+        if _is_int64(n, d) and max(_max_abs(n), _max_abs(d)).bit_length() * other > 63:
+            n, d = _promote(n, d)
+        # степени взаимно простых чисел взаимно просты, поэтому сокращение не нужно
+        return RationalArray._from_columns(*_pack(n ** other, d ** other))
+
+    def _tree_reduce(self, operation, identity):
+        """
+        Сворачивает массив попарно за log2(n) пакетных шагов.
+        :param operation (callable): Поэлементная операция над парами столбцов.
+        :param identity (int): Нейтральный элемент операции.
+        :return:
+            Rational: Результат свёртки.
+        """
+        n, d = self._num, self._den
+        if len(n) == 0:
+            return Rational(identity, 1)
+        while len(n) > 1:
+            half = len(n) // 2
+            tail_n, tail_d = n[2 * half:], d[2 * half:]
+            n, d = operation(n[:half], d[:half], n[half:2 * half], d[half:2 * half])
+            if len(tail_n):
+                if n.dtype != tail_n.dtype:
+                    n, d, tail_n, tail_d = _promote(n, d, tail_n, tail_d)
+                n, d = np.concatenate([n, tail_n]), np.concatenate([d, tail_d])
+        return Rational._from_reduced(int(n[0]), int(d[0]))
+
+    def sum(self):
+        """
+        :return:
+            Rational: Сумма элементов.
+        """
+        return self._tree_reduce(_add, 0)
+
+    def prod(self):
+        """
+        :return:
+            Rational: Произведение элементов.
+        """
+        return self._tree_reduce(_mul, 1)
+
+    def dot(self, other):
+        """
+        Скалярное произведение: сумма попарных произведений.
+        :param other (RationalArray): Второй массив той же длины.
+        :return:
+            Rational: Сумма произведений.
+        """
+        return (self * other).sum()
+
+    @staticmethod
+    def concatenate(arrays):
+        """
+        Объединяет несколько массивов.
+        :param arrays (list[RationalArray]): Массивы.
+        :return:
+            RationalArray: Новый массив.
+        """
+        arrays = list(arrays)
+        if not arrays:
+            return RationalArray()
+        if all(array.is_int64 for array in arrays):
+            return RationalArray._from_columns(np.concatenate([array._num for array in arrays]),
+                                               np.concatenate([array._den for array in arrays]))
+        columns = [_promote(array._num, array._den) for array in arrays]
+        return RationalArray._from_columns(np.concatenate([n for n, _ in columns]),
+                                           np.concatenate([d for _, d in columns]))
+
+    def __repr__(self):
+        return f"RationalArray([{', '.join(repr(r) for r in self.to_list())}])"
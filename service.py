@@ -0,0 +1,454 @@
+import asyncio
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from rational import Rational
+from complex import Complex
+import codec
+from parallel import _dot, _prod, _sum
+
+# операции сервиса: имя -> код в заголовке запроса
+OPERATIONS = {
+    "sum": 1, "prod": 2, "dot": 3,
+    "add": 4, "sub": 5, "mul": 6, "div": 7, "inverse": 8,
+}
+# операции с двумя списками операндов одинаковой длины
+BINARY_OPERATIONS = ("dot", "add", "sub", "mul", "div")
+# операции, результат которых — одно значение
+REDUCTIONS = ("sum", "prod", "dot")
+
+# наибольшее число запросов, которые сервер принял, но ещё не ответил на них
+MAX_PENDING = 256
+# сколько сервер ждёт новых запросов, прежде чем отправить накопленные в пул одной задачей, с
+COALESCE_DELAY = 0.002
+# задача отправляется сразу, если в ней набралось столько значений
+COALESCE_VALUES = 4096
+# наибольший размер кадра, байт
+MAX_FRAME = 64 << 20
+
+_LENGTH = struct.Struct("<I")
+# запрос: номер, код операции, число значений; ответ: номер, статус, число значений
+_HEADER = struct.Struct("<IBI")
+_STATUS_OK = 0
+_STATUS_ERROR = 1
+# исключения вычислений, которые клиент получает того же типа; остальные — как RuntimeError
+_ERRORS = {error.__name__: error for error in (ZeroDivisionError, ValueError, TypeError, OverflowError)}
+_CODES = {code: name for name, code in OPERATIONS.items()}
+
+
+def _encode_values(values) -> bytes:
+    out = bytearray()
+    for value in values:
+        codec._encode(out, value)
+    return bytes(out)
+
+
+def _decode_values(data, count):
+    """
+    :return:
+        list[Rational | Complex]: Ровно count значений, занимающих data целиком.
+    """
+    values = []
+    pos = 0
+    try:
+        for _ in range(count):
+            value, pos = codec._decode(data, pos)
+            values.append(value)
+    except codec._NeedMore:
+        raise ValueError("Truncated request") from None
+    if pos != len(data):
+        raise ValueError("Trailing data in request")
+    return values
+
+
+def _binary(name, a, b):
+    """
+    Поэлементная операция над парой значений.
+    У Rational нет операций с Complex справа, поэтому дробь в паре с Complex поднимается до Complex.
+    """
+    if isinstance(b, Complex) and not isinstance(a, Complex):
+        a = Complex(a, backend=b.backend)
+    if name == "add":
+        return a + b
+    elif name == "sub":
+        return a - b
+    elif name == "mul":
+        return a * b
+    return a / b
+
+
+def _inverse(value):
+    if isinstance(value, Complex):
+        return value.inverse()
+    return Rational(1, 1) / value
+
+
+def _evaluate(name, values):
+    """
+    Выполняет одну операцию над раскодированными значениями.
+    :return:
+        list: Результаты.
+    """
+    if name in BINARY_OPERATIONS:
+        if len(values) % 2:
+            raise ValueError(f"{name} expects two operand lists of the same length")
+        half = len(values) // 2
+        a, b = values[:half], values[half:]
+        if name == "dot":
+            return [_dot(list(zip(a, b)))]
+        return [_binary(name, x, y) for x, y in zip(a, b)]
+    elif name == "sum":
+        return [_sum(values)]
+    elif name == "prod":
+        return [_prod(values)]
+    return [_inverse(value) for value in values]
+
+
+def _compute(requests):
+    """
+    Рабочая функция пула: выполняет пакет объединённых запросов.
+    Ошибка одного запроса не затрагивает остальные.
+    :param requests (list[tuple[int, int, bytes]]): Код операции, число значений и записи codec.
+    :return:
+        list[tuple[int, int, bytes]]: Для каждого запроса статус, число значений и записи (или текст ошибки).
+    """
+    results = []
+    for code, count, data in requests:
+        try:
+            values = _evaluate(_CODES[code], _decode_values(data, count))
+            results.append((_STATUS_OK, len(values), _encode_values(values)))
+        except Exception as error:
+            message = f"{type(error).__name__}: {error}"
+            results.append((_STATUS_ERROR, 0, message.encode()))
+    return results
+
+
+async def _read_frame(reader):
+    """
+    :return:
+        bytes | None: Тело кадра или None, если соединение закрыто между кадрами.
+    """
+    try:
+        header = await reader.readexactly(_LENGTH.size)
+    except asyncio.IncompleteReadError as error:
+        if error.partial:
+            raise ConnectionError("Connection closed in the middle of a frame") from None
+        return None
+    (size,) = _LENGTH.unpack(header)
+    if size > MAX_FRAME:
+        raise ValueError(f"Frame of {size} bytes exceeds MAX_FRAME")
+    return await reader.readexactly(size)
+
+
+def _frame(header, body) -> bytes:
+    return _LENGTH.pack(len(header) + len(body)) + header + body
+
+
+class ComputeServer:
+    """
+    Асинхронный сервер точной арифметики Rational/Complex через Unix- или TCP-сокет.
+    Запросы — кадры с операцией и пакетом значений в кодировке codec. Вычисления выполняются
+    в пуле процессов, поэтому цикл событий не блокируется:
+        - запросы, пришедшие в течение coalesce_delay, отправляются в пул одной задачей
+          (не больше coalesce_values значений), что снижает накладные расходы на передачу;
+        - одинаковые запросы, ожидающие ответа одновременно, вычисляются один раз;
+        - сервер читает новые запросы, только пока ожидающих ответа меньше max_pending,
+          иначе клиенты упираются в буферы сокета (обратное давление).
+    Атрибуты:
+        stats (dict): Число запросов, отправленных в пул задач и запросов, совпавших с уже ожидающими.
+    """
+
+    def __init__(self, path=None, host: str = "127.0.0.1", port: int = 0, workers: int | None = None,
+                 executor=None, max_pending: int = MAX_PENDING, coalesce_delay: float = COALESCE_DELAY,
+                 coalesce_values: int = COALESCE_VALUES):
+        """
+        :param path (str | None): Путь Unix-сокета; если не указан, сервер слушает TCP host:port.
+        :param host (str): Адрес TCP.
+        :param port (int): Порт TCP (0 — любой свободный).
+        :param workers (int | None): Число процессов пула (по умолчанию os.cpu_count()).
+        :param executor (Executor | None): Готовый пул; без него пул создаётся в start и закрывается в close.
+        :param max_pending (int): Наибольшее число запросов без ответа.
+        :param coalesce_delay (float): Окно объединения запросов, с (0 — отправлять сразу).
+        :param coalesce_values (int): Размер задачи, при котором она отправляется, не дожидаясь окна.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive")
+        self._path = path
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._executor = executor
+        self._own_executor = executor is None
+        self._max_pending = max_pending
+        self._coalesce_delay = coalesce_delay
+        self._coalesce_values = coalesce_values
+        self._server = None
+        self._slots = None
+        self._batch = []
+        self._batch_values = 0
+        self._flush_handle = None
+        self._inflight = {}
+        self._tasks = set()
+        self._connections = {}
+        self.stats = {"requests": 0, "batches": 0, "deduplicated": 0}
+
+    async def start(self):
+        """
+        Открывает сокет и пул процессов.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        self._slots = asyncio.Semaphore(self._max_pending)
+        if self._path is not None:
+            self._server = await asyncio.start_unix_server(self._serve, path=self._path)
+        else:
+            self._server = await asyncio.start_server(self._serve, self._host, self._port)
+
+    @property
+    def address(self):
+        """
+        :return:
+            str | tuple[str, int]: Путь Unix-сокета или (адрес, порт) TCP.
+        """
+        if self._path is not None:
+            return self._path
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Закрывает сокет, дожидается ответов на принятые запросы, закрывает соединения
+        и собственный пул.
+        """
+        if self._server is not None:
+            self._server.close()
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+    async def _serve(self, reader, writer):
+        """
+        Обслуживает одно соединение: читает запросы, пока есть свободные места, и пишет ответы
+        по мере готовности (порядок ответов может отличаться от порядка запросов).
+        """
+        lock = asyncio.Lock()
+        answers = set()
+        handler = asyncio.current_task()
+        self._connections[handler] = writer
+        try:
+            while True:
+                await self._slots.acquire()
+                try:
+                    body = await _read_frame(reader)
+                except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+                    body = None
+                if body is None:
+                    self._slots.release()
+                    break
+                task = asyncio.ensure_future(self._answer(body, writer, lock))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                answers.add(task)
+                task.add_done_callback(answers.discard)
+        finally:
+            if answers:
+                await asyncio.gather(*answers, return_exceptions=True)
+            del self._connections[handler]
+            writer.close()
+
+    async def _answer(self, body, writer, lock):
+        try:
+            request_id, code, count = _HEADER.unpack_from(body)
+            data = body[_HEADER.size:]
+            if code in _CODES:
+                status, count, payload = await self._submit(code, count, data)
+            else:
+                status, count, payload = _STATUS_ERROR, 0, f"ValueError: Unknown operation code {code}".encode()
+            async with lock:
+                writer.write(_frame(_HEADER.pack(request_id, status, count), payload))
+                await writer.drain()
+        except (ConnectionError, struct.error):
+            pass
+        finally:
+            self._slots.release()
+
+    def _submit(self, code, count, data):
+        """
+        Ставит запрос в текущую задачу пула (или присоединяет к такому же ожидающему запросу).
+        :return:
+            asyncio.Future: Будущий (статус, число значений, данные).
+        """
+        self.stats["requests"] += 1
+        key = (code, count, data)
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["deduplicated"] += 1
+            return future
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._batch.append((key, future))
+        self._batch_values += count
+        if self._batch_values >= self._coalesce_values or self._coalesce_delay <= 0:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._coalesce_delay, self._flush)
+        return future
+
+    def _flush(self):
+        """
+        Отправляет накопленные запросы в пул одной задачей.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._batch:
+            return
+        batch, self._batch, self._batch_values = self._batch, [], 0
+        self.stats["batches"] += 1
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(self._executor, _compute, [key for key, _ in batch])
+
+        def done(job):
+            error = job.exception()
+            for i, (key, future) in enumerate(batch):
+                del self._inflight[key]
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_result((_STATUS_ERROR, 0, f"RuntimeError: {error}".encode()))
+                else:
+                    future.set_result(job.result()[i])
+
+        job.add_done_callback(done)
+
+
+class ComputeClient:
+    """
+    Асинхронный клиент ComputeServer.
+    Одно соединение обслуживает любое число одновременных вызовов: запросы нумеруются,
+    ответы сопоставляются по номеру.
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting = {}
+        self._lock = asyncio.Lock()
+        self._listener = asyncio.ensure_future(self._listen())
+
+    @staticmethod
+    async def connect(path=None, host: str = "127.0.0.1", port: int | None = None):
+        """
+        Функция подключения к серверу.
+        :param path (str | None): Путь Unix-сокета.
+        :param host (str): Адрес TCP (если path не указан).
+        :param port (int | None): Порт TCP.
+        :return:
+            ComputeClient: Подключённый клиент.
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return ComputeClient(reader, writer)
+
+    async def _listen(self):
+        error = ConnectionError("Connection closed by server")
+        try:
+            while True:
+                body = await _read_frame(self._reader)
+                if body is None:
+                    break
+                request_id, status, count = _HEADER.unpack_from(body)
+                future = self._waiting.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result((status, count, body[_HEADER.size:]))
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError) as failure:
+            error = ConnectionError(str(failure))
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._waiting.clear()
+
+    async def call(self, operation: str, values, other=None):
+        """
+        Функция вызова операции на сервере.
+        Исключения:
+            ZeroDivisionError, ValueError, TypeError, OverflowError: Ошибка вычисления на сервере.
+            RuntimeError: Прочие ошибки сервера.
+            ConnectionError: Соединение разорвано.
+        :param operation (str): Имя операции из OPERATIONS.
+        :param values (list[Rational | Complex | int]): Операнды (первый список для двуместных операций).
+        :param other (list | None): Второй список той же длины для операций из BINARY_OPERATIONS.
+        :return:
+            Rational | Complex | list: Одно значение для sum, prod и dot, иначе список результатов.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"operation must be one of {tuple(OPERATIONS)}")
+        values = list(values)
+        if operation in BINARY_OPERATIONS:
+            if other is None or len(other) != len(values):
+                raise ValueError(f"{operation} expects two operand lists of the same length")
+            values += list(other)
+        elif other is not None:
+            raise ValueError(f"{operation} takes a single operand list")
+        request_id = self._next_id
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        body = _HEADER.pack(request_id, OPERATIONS[operation], len(values)) + _encode_values(values)
+        async with self._lock:
+            self._writer.write(_LENGTH.pack(len(body)) + body)
+            await self._writer.drain()
+        status, count, data = await future
+        if status != _STATUS_OK:
+            name, _, message = data.decode().partition(": ")
+            raise _ERRORS.get(name, RuntimeError)(message if name in _ERRORS else data.decode())
+        results = _decode_values(data, count)
+        return results[0] if operation in REDUCTIONS else results
+
+    async def sum(self, values):
+        return await self.call("sum", values)
+
+    async def prod(self, values):
+        return await self.call("prod", values)
+
+    async def dot(self, a, b):
+        return await self.call("dot", a, b)
+
+    async def close(self):
+        """
+        Закрывает соединение; ожидающие вызовы завершаются ConnectionError.
+        """
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._listener
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
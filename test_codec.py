@@ -0,0 +1,84 @@
+import io
+import struct
+import unittest
+from rational import Rational
+from complex import Complex
+import codec
+from codec import Reader, Writer, dumps, loads
+
+
+class TestCodec(unittest.TestCase):
+    def setUp(self):
+        big = 10 ** 40 + 7
+        self.values = [
+            Rational(0, 1), Rational(-3, 4), Rational(2 ** 63 - 1, 2 ** 62 + 1), Rational(-(2 ** 63), 1),
+            Rational(-big, big + 2), Rational(1, 2 ** 64),
+            Complex(Rational(1, 2), Rational(-5, 3)), Complex(big, Rational(-1, big)),
+            Complex(0.1, -2.5, backend="float"),
+        ]
+
+    def test_round_trip(self):
+        for value in self.values:
+            result = loads(dumps(value))
+            self.assertIs(type(result), type(value))
+            self.assertEqual(result, value)
+            if isinstance(value, Complex):
+                self.assertEqual(result.backend, value.backend)
+        self.assertEqual(loads(dumps(5)), Rational(5, 1))
+
+    def test_fast_lane_and_varint(self):
+        # дробь из int64 — фиксированная ширина, большие числа — varint
+        self.assertEqual(dumps(Rational(-3, 4))[len(codec.MAGIC) + 1], codec.TAG_RATIONAL_INT64)
+        self.assertEqual(dumps(Rational(-(2 ** 63), 1))[len(codec.MAGIC) + 1], codec.TAG_RATIONAL_INT64)
+        self.assertEqual(dumps(Rational(2 ** 63, 1))[len(codec.MAGIC) + 1], codec.TAG_RATIONAL_VARINT)
+
+    def test_varint_zigzag(self):
+        for value in (0, -1, 1, -2, 63, -64, 64, 2 ** 56 - 1, 2 ** 56, 2 ** 70, -(2 ** 70) - 1, 3 ** 5000, -(7 ** 3001)):
+            out = bytearray()
+            codec._write_signed(out, value)
+            self.assertEqual(codec._read_signed(bytes(out), 0), (value, len(out)))
+        out = bytearray()
+        codec._write_signed(out, -1)
+        self.assertEqual(bytes(out), b"\x01")
+
+    def test_errors(self):
+        data = dumps(Rational(1, 3))
+        with self.assertRaises(ValueError):
+            loads(data[:-1])
+        with self.assertRaises(ValueError):
+            loads(data + b"\x00")
+        with self.assertRaises(ValueError):
+            loads(b"XYZ" + data[3:])
+        with self.assertRaises(ValueError):
+            loads(codec.MAGIC + bytes([codec.FORMAT_VERSION + 1]) + data[4:])
+        with self.assertRaises(ValueError):
+            loads(codec.MAGIC + bytes([codec.FORMAT_VERSION, 0x7F]))
+        # несокращённая дробь (2, 4) и ноль со знаменателем 2
+        for n, d in ((2, 4), (0, 2)):
+            with self.assertRaises(ValueError):
+                loads(codec._HEADER + bytes([codec.TAG_RATIONAL_INT64]) + struct.pack("<qq", n, d))
+        with self.assertRaises(TypeError):
+            dumps(1.5)
+
+    def test_stream(self):
+        values = self.values * 50
+        buffer = io.BytesIO()
+        with Writer(buffer, buffer_size=64) as writer:
+            writer.write_many(values)
+        old = codec.READ_CHUNK_SIZE
+        codec.READ_CHUNK_SIZE = 7
+        try:
+            # маленькие блоки разрезают записи посередине
+            self.assertEqual(list(Reader(io.BytesIO(buffer.getvalue()))), values)
+        finally:
+            codec.READ_CHUNK_SIZE = old
+        self.assertEqual(list(Reader(io.BytesIO(buffer.getvalue()))), values)
+        with self.assertRaises(ValueError):
+            list(Reader(io.BytesIO(buffer.getvalue()[:-3])))
+        empty = io.BytesIO()
+        Writer(empty).flush()
+        self.assertEqual(list(Reader(io.BytesIO(empty.getvalue()))), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
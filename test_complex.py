@@ -54,8 +54,10 @@ class TestComplex(unittest.TestCase):
         result = c ** 2
         self.assertEqual(str(result), "(-0.3125 + 0.75i)")
 
+        # c ** 2 больше не изменяет c, поэтому c ** -2 считается от исходного числа
         result = c ** -2
-        self.assertEqual(str(result), "(-0.019201316803170883 - 2.2945171878600856i)")
+        self.assertEqual(str(result), "(-0.47337278106508873 - 1.136094674556213i)")
+        self.assertEqual(c, Complex(Rational(1, 2), Rational(3, 4)))
 
     def test_abs(self):
         c = Complex(Rational(3, 4), Rational(4, 5))
@@ -75,6 +77,19 @@ class TestComplex(unittest.TestCase):
         c3 = Complex(Rational(2, 3), Rational(4, 5))
         self.assertFalse(c1 == c3)
 
+    def test_eq_builtin_types(self):
+        from fractions import Fraction
+        c = Complex(Rational(1, 2), Rational(1, 4))
+        self.assertTrue(c == complex(0.5, 0.25))
+        self.assertEqual(len({complex(0.5, 0.25), c}), 1)
+        self.assertEqual(len({Complex(1, 0), Fraction(1), Rational(1, 1), 1}), 1)
+        self.assertTrue(Fraction(1, 2) == Complex(Rational(1, 2), 0))
+        # равенство точное: 1/3 и ближайший к нему float различаются
+        self.assertFalse(Complex(Rational(1, 3), 0) == complex(1 / 3, 0))
+        self.assertFalse(Complex(1, 0) == None)
+        self.assertTrue(Complex(1, 0) != "1")
+        self.assertNotIn(Complex(1, 0), [None, "1", (1, 0)])
+
     def test_neg(self):
         c = Complex(Rational(1, 2), Rational(3, 4))
         result = -c
@@ -128,3 +143,232 @@ class TestComplex(unittest.TestCase):
 
         result = c1 * c2
         self.assertEqual(str(result), "(0.0 + 2e+150i)")
+
+    def test_init_keeps_rational(self):
+        r = Rational(1, 3)
+        c = Complex(r, Rational(2, 7))
+        self.assertIs(c.real, r)
+        self.assertEqual(c.imag, Rational(2, 7))
+
+        # int не должен проходить через float
+        c = Complex(10 ** 20 + 1, -(10 ** 20 + 1))
+        self.assertEqual(c.real, 10 ** 20 + 1)
+        self.assertEqual(c.imag, -(10 ** 20 + 1))
+
+    def test_exact_chain(self):
+        c1 = Complex(Rational(1, 3), Rational(2, 7))
+        c2 = Complex(Rational(5, 11), Rational(-3, 13))
+        result = c1 * c2 / c2
+        self.assertEqual(result, c1)
+
+    def test_immutable(self):
+        c = Complex(Rational(1, 2), Rational(3, 4))
+        with self.assertRaises(AttributeError):
+            c.real = Rational(1, 3)
+        with self.assertRaises(AttributeError):
+            c.extra = 1
+
+        c2 = c
+        c2 += Complex(1, 1)
+        self.assertEqual(c, Complex(Rational(1, 2), Rational(3, 4)))
+        self.assertEqual(c2, Complex(Rational(3, 2), Rational(7, 4)))
+
+    def test_hash(self):
+        c1 = Complex(Rational(1, 2), Rational(3, 4))
+        c2 = Complex(Rational(2, 4), Rational(6, 8))
+        self.assertEqual(hash(c1), hash(c2))
+        self.assertEqual(len({c1, c2}), 1)
+        self.assertEqual(hash(Complex(Rational(3, 2), 0)), hash(Rational(3, 2)))
+        self.assertEqual(hash(Complex(Rational(1, 2), Rational(1, 4))), hash(complex(0.5, 0.25)))
+        # числа разных режимов равны только при точном равенстве, поэтому равные имеют равный хеш
+        exact, approximate = Complex(Rational(1, 3), 0), Complex(1 / 3, 0, backend="float")
+        self.assertNotEqual(exact, approximate)
+        self.assertEqual(len({exact, approximate}), 2)
+        self.assertEqual(len({Complex(Rational(1, 2), 0), Complex(0.5, 0, backend="float"), Rational(1, 2)}), 1)
+        self.assertNotEqual(Complex(float("inf"), 0, backend="float"), Complex(1, 0))
+
+    def test_float_backend(self):
+        c1 = Complex(Rational(1, 2), Rational(3, 4), backend="float")
+        c2 = Complex(Rational(2, 3), Rational(4, 5))
+        self.assertEqual(c1.backend, "float")
+        self.assertEqual(c2.backend, "exact")
+
+        result = c1 * c2
+        self.assertEqual(result.backend, "float")
+        self.assertAlmostEqual(float(result.real), -4 / 15)
+        self.assertAlmostEqual(float(result.imag), 0.9)
+        self.assertAlmostEqual(float((c1 / c2).real), 0.860655737704918)
+        self.assertEqual(str(c1 ** 2), "(-0.3125 + 0.75i)")
+        self.assertEqual(c1 + 1, Complex(Rational(3, 2), Rational(3, 4)))
+
+        # части читаются как Rational
+        self.assertEqual(c1.real, Rational(1, 2))
+        self.assertIsInstance(c1.imag, Rational)
+        self.assertEqual(c1.to_exact(), Complex(Rational(1, 2), Rational(3, 4)))
+        self.assertEqual(hash(c1), hash(c1.to_exact()))
+
+        with self.assertRaises(ZeroDivisionError):
+            c1 / Complex(0, 0, backend="float")
+        with self.assertRaises(ValueError):
+            Complex(1, 1, backend="decimal")
+
+    def test_backend_selection(self):
+        self.assertEqual(Complex.get_default_backend(), "exact")
+        with Complex.use_backend("float"):
+            self.assertEqual(Complex(1, 2).backend, "float")
+            self.assertEqual(Complex(1, 2, backend="exact").backend, "exact")
+        self.assertEqual(Complex(1, 2).backend, "exact")
+
+        Complex.set_default_backend("float")
+        try:
+            self.assertEqual(Complex(Rational(1, 3)).backend, "float")
+        finally:
+            Complex.set_default_backend("exact")
+
+    def test_mul_gauss_matches_schoolbook(self):
+        cases = [
+            (Complex(Rational(3 ** 200, 7), Rational(-5 ** 150, 7)), Complex(Rational(2 ** 300, 11), 13)),
+            (Complex(Rational(1, 3 ** 400), Rational(2, 5 ** 300)), Complex(Rational(7, 3 ** 200), Rational(1, 2))),
+            (Complex(Rational(1, 2), Rational(3, 4)), Complex(0, 0)),
+        ]
+        for a, b in cases:
+            real = a.real * b.real - a.imag * b.imag
+            imag = a.real * b.imag + a.imag * b.real
+            self.assertEqual(a * b, Complex(real, imag))
+
+    def test_fma(self):
+        z = Complex(Rational(1, 2), Rational(3, 4))
+        a = Complex(Rational(2, 3), Rational(4, 5))
+        b = Complex(Rational(-1, 6), Rational(5, 7))
+        self.assertEqual(z.fma(a, b), z * a + b)
+        self.assertEqual(z.muladd(2, Rational(1, 3)), z * 2 + Rational(1, 3))
+        self.assertEqual(z.fma(a, 0), z * a)
+
+        # итерация вида z = z * z + c
+        c = Complex(Rational(-1, 4), Rational(1, 8))
+        w1 = w2 = Complex(0, 0)
+        for _ in range(5):
+            w1 = w1.fma(w1, c)
+            w2 = w2 * w2 + c
+        self.assertEqual(w1, w2)
+
+        f = z.to_float().fma(a, b)
+        self.assertEqual(f.backend, "float")
+        self.assertAlmostEqual(f.abs(), (z * a + b).abs())
+
+    def test_sum(self):
+        values = [Complex(Rational(1, k), Rational(-1, k + 1)) for k in range(1, 50)] + [Rational(1, 3), 2]
+        expected = Complex(0, 0)
+        for value in values:
+            expected = expected + value
+        self.assertEqual(Complex.sum(values), expected)
+        self.assertEqual(Complex.sum(values, start=Complex(0, 1)), expected + Complex(0, 1))
+
+        mixed = Complex.sum([Complex(1, 2, backend="float"), Complex(Rational(1, 2), 0)])
+        self.assertEqual(mixed.backend, "float")
+        self.assertEqual(mixed, Complex(Rational(3, 2), 2))
+
+    def test_init_float_exact(self):
+        c = Complex(0.1, -0.5)
+        self.assertEqual(c.real, Rational(3602879701896397, 36028797018963968))
+        self.assertEqual(c.imag, Rational(-1, 2))
+        self.assertEqual(str(c), "(0.1 - 0.5i)")
+
+    def test_pow_cache(self):
+        Complex.clear_power_cache()
+        c = Complex(Rational(1, 2), Rational(3, 4))
+        expected = Complex(1, 0)
+        for k in range(1, 40):
+            expected = expected * c
+            self.assertEqual(c ** k, expected)
+        info = Complex.power_cache_info()["powers"]
+        self.assertGreater(info.hits, 0)
+        self.assertLessEqual(info.currsize, info.maxsize)
+        # повторное возведение не меняет основание и результат из кеша
+        self.assertEqual(c ** 7, c ** 7)
+        self.assertEqual(c, Complex(Rational(1, 2), Rational(3, 4)))
+
+    def test_pow_cache_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        Complex.clear_power_cache()
+        c = Complex(Rational(-2, 3), Rational(1, 5))
+        exponents = [k for k in range(1, 300, 7)] * 4
+        expected = {k: c.powers(k)[k] for k in set(exponents)}
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda k: c ** k, exponents))
+        self.assertEqual(results, [expected[k] for k in exponents])
+
+    def test_powers(self):
+        c = Complex(Rational(1, 2), Rational(-1, 3))
+        powers = c.powers(6)
+        self.assertEqual(len(powers), 7)
+        for k, value in enumerate(powers):
+            self.assertEqual(value, c ** k)
+        self.assertEqual(c.powers(0), [Complex(1, 0)])
+        floats = c.to_float().powers(3)
+        self.assertEqual(floats[3].backend, "float")
+        self.assertAlmostEqual(floats[3].abs(), (c ** 3).abs())
+
+    def test_root_of_unity(self):
+        self.assertEqual(Complex.root_of_unity(4, 1), Complex(0, 1))
+        self.assertEqual(Complex.root_of_unity(8, 4), Complex(-1, 0))
+        self.assertEqual(Complex.root_of_unity(8, 4).backend, "exact")
+        self.assertEqual(Complex.root_of_unity(6, -1), Complex.root_of_unity(6, 5))
+
+        w = Complex.root_of_unity(12)
+        self.assertEqual(w.backend, "float")
+        self.assertAlmostEqual(w.arg(), 2 * 3.141592653589793 / 12)
+        total = Complex.sum(Complex.roots_of_unity(12))
+        self.assertAlmostEqual(total.abs(), 0.0)
+        with self.assertRaises(ValueError):
+            Complex.root_of_unity(0)
+
+    def test_precision_cap(self):
+        c = Complex(Rational(-3, 4), Rational(1, 9))
+        z = Complex(0, 0)
+        with Rational.precision_cap(max_bits=32) as policy:
+            for _ in range(12):
+                z = z.fma(z, c)
+                z = z / (z * z + 1)
+                self.assertLessEqual(z.real.denominator.bit_length(), 32)
+                self.assertLessEqual(z.imag.denominator.bit_length(), 32)
+        self.assertGreater(policy.roundings, 0)
+        self.assertLess(policy.error_bound, 1e-6)
+        # без ограничения длина чисел растёт экспоненциально, поэтому сравнение идёт с float
+        w = Complex(0, 0, backend="float")
+        for _ in range(12):
+            w = w.fma(w, c)
+            w = w / (w * w + 1)
+        self.assertLess((w - z).abs(), 1e-6)
+        # степени, вычисленные под ограничением, не попадают в кеш точных степеней
+        base = Complex(Rational(1234, 4567), Rational(-891, 2345))
+        with Rational.precision_cap(max_bits=8):
+            capped = base ** 4
+        self.assertEqual(base ** 4, base * base * base * base)
+        self.assertNotEqual(capped, base ** 4)
+
+    def test_parse(self):
+        cases = {
+            "1/2 + 3/4i": Complex(Rational(1, 2), Rational(3, 4)), "-2.5 - i": Complex(Rational(-5, 2), -1),
+            "3/4i": Complex(0, Rational(3, 4)), "7": Complex(7, 0), "i": Complex(0, 1), "-i": Complex(0, -1),
+            "+2j": Complex(0, 2), "1-2i": Complex(1, -2), " ( 3 ) ": Complex(3, 0),
+            "(0.5 - 1e-20i)": Complex(Rational(1, 2), Rational(-1, 10 ** 20)),
+            "Complex(1/3, -2)": Complex(Rational(1, 3), -2),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(Complex.parse(text), expected)
+            self.assertEqual(Complex.parse(text).backend, "exact")
+        c = Complex(Rational(1, 4), Rational(-3, 8))
+        self.assertEqual(Complex.parse(str(c)), c)
+        self.assertEqual(Complex.parse(repr(c)), c)
+        f = Complex(0.1, -0.7, backend="float")
+        self.assertEqual(Complex.parse(repr(f)), f)
+        self.assertEqual(Complex.parse(repr(f)).backend, "float")
+        # быстрый путь сокращает дроби так же, как общий
+        fast = Complex.parse("(-6/8 + 0.50/3j)")
+        self.assertEqual((fast.real.numerator, fast.real.denominator), (-3, 4))
+        self.assertEqual((fast.imag.numerator, fast.imag.denominator), (1, 6))
+        self.assertEqual(Complex.parse("Complex(2/4, -0.0)"), Complex(Rational(1, 2), 0))
+        for text in ("", "(1 + 2i", "1 + 2", "i i", "Complex(1)", "1/0 + i", "1/0 + 2i", "1 + 2/0i"):
+            with self.assertRaises(ValueError):
+                Complex.parse(text)
@@ -0,0 +1,88 @@
+import unittest
+from rational import Rational
+from complex import Complex
+
+try:
+    import numpy
+    from complex_array import ComplexArray
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestComplexArray(unittest.TestCase):
+    def setUp(self):
+        self.values = [Complex(Rational(1, 2), Rational(3, 4)), Complex(Rational(2, 3), Rational(-4, 5)),
+                       Complex(3, 0), Complex(Rational(-5, 7), Rational(1, 9))]
+        self.others = [Complex(Rational(2, 3), Rational(4, 5)), Complex(1, 1),
+                       Complex(Rational(1, 3), -2), Complex(0, Rational(7, 2))]
+
+    def test_round_trip(self):
+        array = ComplexArray(self.values)
+        self.assertEqual(len(array), 4)
+        self.assertEqual(array.to_list(), self.values)
+        self.assertEqual(array.real_list(), [c.real for c in self.values])
+        self.assertEqual(ComplexArray.from_rationals([c.real for c in self.values],
+                                                     [c.imag for c in self.values]).to_list(), self.values)
+
+    def test_exact_elementwise(self):
+        a, b = ComplexArray(self.values), ComplexArray(self.others)
+        for op in (lambda x, y: x + y, lambda x, y: x - y, lambda x, y: x * y, lambda x, y: x / y):
+            self.assertEqual(op(a, b).to_list(), [op(x, y) for x, y in zip(self.values, self.others)])
+        self.assertEqual((a * 2).to_list(), [c * 2 for c in self.values])
+        self.assertEqual((-a).to_list(), [-c for c in self.values])
+
+    def test_exact_inverse_and_pow(self):
+        a = ComplexArray(self.values)
+        self.assertEqual(a.inverse().to_list(), [c.inverse() for c in self.values])
+        self.assertEqual((a ** 5).to_list(), [c ** 5 for c in self.values])
+        self.assertEqual((a ** -2).to_list(), [c ** -2 for c in self.values])
+        self.assertEqual((a ** 0).to_list(), [Complex(1, 0)] * 4)
+
+    def test_exact_reductions(self):
+        a, b = ComplexArray(self.values), ComplexArray(self.others)
+        expected_sum = Complex(0, 0)
+        expected_prod = Complex(1, 0)
+        expected_dot = Complex(0, 0)
+        for x, y in zip(self.values, self.others):
+            expected_sum = expected_sum + x
+            expected_prod = expected_prod * x
+            expected_dot = expected_dot + x * y
+        self.assertEqual(a.sum(), expected_sum)
+        self.assertEqual(a.prod(), expected_prod)
+        self.assertEqual(a.dot(b), expected_dot)
+        self.assertEqual(ComplexArray([]).sum(), Complex(0, 0))
+
+    def test_float_mode(self):
+        a = ComplexArray(self.values, exact=False)
+        b = ComplexArray(self.others, exact=False)
+        expected = [complex(float(x.real), float(x.imag)) * complex(float(y.real), float(y.imag))
+                    for x, y in zip(self.values, self.others)]
+        numpy.testing.assert_allclose((a * b).to_numpy(), expected)
+        numpy.testing.assert_allclose(a.abs(), [c.abs() for c in self.values])
+        numpy.testing.assert_allclose(a.arg(), [c.arg() for c in self.values])
+        self.assertAlmostEqual(float(a.prod().real), float(ComplexArray(self.values).prod().real))
+
+    def test_mode_conversion(self):
+        a = ComplexArray([Complex(Rational(1, 4), Rational(-3, 8))])
+        self.assertEqual(a.to_float().to_exact().to_list(), a.to_list())
+        with self.assertRaises(ValueError):
+            a + a.to_float()
+
+    def test_default_backend_does_not_leak(self):
+        with Complex.use_backend("float"):
+            exact = ComplexArray([Rational(1, 3), 1j])
+            approximate = ComplexArray([Rational(1, 3)], exact=False)
+            self.assertEqual(exact[0], Complex(Rational(1, 3), 0, backend="exact"))
+            self.assertEqual([c.backend for c in exact.to_list()], ["exact", "exact"])
+            self.assertEqual(exact.prod(), Complex(0, Rational(1, 3), backend="exact"))
+            self.assertEqual(ComplexArray([]).sum().backend, "exact")
+        self.assertEqual(approximate[0].backend, "float")
+        self.assertEqual(approximate.sum().backend, "float")
+
+    def test_divide_by_zero(self):
+        a = ComplexArray(self.values)
+        with self.assertRaises(ZeroDivisionError):
+            a / ComplexArray([1, 1, 0, 1])
+        with self.assertRaises(ZeroDivisionError):
+            ComplexArray([0], exact=False).inverse()
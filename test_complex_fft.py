@@ -0,0 +1,92 @@
+import cmath
+import unittest
+from rational import Rational
+from complex import Complex
+import complex_fft
+from complex_fft import convolve, dft, fft, ifft
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def naive_dft(values, sign=-1):
+    n = len(values)
+    return [sum(x * cmath.exp(sign * 2j * cmath.pi * j * k / n) for j, x in enumerate(values)) for k in range(n)]
+
+
+class TestComplexFFT(unittest.TestCase):
+    def assertClose(self, actual, expected, places=9):
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(complex(float(a.real), float(a.imag)), e, places=places)
+
+    def test_python_engine_matches_naive(self):
+        # степени двойки, составные и простые длины
+        for n in (1, 2, 4, 8, 16, 6, 12, 15, 7, 13, 30):
+            values = [complex(j % 5 - 2, (j * 3) % 7 - 3) for j in range(n)]
+            self.assertClose(fft(values, engine="python"), naive_dft(values))
+            self.assertClose(ifft(values, engine="python"), [z / n for z in naive_dft(values, sign=1)])
+
+    def test_round_trip(self):
+        values = [Complex(Rational(j, 3), Rational(-j, 7)) for j in range(12)]
+        expected = [complex(float(c.real), float(c.imag)) for c in values]
+        self.assertClose(ifft(fft(values, engine="python"), engine="python"), expected)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_engine(self):
+        values = [Complex(Rational(1, j + 1), j) for j in range(10)]
+        self.assertClose(fft(values, engine="numpy"), naive_dft([complex(1 / (j + 1), j) for j in range(10)]))
+        self.assertClose(fft(values, engine="numpy"), [complex(float(c.real), float(c.imag))
+                                                       for c in fft(values, engine="python")])
+
+    def test_dft_reference(self):
+        values = [Complex(1, 2), Complex(Rational(1, 2), 0), Complex(0, -1), Complex(3, 1), Complex(-2, 0)]
+        self.assertClose(dft(values), [complex(float(c.real), float(c.imag)) for c in fft(values, engine="python")])
+        # при n = 4 все корни точные, и ДПФ по определению остаётся точным
+        exact = dft(values[:4])
+        self.assertEqual(exact[0], Complex(Rational(9, 2), 2))
+        self.assertEqual(exact[0].backend, "exact")
+
+    def test_twiddle_cache(self):
+        complex_fft._twiddles.cache_clear()
+        fft(list(range(16)), engine="python")
+        fft(list(range(16)), engine="python")
+        self.assertGreater(complex_fft._twiddles.cache_info().hits, 0)
+        self.assertEqual(complex_fft._twiddles(4), (1, -1j, -1, 1j))
+
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            fft([1, 2], engine="gpu")
+
+    def test_convolve_exact(self):
+        a = [Complex(Rational(1, 2), Rational(-3, 4)), Complex(2, 0), Complex(Rational(-5, 3), 1), Complex(0, 7)]
+        b = [Complex(Rational(2, 5), 1), Complex(-1, Rational(1, 6)), Complex(10 ** 20, -(10 ** 19))]
+        expected = []
+        for k in range(len(a) + len(b) - 1):
+            total = Complex(0, 0)
+            for j in range(len(a)):
+                if 0 <= k - j < len(b):
+                    total = total + a[j] * b[k - j]
+            expected.append(total)
+        result = convolve(a, b)
+        self.assertEqual(result, expected)
+        self.assertTrue(all(c.backend == "exact" for c in result))
+        self.assertEqual(convolve([1, 2, 3], [Rational(1, 2), -1]),
+                         [Complex(Rational(1, 2)), Complex(0), Complex(Rational(-1, 2)), Complex(-3)])
+        self.assertEqual(convolve([], [1]), [])
+
+    def test_convolve_float(self):
+        a = [Complex(1.5, -0.5, backend="float"), Complex(2, 1)]
+        b = [Complex(0.25, 1), Complex(-3, 0), Complex(1, 1)]
+        A =[complex(1.5, -0.5), complex(2, 1)]
+        B = [complex(0.25, 1), complex(-3, 0), complex(1, 1)]
+        expected = [sum(A[j] * B[k - j] for j in range(2) if 0 <= k - j < 3) for k in range(4)]
+        result = convolve(a, b)
+        self.assertEqual(result[0].backend, "float")
+        self.assertClose(result, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from rational import Rational
+from complex import Complex
+from expression import compile_plan, constant, variable, variables
+
+try:
+    import numpy
+    from complex_array import ComplexArray
+except ImportError:
+    numpy = None
+
+
+def formula(x, y):
+    return (x * y + Rational(1, 2)) * (y * x + Rational(1, 2)) - (x - y) ** 3 / (x * y + Rational(1, 2))
+
+
+class TestExpression(unittest.TestCase):
+    def setUp(self):
+        self.x, self.y = variables("x y")
+        self.values = [(Complex(Rational(1, 3), 2), Complex(-1, Rational(5, 7))),
+                       (Complex(2, 0), Complex(Rational(1, 2), Rational(-1, 4)))]
+
+    def test_scalars_and_cse(self):
+        plan = compile_plan(formula(self.x, self.y))
+        # x * y и y * x — одно подвыражение, x * y + 1/2 считается один раз
+        self.assertEqual(sum(op == "mul" and "x" in operands for op, _, operands in plan.instructions), 1)
+        self.assertEqual(sum(op == "add" for op, _, _ in plan.instructions), 1)
+        for a, b in self.values:
+            self.assertEqual(plan(a, b), formula(a, b))
+            self.assertEqual(plan(y=b, x=a), formula(a, b))
+        self.assertEqual(plan.variables, ("x", "y"))
+        self.assertIn("def plan(x, y, _constants):", plan.source)
+
+    def test_constants(self):
+        x = self.x
+        plan = compile_plan(constant(2) / x - constant(Rational(1, 3)) * 3 + x * (constant(1) + Rational(1, 4)))
+        self.assertEqual(len(plan.constants), 3)
+        a = Complex(Rational(3, 5), -1)
+        self.assertEqual(plan(a), a.inverse() * 2 - 1 + a * Rational(5, 4))
+        self.assertEqual(compile_plan(constant(Rational(1, 2)) + Rational(1, 3))(), Rational(5, 6))
+        self.assertEqual(compile_plan(-x ** 2)(Complex(0, 1)), Complex(1, 0))
+        # свёртка целой константы в отрицательной степени точная
+        inverse = compile_plan(constant(3) ** -1 * x)
+        self.assertEqual(inverse.constants, (Rational(1, 3),))
+        self.assertEqual(inverse(Complex(3, 0, backend="exact")), Complex(1, 0))
+        # 0.5 и Rational(1, 2) — разные константы
+        self.assertEqual(len(compile_plan(x * 0.5 + x * Rational(1, 2)).constants), 2)
+
+    def test_multiple_outputs_and_errors(self):
+        x, y = self.x, self.y
+        shared = x * y
+        plan = compile_plan([shared + 1, shared - 1, x], variables="y x")
+        self.assertEqual(plan.variables, ("y", "x"))
+        self.assertEqual(len(plan), 3)
+        self.assertEqual(plan(Complex(2, 0), Complex(0, 1)), (Complex(1, 2), Complex(-1, 2), Complex(0, 1)))
+        with self.assertRaises(ValueError):
+            compile_plan(x + y, variables=["x"])
+        with self.assertRaises(ValueError):
+            variable("_r0")
+        with self.assertRaises(TypeError):
+            x + "1"
+        with self.assertRaises(TypeError):
+            plan(1)
+
+    def test_deep(self):
+        x = self.x
+        total = x
+        for k in range(1, 5000):
+            total = total + x * k
+        plan = compile_plan(total)
+        self.assertEqual(plan(Rational(1, 2)), Rational(5000 * 4999 // 2 + 1, 2))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_arrays(self):
+        plan = compile_plan(formula(self.x, self.y))
+        xs = ComplexArray([a for a, _ in self.values])
+        ys = ComplexArray([b for _, b in self.values])
+        self.assertEqual(plan(xs, ys).to_list(), [formula(a, b) for a, b in self.values])
+        result = plan(xs.to_numpy(), ys.to_numpy())
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertTrue(numpy.allclose(result, plan(xs, ys).to_numpy()))
+
+
+if __name__ == '__main__':
+    unittest.main()
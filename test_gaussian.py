@@ -0,0 +1,104 @@
+import random
+import unittest
+from rational import Rational
+from complex import Complex
+from gaussian import FixedDenomComplex, GaussianInt
+
+
+class TestGaussianInt(unittest.TestCase):
+    def test_arithmetic(self):
+        a, b = GaussianInt(3, -4), GaussianInt(-2, 5)
+        self.assertEqual(a + b, GaussianInt(1, 1))
+        self.assertEqual(a - b, GaussianInt(5, -9))
+        self.assertEqual(a * b, GaussianInt(14, 23))
+        self.assertEqual(a * 2 - 1, GaussianInt(5, -8))
+        self.assertEqual(a ** 3, a * a * a)
+        self.assertEqual(a.norm(), 25)
+        self.assertEqual(a * a.conjugate(), 25)
+        self.assertIsInstance(a * b, GaussianInt)
+        self.assertEqual(a / b, Complex(a.real, a.imag) / Complex(b.real, b.imag))
+        self.assertEqual(a ** -1, Complex(Rational(3, 25), Rational(4, 25)))
+
+    def test_divmod_and_gcd(self):
+        rng = random.Random(21)
+        for _ in range(200):
+            a = GaussianInt(rng.randrange(-10 ** 6, 10 ** 6), rng.randrange(-10 ** 6, 10 ** 6))
+            b = GaussianInt(rng.randrange(-999, 999), rng.randrange(1, 999))
+            q, r = divmod(a, b)
+            self.assertEqual(q * b + r, a)
+            self.assertLessEqual(2 * r.norm(), b.norm())
+            self.assertEqual(a // b, q)
+            self.assertEqual(a % b, r)
+        g = GaussianInt(2, 1)
+        x, y = g * GaussianInt(7, -3), g * GaussianInt(1, 5) * GaussianInt(0, 1)
+        d = x.gcd(y)
+        self.assertEqual(divmod(x, d)[1], 0)
+        self.assertEqual(divmod(y, d)[1], 0)
+        self.assertGreater(d.real, 0)
+        self.assertGreaterEqual(d.imag, 0)
+        self.assertEqual(d.norm() % g.norm(), 0)
+        self.assertEqual(GaussianInt(0, -6).gcd(4), GaussianInt(2, 0))
+        self.assertEqual(GaussianInt(0).gcd(0), 0)
+        with self.assertRaises(ZeroDivisionError):
+            divmod(x, 0)
+
+    def test_complex_interop(self):
+        a = GaussianInt(1, 2)
+        c = Complex(Rational(1, 2), Rational(-1, 3))
+        self.assertEqual(a + c, Complex(Rational(3, 2), Rational(5, 3)))
+        self.assertEqual(c + a, a + c)
+        self.assertEqual(c * a, a * c)
+        self.assertEqual(c - a, -(a - c))
+        self.assertEqual(c / a, c / Complex(1, 2))
+        self.assertEqual(a + Rational(1, 2), Complex(Rational(3, 2), 2))
+        self.assertEqual(Complex(1, 2), a)
+        self.assertEqual(a, Complex(1, 2))
+        self.assertEqual(hash(a), hash(Complex(1, 2)))
+        self.assertEqual(hash(GaussianInt(7)), hash(7))
+        self.assertEqual(Complex.sum([a, c]), a + c)
+        self.assertEqual((Complex(0.5, 0.0, backend="float") + a).backend, "float")
+        self.assertTrue(a == complex(1, 2))
+        self.assertFalse(a == None)
+        self.assertTrue(FixedDenomComplex(1, 2, 3) != "x")
+        with self.assertRaises(TypeError):
+            GaussianInt(1.5, 0)
+
+
+class TestFixedDenomComplex(unittest.TestCase):
+    def test_arithmetic(self):
+        x = FixedDenomComplex(3, -5, scale=8)
+        y = FixedDenomComplex(1, 1, scale=2)
+        self.assertEqual((x + y).scale, 8)
+        self.assertEqual(x + y, Complex(Rational(7, 8), Rational(-1, 8)))
+        self.assertEqual(x - y, x.to_complex() - y.to_complex())
+        self.assertEqual(x * y, x.to_complex() * y.to_complex())
+        self.assertEqual((x * y).scale, 16)
+        self.assertEqual(x ** 3, x.to_complex() ** 3)
+        self.assertEqual(x / y, x.to_complex() / y.to_complex())
+        self.assertEqual(x + FixedDenomComplex(1, 0, scale=3), x.to_complex() + Rational(1, 3))
+        self.assertEqual(x + GaussianInt(1, 1), GaussianInt(1, 1) + x)
+        self.assertEqual((x + 1).numerators, (11, -5))
+        self.assertEqual(x.real, Rational(3, 8))
+
+    def test_conversion(self):
+        c = Complex(Rational(3, 4), Rational(-1, 10))
+        f = FixedDenomComplex.from_complex(c)
+        self.assertEqual(f.scale, 20)
+        self.assertEqual(f, c)
+        self.assertEqual(c, f)
+        self.assertEqual(hash(f), hash(c))
+        self.assertEqual(FixedDenomComplex.from_complex(c, scale=100).numerators, (75, -10))
+        self.assertEqual(f.with_scale(1000).numerators, (750, -100))
+        self.assertEqual(FixedDenomComplex(4, 2, scale=4), FixedDenomComplex(2, 1, scale=2))
+        with self.assertRaises(ValueError):
+            FixedDenomComplex.from_complex(c, scale=16)
+        with self.assertRaises(ValueError):
+            f.with_scale(3)
+        with self.assertRaises(ValueError):
+            FixedDenomComplex(1, 1, scale=0)
+        self.assertEqual(c * f, c * c)
+        self.assertEqual(f + Rational(1, 4), Complex(1, Rational(-1, 10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
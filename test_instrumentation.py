@@ -0,0 +1,91 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from rational import Rational
+from complex import Complex
+import instrumentation
+from instrumentation import instrument
+
+
+@unittest.skipIf(instrumentation.is_enabled(), "instrumentation is enabled from the environment")
+class TestInstrumentation(unittest.TestCase):
+    def test_counts(self):
+        add = Rational.__add__
+        from_reduced = Rational.__dict__["_from_reduced"].__func__
+        with instrument() as stats:
+            self.assertTrue(instrumentation.is_enabled())
+            self.assertIsNot(Rational.__add__, add)
+            a = Rational(1, 6) + Rational(1, 3)
+            Complex(Rational(1, 2), 3) * Complex(a, -1)
+            Rational(2, 4).reduce()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(Rational.__add__, add)
+        self.assertIs(Rational.__dict__["_from_reduced"].__func__, from_reduced)
+        self.assertGreaterEqual(stats.calls["Rational.__add__"], 1)
+        self.assertEqual(stats.calls["Complex.__mul__"], 1)
+        self.assertEqual(stats.calls["Rational.reduce"], 1)
+        self.assertGreaterEqual(stats.reductions, 3)
+        # результаты операторов строятся через _from_reduced и тоже учитываются
+        self.assertGreater(stats.prereduced, 0)
+        self.assertGreater(stats.gcd_calls, 0)
+        self.assertGreater(stats.gcd_bits, 0)
+        self.assertEqual(sum(stats.timings["Complex.__mul__"].values()), 1)
+        self.assertEqual(sum(stats.numerator_bits.values()), sum(stats.denominator_bits.values()))
+        # после выхода из блока статистика не растёт
+        calls = dict(stats.calls)
+        Rational(1, 2) + Rational(1, 3)
+        self.assertEqual(stats.calls, calls)
+
+    def test_nested_and_bits(self):
+        with instrument() as outer:
+            with instrument() as inner:
+                self.assertIs(inner, outer)
+                Rational(2 ** 40 + 1, 3) * Rational(5, 2 ** 70)
+            self.assertTrue(instrumentation.is_enabled())
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(outer.calls["Rational.__mul__"], 1)
+        self.assertIn(64, outer.numerator_bits)
+        self.assertIn(128, outer.denominator_bits)
+
+    def test_keyword_arguments(self):
+        with instrument() as stats:
+            self.assertEqual(Rational(n=2, m=4), Rational(1, 2))
+            before = stats.prereduced
+            Rational.parse("3/4")
+            self.assertEqual(stats.reductions, 3)
+            Rational(1, 3) * Rational(3, 5)
+        self.assertEqual(stats.prereduced, before + 1)
+
+    def test_export(self):
+        with instrument() as stats:
+            Complex(Rational(1, 2), Rational(1, 3)) + Complex(1, 1)
+        snapshot = json.loads(stats.to_json())
+        self.assertEqual(snapshot["calls"]["Complex.__add__"], 1)
+        self.assertEqual(snapshot["reductions"], stats.reductions)
+        text = stats.to_prometheus()
+        self.assertIn('rational_calls_total{method="Complex.__add__"} 1', text)
+        self.assertIn("# TYPE rational_call_duration_seconds histogram", text)
+        self.assertIn('rational_call_duration_seconds_count{method="Complex.__add__"} 1', text)
+        self.assertIn(f"rational_gcd_calls_total {stats.gcd_calls}", text)
+        self.assertIn(f"rational_prereduced_total {stats.prereduced}", text)
+        self.assertEqual(snapshot["prereduced"], stats.prereduced)
+        self.assertIn('rational_numerator_bits_bucket{le="+Inf"}', text)
+
+    def test_environment(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "snapshot.json")
+        env = dict(os.environ, RATIONAL_INSTRUMENT="1", RATIONAL_INSTRUMENT_OUTPUT=path)
+        code = "from complex import Complex; Complex(1, 2) * Complex(3, 4)"
+        subprocess.run([sys.executable, "-c", code], env=env, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        with open(path) as file:
+            snapshot = json.load(file)
+        self.assertEqual(snapshot["calls"]["Complex.__mul__"], 1)
+        self.assertGreater(snapshot["calls"]["Rational.__init__"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
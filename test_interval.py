@@ -0,0 +1,128 @@
+import random
+import sys
+import unittest
+from fractions import Fraction
+from math import atan2, hypot, inf
+from rational import Rational
+from complex import Complex
+from interval import ComplexInterval
+
+try:
+    import numpy
+    from interval import ComplexIntervalArray
+except ImportError:
+    numpy = None
+
+
+def random_complex(rng):
+    return Complex(Rational(rng.randrange(-10 ** 6, 10 ** 6), rng.randrange(1, 10 ** 4)),
+                   Rational(rng.randrange(-10 ** 6, 10 ** 6), rng.randrange(1, 10 ** 4)))
+
+
+def inside(bounds, value):
+    return Fraction(bounds[0]) <= Fraction(value) <= Fraction(bounds[1])
+
+
+class TestComplexInterval(unittest.TestCase):
+    def test_enclosures(self):
+        rng = random.Random(23)
+        for _ in range(100):
+            x, y = random_complex(rng), random_complex(rng)
+            a, b = ComplexInterval(x), ComplexInterval(y)
+            self.assertTrue(a.contains(x))
+            self.assertTrue((a + b).contains(x + y))
+            self.assertTrue((a - b).contains(x - y))
+            self.assertTrue((a * b).contains(x * y))
+            self.assertTrue((a / b).contains(x / y))
+            self.assertTrue((a ** 3).contains(x ** 3))
+            self.assertTrue((a ** -2).contains(x ** -2))
+            self.assertTrue((a * 3 - Rational(1, 3)).contains(x * 3 - Rational(1, 3)))
+            z = (a * b + a) / b
+            self.assertLess(z.radius, 1e-6 * (1 + abs(z.midpoint)))
+            exact = (x * y + x) / y
+            self.assertTrue(z.contains(exact))
+            # модуль и аргумент считаются через Fraction от точных частей
+            low, high = z.abs()
+            self.assertTrue(low <= hypot(float(exact.real), float(exact.imag)) <= high)
+            low, high = z.arg()
+            self.assertTrue(low <= atan2(float(exact.imag), float(exact.real)) <= high)
+
+    def test_points_and_bounds(self):
+        z = ComplexInterval(Complex(Rational(1, 2), -3))
+        self.assertEqual(z.real, (0.5, 0.5))
+        third = ComplexInterval(Rational(1, 3))
+        self.assertLess(third.real[0], third.real[1])
+        self.assertTrue(inside(third.real, Fraction(1, 3)))
+        self.assertEqual(ComplexInterval(2).abs(), (2.0, 2.0))
+        self.assertGreaterEqual(ComplexInterval.from_bounds(-1, 1, -1, 1).arg()[1], 3.14159)
+        with self.assertRaises(ZeroDivisionError):
+            ComplexInterval(1) / ComplexInterval.from_bounds(-1e-9, 1e-9, 0, 0)
+        with self.assertRaises(ValueError):
+            ComplexInterval.from_bounds(1, 0, 0, 0)
+
+    def test_beyond_float_range(self):
+        huge = Complex(Rational(10 ** 400, 1), Rational(-10 ** 400, 3))
+        z = ComplexInterval(huge)
+        self.assertEqual(z.real, (sys.float_info.max, inf))
+        self.assertEqual(z.imag, (-inf, -sys.float_info.max))
+        for w in (z * 2, z / 3, z / z, z * z, z - z, z + Complex(1, 1)):
+            self.assertTrue(w.contains(w.exact()))
+        self.assertEqual((z * 2).imag[0], -inf)
+        self.assertTrue(z == ComplexInterval(huge))
+
+    def test_eq_fallback(self):
+        third = ComplexInterval(Rational(1, 3))
+        # оболочки пересекаются, но по границам равенство не решается
+        self.assertEqual(third * 3, 1)
+        self.assertNotEqual(third * 3, ComplexInterval(Rational(10 ** 17 + 1, 10 ** 17)))
+        self.assertEqual(ComplexInterval(0.5), Rational(1, 2))
+        self.assertNotEqual(ComplexInterval(1), 2)
+        x = ComplexInterval(Complex(Rational(1, 7), Rational(2, 9)))
+        y = x
+        for _ in range(2000):
+            y = y + x - x
+        self.assertEqual(y, x)
+        self.assertEqual(y.exact(), x.exact())
+        with self.assertRaises(ValueError):
+            (third * 3).detach() == 1
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestComplexIntervalArray(unittest.TestCase):
+    def test_matches_scalars(self):
+        rng = random.Random(24)
+        xs = [random_complex(rng) for _ in range(30)]
+        ys = [random_complex(rng) for _ in range(30)]
+        a, b = ComplexIntervalArray(xs), ComplexIntervalArray(ys)
+        result = (a * b - a) / b + ComplexInterval(Rational(1, 3))
+        powers = a ** -2
+        low, high = result.abs()
+        arg_low, arg_high = result.arg()
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            scalar = (ComplexInterval(x) * ComplexInterval(y) - ComplexInterval(x)) / ComplexInterval(y) + Rational(1, 3)
+            self.assertEqual(result[i].real, scalar.real)
+            self.assertEqual(result[i].imag, scalar.imag)
+            exact = (x * y - x) / y + Rational(1, 3)
+            self.assertTrue(result[i].contains(exact))
+            self.assertTrue(powers[i].contains(x ** -2))
+            self.assertTrue(low[i] <= hypot(float(exact.real), float(exact.imag)) <= high[i])
+            self.assertTrue(arg_low[i] <= atan2(float(exact.imag), float(exact.real)) <= arg_high[i])
+            self.assertEqual(result[i].exact(), exact)
+
+    def test_equal(self):
+        values = [Rational(1, 3), 2, Complex(Rational(1, 2), 1), Rational(2, 3)]
+        a = ComplexIntervalArray(values)
+        tripled = a * 3
+        expected = [1, 6, Complex(Rational(3, 2), 3), 3]
+        self.assertEqual(tripled.equal(ComplexIntervalArray(expected)).tolist(), [True, True, True, False])
+        self.assertEqual(a.equal(2).tolist(), [False, True, False, False])
+        self.assertEqual(len(a.to_list()), 4)
+        huge = ComplexIntervalArray([Rational(-10 ** 400, 1), 1])
+        self.assertEqual(huge.real[0].tolist(), [-inf, 1.0])
+        product = huge * huge
+        self.assertEqual(product.real[1][0], inf)
+        self.assertEqual(product.equal(huge * huge).tolist(), [True, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
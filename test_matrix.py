@@ -0,0 +1,158 @@
+import random
+import unittest
+from fractions import Fraction
+from rational import Rational
+from complex import Complex
+import matrix
+from matrix import ComplexMatrix, RationalMatrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def fraction_det(rows):
+    rows = [[Fraction(x.numerator, x.denominator) for x in row] for row in rows]
+    n = len(rows)
+    det = Fraction(1)
+    for k in range(n):
+        p = next((i for i in range(k, n) if rows[i][k] != 0), None)
+        if p is None:
+            return Fraction(0)
+        if p != k:
+            rows[k], rows[p] = rows[p], rows[k]
+            det = -det
+        det *= rows[k][k]
+        for i in range(k + 1, n):
+            f = rows[i][k] / rows[k][k]
+            rows[i] = [a - f * b for a, b in zip(rows[i], rows[k])]
+    return det
+
+
+class TestRationalMatrix(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1)
+        self.a = RationalMatrix([[Rational(rng.randrange(-9, 10), rng.randrange(1, 8)) for _ in range(5)]
+                                 for _ in range(5)])
+        self.b = RationalMatrix([[Rational(rng.randrange(-9, 10), rng.randrange(1, 8)) for _ in range(3)]
+                                 for _ in range(5)])
+
+    def test_basic(self):
+        m = RationalMatrix([[1, Rational(1, 2)], [0, 3]])
+        self.assertEqual(m.shape, (2, 2))
+        self.assertEqual(m[0, 1], Rational(1, 2))
+        self.assertEqual(m.transpose().to_list(), [[Rational(1, 1), Rational(0, 1)], [Rational(1, 2), Rational(3, 1)]])
+        self.assertEqual(m + m, m * 2)
+        self.assertEqual(m - m, RationalMatrix([[0, 0], [0, 0]]))
+        self.assertEqual(-m, m * -1)
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2], [3]])
+        with self.assertRaises(ValueError):
+            m + RationalMatrix([[1]])
+
+    def test_matmul(self):
+        product = self.a @ self.b
+        for i in range(5):
+            for j in range(3):
+                expected = Rational(0, 1)
+                for k in range(5):
+                    expected = expected + self.a[i, k] * self.b[k, j]
+                self.assertEqual(product[i, j], expected)
+        with self.assertRaises(ValueError):
+            self.b @ self.a
+
+    def test_matmul_blocks(self):
+        old = matrix.BLOCK_SIZE
+        matrix.BLOCK_SIZE = 2
+        try:
+            blocked = self.a @ self.b
+        finally:
+            matrix.BLOCK_SIZE = old
+        self.assertEqual(blocked, self.a @ self.b)
+
+    def test_det(self):
+        det = self.a.det()
+        expected = fraction_det(self.a.to_list())
+        self.assertEqual((det.numerator, det.denominator), (expected.numerator, expected.denominator))
+        self.assertEqual(RationalMatrix([[0, 1], [1, 0]]).det(), Rational(-1, 1))
+        self.assertEqual(RationalMatrix([[1, 2], [2, 4]]).det(), Rational(0, 1))
+        self.assertEqual(RationalMatrix([]).det(), Rational(1, 1))
+
+    def test_solve_inverse(self):
+        x = self.a.solve(self.b)
+        self.assertEqual(self.a @ x, self.b)
+        self.assertEqual(self.a @ self.a.inverse(), RationalMatrix.identity(5))
+        vector = self.a.solve([1, 2, 3, 4, 5])
+        self.assertEqual(self.a @ RationalMatrix([[v] for v in vector]), RationalMatrix([[1], [2], [3], [4], [5]]))
+        # ведущий элемент в первой строке нулевой — нужна перестановка строк
+        m = RationalMatrix([[0, 1, 2], [1, 0, 3], [4, -3, 8]])
+        self.assertEqual(m.inverse() @ m, RationalMatrix.identity(3))
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2], [2, 4]]).inverse()
+        with self.assertRaises(ValueError):
+            self.b.det()
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_float_backend(self):
+        f = self.a.to_float()
+        self.assertEqual(f.backend, "float")
+        self.assertAlmostEqual(f.det(), float(self.a.det()))
+        self.assertTrue(numpy.allclose((f @ self.b.to_float()).to_numpy(), (self.a @ self.b).to_numpy()))
+        self.assertTrue(numpy.allclose(f.inverse().to_numpy(), self.a.inverse().to_numpy()))
+        self.assertEqual(RationalMatrix([[0.5, 0.25]], backend="float").to_exact(),
+                         RationalMatrix([[Rational(1, 2), Rational(1, 4)]]))
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2], [2, 4]], backend="float").inverse()
+        with self.assertRaises(ValueError):
+            f @ self.b
+
+
+class TestComplexMatrix(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(2)
+
+        def entry():
+            return Complex(Rational(rng.randrange(-9, 10), rng.randrange(1, 6)),
+                           Rational(rng.randrange(-9, 10), rng.randrange(1, 6)))
+        self.a = ComplexMatrix([[entry() for _ in range(4)] for _ in range(4)])
+        self.b = ComplexMatrix([[entry() for _ in range(2)] for _ in range(4)])
+
+    def test_matmul(self):
+        product = self.a @ self.b
+        for i in range(4):
+            for j in range(2):
+                expected = Complex(0, 0)
+                for k in range(4):
+                    expected = expected + self.a[i, k] * self.b[k, j]
+                self.assertEqual(product[i, j], expected)
+
+    def test_det(self):
+        m = ComplexMatrix([[Complex(1, 1), 2], [Complex(0, Rational(1, 2)), Complex(3, -1)]])
+        self.assertEqual(m.det(), Complex(1, 1) * Complex(3, -1) - Complex(0, 1))
+        # разложение по первой строке для 4 x 4 через миноры 3 x 3
+        a = self.a.to_list()
+        expected = Complex(0, 0)
+        for j in range(4):
+            minor = ComplexMatrix([row[:j] + row[j + 1:] for row in a[1:]])
+            term = a[0][j] * minor.det()
+            expected = expected + term if j % 2 == 0 else expected - term
+        self.assertEqual(self.a.det(), expected)
+
+    def test_solve_inverse(self):
+        self.assertEqual(self.a @ self.a.solve(self.b), self.b)
+        self.assertEqual(self.a.inverse() @ self.a, ComplexMatrix.identity(4))
+        with self.assertRaises(ValueError):
+            ComplexMatrix([[Complex(1, 1), Complex(2, 2)], [1, 2]]).solve([1, 1])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_float_backend(self):
+        f = self.a.to_float()
+        det = f.det()
+        self.assertEqual(det.backend, "float")
+        self.assertAlmostEqual(det.abs(), self.a.det().abs())
+        self.assertTrue(numpy.allclose(f.inverse().to_numpy(), self.a.inverse().to_numpy()))
+
+
+if __name__ == '__main__':
+    unittest.main()
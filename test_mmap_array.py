@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from rational import Rational
+from complex import Complex
+
+try:
+    import numpy
+    import mmap_array
+    from mmap_array import MappedArrayWriter, MappedComplexArray, load, save
+    from complex_array import ComplexArray
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestMappedComplexArray(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "values.rcmap")
+        big = 10 ** 30 + 1
+        self.values = [Complex(Rational(k, 7), Rational(-k, k + 2)) for k in range(20)]
+        self.values[5] = Complex(Rational(big, 3), 1)
+        self.values[13] = Complex(Rational(1, 2), Rational(-1, big))
+        self.values.append(Rational(3, 4))
+        self.values.append(Complex(0.5, -0.25, backend="float"))
+
+    def expected(self):
+        return [v if isinstance(v, Complex) else Complex(v) for v in self.values]
+
+    def test_round_trip(self):
+        save(self.path, self.values)
+        array = load(self.path)
+        self.assertEqual(len(array), len(self.values))
+        self.assertEqual(array.to_list(), self.expected())
+        self.assertEqual(array[5], self.values[5])
+        self.assertEqual(array[-1].backend, "exact")
+        self.assertFalse(array.is_int64)
+
+    def test_columns_are_views(self):
+        save(self.path, self.values[:5])
+        array = load(self.path)
+        self.assertTrue(array.is_int64)
+        self.assertEqual(array.real_numerators.tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(array.imag_denominators.tolist(), [1, 3, 2, 5, 3])
+        self.assertFalse(array.real_numerators.flags.owndata)
+        with self.assertRaises(ValueError):
+            array.real_numerators[0] = 1
+        exact = array.to_complex_array()
+        self.assertIsInstance(exact, ComplexArray)
+        self.assertEqual(exact.to_list(), self.values[:5])
+        self.assertTrue(numpy.allclose(array.to_numpy(), exact.to_numpy()))
+
+    def test_int64_boundary(self):
+        low = -(1 << 63)
+        values = [Complex(low + 1, 1), Complex(Rational(low, 1), 0), Complex(0, Rational(1, 3))]
+        save(self.path, values)
+        array = load(self.path)
+        self.assertFalse(array.is_int64)
+        self.assertTrue(array[:1].is_int64)
+        exact = array.to_complex_array()
+        self.assertEqual(exact.to_list(), values)
+        self.assertEqual((exact * 2)[1].real, Rational(2 * low, 1))
+        self.assertEqual((-exact).to_list(), [-v for v in values])
+
+    def test_slices(self):
+        with MappedArrayWriter(self.path) as writer:
+            writer.extend(self.values)
+        array = load(self.path)
+        expected = self.expected()
+        part = array[3:15:2]
+        self.assertIsInstance(part, MappedComplexArray)
+        self.assertEqual(part.to_list(), expected[3:15:2])
+        self.assertEqual(part[1], expected[5])
+        self.assertEqual(part[::-1].to_list(), expected[3:15:2][::-1])
+        self.assertTrue(array[6:13].is_int64)
+        self.assertEqual(part.to_complex_array().to_list(), expected[3:15:2])
+        self.assertEqual((part.to_complex_array() * 2).to_list(), [c * 2 for c in expected[3:15:2]])
+
+    def test_batches_and_empty(self):
+        old = mmap_array.WRITE_BATCH
+        mmap_array.WRITE_BATCH = 3
+        try:
+            save(self.path, self.values)
+        finally:
+            mmap_array.WRITE_BATCH = old
+        self.assertEqual(load(self.path).to_list(), self.expected())
+        save(self.path, [])
+        self.assertEqual(len(load(self.path)), 0)
+
+    def test_bad_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"garbage")
+        with self.assertRaises(ValueError):
+            load(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from rational import Rational
+from complex import Complex
+import parallel
+from parallel import autotune_chunk_size, pdot, pmap, pprod, psum
+
+
+def square(value):
+    return value * value
+
+
+def modulus(value):
+    return value.abs()
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.rationals = [Rational(k % 17 - 8, k % 13 + 1) for k in range(600)]
+        self.complexes = [Complex(Rational(k, 7), Rational(-k % 11, k % 5 + 1)) for k in range(600)]
+
+    def test_encode_round_trip(self):
+        for values in (self.rationals[:10], self.complexes[:10], [1, Rational(2, 3)],
+                       [Complex(0.5, -1.5, backend="float")], [1.5, "x"], [3, -10 ** 30],
+                       [Complex(Rational(1, 3), 0), Complex(0.5, -1.5, backend="float")]):
+            kind, payload = parallel._encode(values)
+            self.assertTrue(all(isinstance(x, (int, complex)) for x in payload) or kind == "object")
+            decoded = parallel._decode(kind, payload)
+            self.assertEqual(decoded, values)
+            self.assertEqual([type(v) for v in decoded], [type(v) for v in values])
+
+    def test_pmap(self):
+        self.assertEqual(pmap(square, self.rationals, workers=2), [square(x) for x in self.rationals])
+        self.assertEqual(pmap(square, self.complexes, workers=2, chunk_size=50),
+                         [square(x) for x in self.complexes])
+        self.assertEqual(pmap(modulus, self.complexes, workers=2), [modulus(x) for x in self.complexes])
+        # короткие входы считаются без пула
+        self.assertEqual(pmap(square, self.rationals[:5]), [square(x) for x in self.rationals[:5]])
+        # целые остаются int и в пуле, и без него
+        integers = list(range(-300, 300))
+        for result in (pmap(square, integers, workers=2), pmap(square, integers[:5])):
+            self.assertTrue(all(type(x) is int for x in result))
+        self.assertEqual(pmap(square, integers, workers=2), [x * x for x in integers])
+        # точные числа в смеси с float-числами остаются точными и в пуле
+        mixed = [Complex(Rational(1, 3), k) if k % 2 else Complex(0.5, k, backend="float") for k in range(600)]
+        self.assertEqual([z.backend for z in pmap(square, mixed, workers=2, chunk_size=50)],
+                         [z.backend for z in map(square, mixed)])
+        self.assertEqual(pmap(square, mixed, workers=2, chunk_size=50), [square(z) for z in mixed])
+
+    def test_reductions(self):
+        self.assertEqual(psum(self.rationals, workers=2), Rational.sum(self.rationals))
+        self.assertEqual(psum(self.complexes, workers=2, chunk_size=64), Complex.sum(self.complexes))
+        factors = [Rational(k + 1, k + 2) for k in range(400)]
+        self.assertEqual(pprod(factors, workers=2), Rational(1, 401))
+        expected = Complex(0, 0)
+        for a, b in zip(self.complexes, self.rationals):
+            expected = expected + a * b
+        self.assertEqual(pdot(self.complexes, self.rationals, workers=2), expected)
+        self.assertEqual(pdot(self.rationals, self.complexes, workers=2), expected)
+        with self.assertRaises(ValueError):
+            pdot([1], [1, 2])
+
+    def test_autotune(self):
+        size = autotune_chunk_size(lambda shard: [square(x) for x in shard], self.rationals, workers=2)
+        self.assertGreaterEqual(size, 1)
+        self.assertLessEqual(size, len(self.rationals) // (2 * parallel.CHUNKS_PER_WORKER) + 1)
+        self.assertEqual(autotune_chunk_size(len, [], workers=2), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import io
+import unittest
+from rational import Rational
+from complex import Complex
+from parsing import iter_parse
+
+
+class TestIterParse(unittest.TestCase):
+    def setUp(self):
+        self.values = [Complex(Rational(k, 7), Rational(-k, 3)) for k in range(50)]
+        self.text = "\n".join(["1/2 + 3/4i", "", "Complex(0.25, -1)", "  "] + [repr(c) for c in self.values]) + "\n-i"
+        self.expected = [Complex(Rational(1, 2), Rational(3, 4)), Complex(Rational(1, 4), -1)] + \
+            [Complex.parse(repr(c)) for c in self.values] + [Complex(0, -1)]
+
+    def test_chunks(self):
+        for chunk_size in (1, 5, 64, 1 << 16):
+            self.assertEqual(list(iter_parse(io.StringIO(self.text), chunk_size=chunk_size)), self.expected)
+
+    def test_binary_and_rational(self):
+        data = b"1/3\n0.25\n \n-7\n"
+        self.assertEqual(list(iter_parse(io.BytesIO(data), kind="rational", chunk_size=2)),
+                         [Rational(1, 3), Rational(1, 4), Rational(-7, 1)])
+        self.assertEqual(list(iter_parse(io.StringIO("1;2;3"), kind="rational", separator=";")),
+                         [Rational(1, 1), Rational(2, 1), Rational(3, 1)])
+        # многобайтовые символы (неразрывный пробел, разделитель «·»), разрезанные границей блока
+        data = "1/3\u00a0·\u00a0-2i·0.5".encode()
+        for chunk_size in (1, 2, 3, 64):
+            self.assertEqual(list(iter_parse(io.BytesIO(data), chunk_size=chunk_size, separator="·")),
+                             [Complex(Rational(1, 3), 0), Complex(0, -2), Complex(Rational(1, 2), 0)])
+        with self.assertRaises(UnicodeDecodeError):
+            list(iter_parse(io.BytesIO(b"1\n\xff\n"), chunk_size=1))
+        with self.assertRaises(UnicodeDecodeError):
+            list(iter_parse(io.BytesIO(b"1\n\xc3"), chunk_size=1))
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "record 3"):
+            list(iter_parse(io.StringIO("1\n2\nxyz\n")))
+        # порядок ограничен, поэтому запись с огромным порядком отклоняется сразу
+        with self.assertRaisesRegex(ValueError, "record 2.*PARSE_MAX_EXPONENT"):
+            list(iter_parse(io.StringIO("1\n1e-99999999\n")))
+        with self.assertRaises(ValueError):
+            list(iter_parse(io.StringIO("1"), kind="matrix"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from rational import Rational
+from complex import Complex
+import polynomial
+from polynomial import Polynomial
+
+try:
+    import numpy
+    from complex_array import ComplexArray
+    from rational_array import RationalArray
+except ImportError:
+    numpy = None
+
+
+class TestPolynomial(unittest.TestCase):
+    def setUp(self):
+        # 1/2 - 3x + 2/3 x^2
+        self.p = Polynomial([Rational(1, 2), -3, Rational(2, 3)])
+        # i + (1 - 2i) x
+        self.q = Polynomial([Complex(0, 1), Complex(1, -2)])
+
+    def test_normalization(self):
+        self.assertEqual(Polynomial([1, 2, 0, 0]).degree, 1)
+        self.assertEqual(Polynomial([0, 0]).degree, -1)
+        self.assertEqual(Polynomial([1, 0.5]).coefficients, (Rational(1, 1), Rational(1, 2)))
+        self.assertTrue(Polynomial([1, 2j]).is_complex)
+        self.assertEqual(Polynomial([2, 0]), 2)
+
+    def test_horner(self):
+        x = Rational(3, 5)
+        expected = Rational(1, 2) - x * 3 + Rational(2, 3) * x * x
+        self.assertEqual(self.p(x), expected)
+        z = Complex(Rational(1, 3), -2)
+        self.assertEqual(self.p(z), Complex(Rational(1, 2)) + z * -3 + z * z * Rational(2, 3))
+        self.assertEqual(self.q(2), Complex(2, -3))
+        self.assertEqual(Polynomial()(5), Rational(0, 1))
+
+    def test_arithmetic(self):
+        s = self.p + self.q
+        self.assertEqual(s.coefficients, (Complex(Rational(1, 2), 1), Complex(-2, -2), Complex(Rational(2, 3))))
+        self.assertEqual(s - self.q, self.p)
+        self.assertEqual((self.p * self.q)(Rational(7, 3)), self.q(Rational(7, 3)) * self.p(Rational(7, 3)))
+        self.assertEqual(self.p * 0, Polynomial())
+        self.assertEqual(Polynomial([1, 1]) * Polynomial([-1, 1]), Polynomial([-1, 0, 1]))
+        self.assertEqual(self.p.derivative(), Polynomial([-3, Rational(4, 3)]))
+
+    def test_fast_multiplication_matches_schoolbook(self):
+        n = polynomial.MULTIPLY_THRESHOLD + 5
+        a = Polynomial([Rational(k + 1, k % 7 + 2) for k in range(n)])
+        b = Polynomial([Complex(Rational(k, 3), -k) for k in range(n)])
+        fast = a * b
+        old = polynomial.MULTIPLY_THRESHOLD
+        polynomial.MULTIPLY_THRESHOLD = 10 ** 9
+        try:
+            slow = a * b
+            rational_slow = a * a
+        finally:
+            polynomial.MULTIPLY_THRESHOLD = old
+        self.assertEqual(fast, slow)
+        self.assertEqual(a * a, rational_slow)
+        # вычислитель по умолчанию не влияет на точное произведение дробных многочленов
+        with Complex.use_backend("float"):
+            square = a * a
+            self.assertEqual(Polynomial([0.5j]).coefficients[0].backend, "exact")
+        self.assertEqual(square, rational_slow)
+        self.assertEqual(square(Rational(1, 3)), a(Rational(1, 3)) * a(Rational(1, 3)))
+        self.assertFalse((a * a).is_complex)
+
+    def test_roots(self):
+        # (x - 1)(x + 2)(x - i)
+        p = Polynomial([1, -1]) * Polynomial([2, 1]) * Polynomial([Complex(0, -1), 1])
+        approximate = p.roots(refine=0)
+        self.assertEqual(len(approximate), 3)
+        self.assertTrue(all(r.backend == "float" for r in approximate))
+        for expected in (complex(1, 0), complex(-2, 0), complex(0, 1)):
+            self.assertTrue(any(abs(r._as_complex() - expected) < 1e-9 for r in approximate))
+        refined = p.roots(refine=2)
+        self.assertTrue(all(r.backend == "exact" for r in refined))
+        for r in refined:
+            self.assertLess(p(r).abs(), 1e-25)
+        with self.assertRaises(ValueError):
+            Polynomial().roots()
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_evaluate_many(self):
+        points = [Complex(Rational(k, 3), Rational(-k, 5)) for k in range(6)]
+        values = self.p.evaluate_many(ComplexArray(points))
+        self.assertIsInstance(values, ComplexArray)
+        self.assertEqual(values.to_list(), [self.p(z) for z in points])
+        values = self.q.evaluate_many(ComplexArray(points, exact=False))
+        for value, z in zip(values.to_list(), points):
+            self.assertAlmostEqual(value.abs(), self.q(z).abs())
+        reals = RationalArray([Rational(k, 7) for k in range(5)])
+        self.assertEqual(self.p.evaluate_many(reals).to_list(), [self.p(x) for x in reals])
+        self.assertEqual(self.q.evaluate_many(reals).to_list(), [self.q(x) for x in reals])
+
+    def test_evaluate_many_list(self):
+        self.assertEqual(self.p.evaluate_many([0, 1]), [Rational(1, 2), Rational(-11, 6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -154,3 +154,206 @@ class TestRational(unittest.TestCase):
         result = r1 * r2
         self.assertEqual(result.numerator, 1)
         self.assertEqual(result.denominator, 1)
+
+    def test_immutable(self):
+        r1 = Rational(1, 2)
+        with self.assertRaises(AttributeError):
+            r1.numerator = 3
+        with self.assertRaises(AttributeError):
+            r1.extra = 1
+
+        r2 = r1
+        r2 += Rational(1, 4)
+        self.assertEqual(r1, Rational(1, 2))
+        self.assertEqual(r2, Rational(3, 4))
+
+    def test_hash(self):
+        self.assertEqual(hash(Rational(1, 2)), hash(Rational(2, 4)))
+        self.assertEqual(hash(Rational(4, 2)), hash(2))
+        self.assertEqual(len({Rational(1, 3), Rational(2, 6), Rational(1, 2)}), 2)
+
+    def test_canonical_form(self):
+        r = Rational(6, -8)
+        self.assertEqual(r.numerator, -3)
+        self.assertEqual(r.denominator, 4)
+
+        r = Rational(0, -5)
+        self.assertEqual(r.numerator, 0)
+        self.assertEqual(r.denominator, 1)
+
+        with self.assertRaises(ValueError):
+            Rational(1, 0)
+        with self.assertRaises(TypeError):
+            Rational(0.5, 1)
+
+    def test_int_operations_reduce(self):
+        r = Rational(1, 6) * 3
+        self.assertEqual((r.numerator, r.denominator), (1, 2))
+
+        r = Rational(2, 3) / -4
+        self.assertEqual((r.numerator, r.denominator), (-1, 6))
+
+        r = Rational(1, 2) + 1
+        self.assertEqual((r.numerator, r.denominator), (3, 2))
+
+    def test_negative_pow(self):
+        r = Rational(-2, 3) ** -3
+        self.assertEqual((r.numerator, r.denominator), (-27, 8))
+        with self.assertRaises(ZeroDivisionError):
+            Rational(0, 1) ** -1
+
+    def test_matches_fraction(self):
+        from fractions import Fraction
+        values = [(n, d) for n in range(-7, 8) for d in (1, 2, 3, 4, 6, 9, 12)]
+        for n1, d1 in values[::5]:
+            for n2, d2 in values[::3]:
+                r1, r2 = Rational(n1, d1), Rational(n2, d2)
+                f1, f2 = Fraction(n1, d1), Fraction(n2, d2)
+                for result, expected in ((r1 + r2, f1 + f2), (r1 - r2, f1 - f2), (r1 * r2, f1 * f2)):
+                    self.assertEqual((result.numerator, result.denominator),
+                                     (expected.numerator, expected.denominator))
+                if n2:
+                    result, expected = r1 / r2, f1 / f2
+                    self.assertEqual((result.numerator, result.denominator),
+                                     (expected.numerator, expected.denominator))
+
+    def test_hash_matches_fraction(self):
+        from fractions import Fraction
+        import sys
+        modulus = sys.hash_info.modulus
+        for n, d in ((0, 1), (-1, 1), (1, 3), (-7, 12), (10 ** 30, 7), (5, modulus), (-3, 2 * modulus)):
+            self.assertEqual(hash(Rational(n, d)), hash(Fraction(n, d)))
+        self.assertEqual({Rational(2, 1): "two"}[2], "two")
+
+    def test_mixed_containers(self):
+        from fractions import Fraction
+        self.assertEqual(len({0.5, Rational(1, 2), Fraction(1, 2)}), 1)
+        self.assertEqual(len({1 / 3, Rational(1, 3)}), 2)
+        self.assertEqual({Fraction(1, 2): 1}[Rational(1, 2)], 1)
+        self.assertEqual({Rational(3, 4): 1}[0.75], 1)
+        self.assertNotIn(Rational(1, 2), [None, "1/2", float("nan"), float("inf")])
+        self.assertTrue(Rational(1, 2) != "1/2")
+
+    def test_interning(self):
+        Rational.enable_interning(maxsize=2, max_component=10)
+        try:
+            half = Rational(1, 4) + Rational(1, 4)
+            self.assertIs(half, Rational(3, 2) - 1)
+            self.assertIs(Rational(2, 3) * 0, Rational(0, 1) + 0)
+
+            third = Rational(1, 6) * 2
+            self.assertIs(third, Rational(2, 3) / 2)
+            # значения вне границы не интернируются
+            self.assertIsNot(Rational(11, 2) * 1, Rational(11, 2) * 1)
+
+            # таблица ограничена: 1/3 вытесняется после двух новых значений
+            Rational(1, 5) * 1
+            Rational(1, 7) * 1
+            self.assertIsNot(third, Rational(1, 6) * 2)
+            # закреплённые значения не вытесняются
+            self.assertIs(half, Rational(1, 2) * 1)
+
+            info = Rational.interning_info()
+            self.assertEqual(info["maxsize"], 2)
+            self.assertGreater(info["hits"], 0)
+        finally:
+            Rational.disable_interning()
+        self.assertIsNone(Rational.interning_info())
+        self.assertIsNot(Rational(1, 2) * 1, Rational(1, 2) * 1)
+
+    def test_precision_cap(self):
+        with Rational.precision_cap(max_denominator=1000) as policy:
+            self.assertEqual(Rational(314159, 100000), Rational(355, 113))
+            x = Rational(1, 1)
+            # метод Ньютона для sqrt(2): без ограничения знаменатель удваивается на каждом шаге
+            for _ in range(10):
+                x = (x + Rational(2, 1) / x) / 2
+                self.assertLessEqual(x.denominator, 1000)
+            self.assertLess(abs(float(x) - 2 ** 0.5), 1e-5)
+            self.assertEqual(Rational(1, 7) + Rational(1, 3), Rational(10, 21))
+            self.assertGreater(policy.roundings, 0)
+            self.assertGreater(policy.error_bound, 0)
+            self.assertLessEqual(policy.max_error, policy.error_bound)
+        self.assertIsNone(Rational.precision_info())
+        self.assertEqual(Rational(1, 1001).denominator, 1001)
+
+        Rational.enable_precision_cap(max_bits=8)
+        try:
+            r = Rational(1, 3) * Rational(1, 127)
+            self.assertLessEqual(r.denominator.bit_length(), 8)
+            info = Rational.precision_info()
+            self.assertEqual(info["max_denominator"], 255)
+            self.assertEqual(info["roundings"], 1)
+            self.assertLessEqual(abs(float(r) - 1 / 381), info["error_bound"])
+        finally:
+            Rational.disable_precision_cap()
+        with self.assertRaises(ValueError):
+            Rational.enable_precision_cap()
+        with self.assertRaises(ValueError):
+            Rational.enable_precision_cap(max_bits=4, max_denominator=10)
+
+    def test_sum(self):
+        terms = [Rational(1, k) for k in range(1, 200)] + [3, Rational(-7, 12)]
+        expected = Rational(0, 1)
+        for term in terms:
+            expected = expected + term
+        self.assertEqual(Rational.sum(terms), expected)
+        self.assertEqual(Rational.sum(iter(terms), start=Rational(1, 2)), expected + Rational(1, 2))
+        self.assertEqual(Rational.sum([]), 0)
+
+    def test_accumulator(self):
+        from rational import RationalAccumulator
+        accumulator = RationalAccumulator(Rational(1, 3))
+        accumulator += Rational(1, 6)
+        accumulator -= 2
+        accumulator.add(Rational(5, 4)).sub(Rational(1, 12))
+        self.assertEqual(accumulator, Rational(-1, 3))
+        value = accumulator.value()
+        self.assertEqual((value.numerator, value.denominator), (-1, 3))
+        with self.assertRaises(TypeError):
+            accumulator.add(0.5)
+
+    def test_from_float_exact(self):
+        r = Rational.from_float(0.1)
+        self.assertEqual((r.numerator, r.denominator), (3602879701896397, 36028797018963968))
+        self.assertEqual(float(r), 0.1)
+        r = Rational.from_float(-2.5)
+        self.assertEqual((r.numerator, r.denominator), (-5, 2))
+        with self.assertRaises(OverflowError):
+            Rational.from_float(float("inf"))
+
+    def test_from_float_max_denominator(self):
+        r = Rational.from_float(0.1, max_denominator=1000)
+        self.assertEqual((r.numerator, r.denominator), (1, 10))
+        r = Rational.from_float(3.141592653589793, max_denominator=100)
+        self.assertEqual((r.numerator, r.denominator), (311, 99))
+
+    def test_from_floats(self):
+        from array import array
+        values = [0.5, -0.25, 0.1, 3.0]
+        expected = [Rational.from_float(value) for value in values]
+        self.assertEqual(Rational.from_floats(values), expected)
+        self.assertEqual(Rational.from_floats(array('d', values)), expected)
+        self.assertEqual(Rational.from_floats(memoryview(array('d', values))), expected)
+        try:
+            import numpy
+        except ImportError:
+            return
+        self.assertEqual(Rational.from_floats(numpy.array(values)), expected)
+
+    def test_parse(self):
+        cases = {
+            "5": Rational(5, 1), " -7 ": Rational(-7, 1), "0.25": Rational(1, 4), "-1.5e-3": Rational(-3, 2000),
+            ".5": Rational(1, 2), "5.": Rational(5, 1), "1e3": Rational(1000, 1), "0.1": Rational(1, 10),
+            "3/4": Rational(3, 4), "-1 / 2": Rational(-1, 2), "1/-2": Rational(-1, 2), "0.5/3": Rational(1, 6),
+            "Rational(2, -6)": Rational(-1, 3), "Rational number: 2 / 4": Rational(1, 2),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(Rational.parse(text), expected)
+        value = Rational(-22, 7)
+        self.assertEqual(Rational.parse(repr(value)), value)
+        self.assertEqual(Rational.parse(value.print_fraction()), value)
+        self.assertEqual(Rational.parse("1e-10000"), Rational(1, 10 ** 10000))
+        for text in ("", "abc", "1/", "--1", "1.2.3", "1/0", "1e-10001", "1/2.5e99999999"):
+            with self.assertRaises(ValueError):
+                Rational.parse(text)
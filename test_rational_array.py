@@ -0,0 +1,77 @@
+import unittest
+from rational import Rational
+
+try:
+    import numpy
+    from rational_array import RationalArray
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestRationalArray(unittest.TestCase):
+    def setUp(self):
+        self.values = [Rational(1, 2), Rational(-3, 4), Rational(5, 6), Rational(7, 1), Rational(0, 1)]
+        self.others = [Rational(2, 3), Rational(4, 5), Rational(-1, 6), Rational(1, 7), Rational(9, 2)]
+
+    def test_round_trip(self):
+        array = RationalArray(self.values)
+        self.assertTrue(array.is_int64)
+        self.assertEqual(array.to_list(), self.values)
+        self.assertEqual(array[1], Rational(-3, 4))
+        self.assertEqual(array[1:3].to_list(), self.values[1:3])
+
+    def test_from_columns(self):
+        array = RationalArray.from_columns([2, 6, -4], [4, -9, 2])
+        self.assertEqual(array.to_list(), [Rational(1, 2), Rational(-2, 3), Rational(-2, 1)])
+        with self.assertRaises(ValueError):
+            RationalArray.from_columns([1], [0])
+
+    def test_elementwise(self):
+        a, b = RationalArray(self.values), RationalArray(self.others)
+        for op in (lambda x, y: x + y, lambda x, y: x - y, lambda x, y: x * y, lambda x, y: x / y):
+            self.assertEqual(op(a, b).to_list(), [op(x, y) for x, y in zip(self.values, self.others)])
+        self.assertEqual((a * 3).to_list(), [x * 3 for x in self.values])
+        self.assertEqual((a + Rational(1, 3)).to_list(), [x + Rational(1, 3) for x in self.values])
+        self.assertEqual((a ** 3).to_list(), [x ** 3 for x in self.values])
+        self.assertEqual((b ** -2).to_list(), [x ** -2 for x in self.others])
+        with self.assertRaises(ZeroDivisionError):
+            b / a
+
+    def test_overflow_promotion(self):
+        big = Rational(2 ** 62 - 1, 3)
+        a = RationalArray([big, Rational(1, 2)])
+        self.assertTrue(a.is_int64)
+        result = a * a
+        self.assertFalse(result.is_int64)
+        self.assertEqual(result.to_list(), [big * big, Rational(1, 4)])
+
+        result = a + RationalArray([Rational(1, 5), Rational(1, 3)])
+        self.assertEqual(result.to_list(), [big + Rational(1, 5), Rational(5, 6)])
+
+        # после сокращения значения снова помещаются в int64
+        back = result - RationalArray([big, 0])
+        self.assertTrue(back.is_int64)
+        self.assertEqual(back.to_list(), [Rational(1, 5), Rational(5, 6)])
+
+        huge = RationalArray([Rational(10 ** 30, 7)])
+        self.assertFalse(huge.is_int64)
+        self.assertEqual((huge / huge).to_list(), [Rational(1, 1)])
+
+    def test_reductions(self):
+        a, b = RationalArray(self.values), RationalArray(self.others)
+        expected_sum = Rational(0, 1)
+        expected_dot = Rational(0, 1)
+        for x, y in zip(self.values, self.others):
+            expected_sum = expected_sum + x
+            expected_dot = expected_dot + x * y
+        self.assertEqual(a.sum(), expected_sum)
+        self.assertEqual(a.dot(b), expected_dot)
+        self.assertEqual(b.prod(), Rational(2, 3) * Rational(4, 5) * Rational(-1, 6) * Rational(1, 7) * Rational(9, 2))
+        self.assertEqual(RationalArray().sum(), Rational(0, 1))
+
+        terms = RationalArray([Rational(1, k) for k in range(1, 60)])
+        expected = Rational(0, 1)
+        for k in range(1, 60):
+            expected = expected + Rational(1, k)
+        self.assertEqual(terms.sum(), expected)
@@ -0,0 +1,67 @@
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from rational import Rational
+from complex import Complex
+from service import ComputeClient, ComputeServer
+
+
+@unittest.skipIf(not hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+class TestService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "compute.sock")
+
+    async def asyncTearDown(self):
+        self.directory.cleanup()
+
+    async def test_operations(self):
+        a = [Rational(1, 3), Complex(Rational(1, 2), -2), Rational(-5, 7)]
+        b = [Complex(0, 1), Rational(3, 4), Complex(1.5, 0.25, backend="float")]
+        async with ComputeServer(path=self.path, workers=1) as server:
+            async with await ComputeClient.connect(path=server.address) as client:
+                self.assertEqual(await client.sum(a), Complex(Rational(1, 2) + Rational(1, 3) - Rational(5, 7), -2))
+                self.assertEqual(await client.prod([Rational(2, 3), Rational(9, 4)]), Rational(3, 2))
+                self.assertEqual(await client.dot([Rational(1, 2), Rational(1, 3)], [Rational(4, 1), Rational(3, 1)]),
+                                 Rational(3, 1))
+                self.assertEqual(await client.call("add", a, b), [Complex(Rational(1, 3), 1), Complex(Rational(5, 4), -2),
+                                                                   Complex(1.5 - 5 / 7, 0.25, backend="float")])
+                self.assertEqual(await client.call("div", [Rational(1, 1)], [Complex(0, 2)]), [Complex(0, Rational(-1, 2))])
+                self.assertEqual(await client.call("inverse", [Rational(-3, 5)]), [Rational(-5, 3)])
+                with self.assertRaises(ZeroDivisionError):
+                    await client.call("div", [Rational(1, 1)], [Rational(0, 1)])
+                # ошибка не разрывает соединение
+                self.assertEqual(await client.sum([]), Rational(0, 1))
+                with self.assertRaises(ValueError):
+                    await client.call("add", [Rational(1, 1)], [])
+
+    async def test_tcp(self):
+        async with ComputeServer(executor=ThreadPoolExecutor(1)) as server:
+            host, port = server.address
+            async with await ComputeClient.connect(host=host, port=port) as client:
+                self.assertEqual(await client.call("mul", [Complex(1, 1)], [Complex(1, -1)]), [Complex(2, 0)])
+
+    async def test_coalescing_and_backpressure(self):
+        values = [[Rational(k, k + 1), Complex(k, 1)] for k in range(40)]
+        async with ComputeServer(path=self.path, executor=ThreadPoolExecutor(1), max_pending=4,
+                                 coalesce_delay=0.05) as server:
+            async with await ComputeClient.connect(path=server.address) as client:
+                results = await asyncio.gather(*(client.sum(v) for v in values + values))
+            self.assertEqual(results, [v[1] + v[0] for v in values + values])
+            self.assertEqual(server.stats["requests"], 80)
+            self.assertLess(server.stats["batches"], 80)
+
+    async def test_deduplication(self):
+        async with ComputeServer(path=self.path, executor=ThreadPoolExecutor(1), coalesce_delay=0.05) as server:
+            async with await ComputeClient.connect(path=server.address) as client:
+                results = await asyncio.gather(*(client.prod([Rational(2, 3)] * 50) for _ in range(10)))
+            self.assertEqual(results, [Rational(2 ** 50, 3 ** 50)] * 10)
+            self.assertEqual(server.stats["deduplicated"], 9)
+            self.assertEqual(server.stats["batches"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()